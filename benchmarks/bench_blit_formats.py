@@ -0,0 +1,71 @@
+"""
+Blit throughput benchmark for cached art.
+
+Builds the renderer's and components' cached surfaces twice: once before a
+display mode is set (as created, SRCALPHA and unconverted) and once after,
+when ui.surfaces converts them to the display format and RLE-accelerates
+static art. Reports blits per second for each and the speedup.
+
+Run from the repository root (add SDL_VIDEODRIVER=dummy to run headless):
+    python -m benchmarks.bench_blit_formats
+"""
+import argparse
+import time
+import pygame
+from snake_game.core.config import SCREEN_WIDTH, SCREEN_HEIGHT, GREEN
+from ui.components import Button, Panel
+from ui.renderer import SnakeRenderer
+from ui.text_cache import TextCache
+
+
+def build_assets():
+    """ Cached surfaces the game blits every frame, by name. """
+    renderer = SnakeRenderer(SCREEN_WIDTH, SCREEN_HEIGHT)
+    button = Button(0, 0, 200, 60, "Single Player")
+    panel = Panel(0, 0, 500, 450)
+    return {
+        'background': renderer.background,
+        'snake segment': renderer._get_or_create_snake_segment_surface(GREEN, "body"),
+        'food frame': renderer.food_pulse_frames["food"][0][1],
+        'button': button._get_surfaces()['normal'],
+        'panel': panel._get_surface(),
+        'text': TextCache().render("Score: 1234", 28, (220, 220, 255), bold=True),
+    }
+
+
+def blits_per_second(screen, surface, blits):
+    width = max(1, screen.get_width() - surface.get_width())
+    height = max(1, screen.get_height() - surface.get_height())
+    sequence = [(surface, ((i * 37) % width, (i * 53) % height)) for i in range(blits)]
+    screen.blits(sequence, doreturn=False) # Warm up
+    start = time.perf_counter()
+    screen.blits(sequence, doreturn=False)
+    return blits / (time.perf_counter() - start)
+
+
+def run(blits):
+    pygame.init()
+    unconverted = build_assets() # No display yet: surfaces stay as created
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    converted = build_assets()
+
+    print(f"{'asset':<14} {'size':>9} {'before/s':>10} {'after/s':>10} {'speedup':>7}")
+    for name, surface in unconverted.items():
+        # Large surfaces get fewer blits so every row takes similar time
+        count = max(20, blits * 400 // (surface.get_width() * surface.get_height()))
+        before = blits_per_second(screen, surface, count)
+        after = blits_per_second(screen, converted[name], count)
+        size = f"{surface.get_width()}x{surface.get_height()}"
+        print(f"{name:<14} {size:>9} {before:>10.0f} {after:>10.0f} {after / before:>6.1f}x")
+    pygame.quit()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark blits of unconverted against display-format surfaces.")
+    parser.add_argument("--blits", type=int, default=20000, help="Blits of a 20x20 surface per measurement")
+    args = parser.parse_args(argv)
+    run(args.blits)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""
+Compression benchmark for full-state snapshots.
+
+Compares raw pickled snapshots with zlib at several levels, with and without the
+preset dictionary, reporting bytes on the wire and encode/decode CPU time.
+
+Run from the repository root:
+    python -m benchmarks.bench_compression
+"""
+import argparse
+import pickle
+import random
+import time
+import zlib
+from snake_game.core.config import SCREEN_WIDTH, SCREEN_HEIGHT, GRID_SIZE
+from snake_game.core.game import Game
+from snake_game.core.network import COMPRESSION_DICTIONARY, PICKLE_PROTOCOL, encode_message, decode_body, HEADER_LENGTH
+
+
+def make_snapshot(players, length, seed=0):
+    """
+    Build a snapshot with `players` snakes of `length` segments each, laid out as
+    random walks over the board like snakes in a long-running match.
+    """
+    rng = random.Random(seed)
+    player_ids = [f"player{i + 1}" for i in range(players)]
+    game = Game(SCREEN_WIDTH, SCREEN_HEIGHT, player_ids=player_ids, local_player_id=None,
+                is_server=True, server_instance=None, client_instance=None)
+    columns, rows = SCREEN_WIDTH // GRID_SIZE, SCREEN_HEIGHT // GRID_SIZE
+    for snake in game.snakes.values():
+        x, y = rng.randrange(columns), rng.randrange(rows)
+        body = []
+        for _ in range(length):
+            body.append((x * GRID_SIZE, y * GRID_SIZE))
+            dx, dy = rng.choice(((0, -1), (0, 1), (-1, 0), (1, 0)))
+            x, y = (x + dx) % columns, (y + dy) % rows
+        snake.body = body
+    return game._get_serializable_game_state()
+
+
+def time_call(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return result, (time.perf_counter() - start) / repeat
+
+
+def run(repeat):
+    print(f"{'players':>7} {'length':>6} {'codec':<12} {'bytes':>8} {'ratio':>6} {'encode us':>10} {'decode us':>10}")
+    for players in (2, 4):
+        for length in (10, 100, 500, 2000):
+            snapshot = make_snapshot(players, length)
+            raw = pickle.dumps(snapshot, protocol=PICKLE_PROTOCOL)
+            rows = [('raw', len(raw),
+                     time_call(lambda: pickle.dumps(snapshot, protocol=PICKLE_PROTOCOL), repeat)[1],
+                     time_call(lambda: pickle.loads(raw), repeat)[1])]
+            for level in (1, 6, 9):
+                for zdict in (None, COMPRESSION_DICTIONARY):
+                    def compress():
+                        compressor = zlib.compressobj(level, zdict=zdict) if zdict else zlib.compressobj(level)
+                        return compressor.compress(pickle.dumps(snapshot, protocol=PICKLE_PROTOCOL)) + compressor.flush()
+
+                    def decompress():
+                        decompressor = zlib.decompressobj(zdict=zdict) if zdict else zlib.decompressobj()
+                        return pickle.loads(decompressor.decompress(packed) + decompressor.flush())
+
+                    packed, encode_time = time_call(compress, repeat)
+                    _, decode_time = time_call(decompress, repeat)
+                    rows.append((f"zlib-{level}{'+dict' if zdict else ''}", len(packed), encode_time, decode_time))
+
+            frame = encode_message(snapshot)
+            _, decode_time = time_call(lambda: decode_body(frame[:HEADER_LENGTH], frame[HEADER_LENGTH:]), repeat)
+            rows.append(('framing', len(frame) - HEADER_LENGTH,
+                         time_call(lambda: encode_message(snapshot), repeat)[1], decode_time))
+
+            for codec, size, encode_time, decode_time in rows:
+                print(f"{players:>7} {length:>6} {codec:<12} {size:>8} {size / len(raw):>6.2f} "
+                      f"{encode_time * 1e6:>10.1f} {decode_time * 1e6:>10.1f}")
+            print()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark snapshot compression.")
+    parser.add_argument("--repeat", type=int, default=200, help="Iterations per measurement")
+    args = parser.parse_args(argv)
+    run(args.repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""
+Dirty-rectangle rendering benchmark.
+
+Renders a moving snake of several lengths at 60 frames per second of game time
+(several frames per simulation tick) and compares CPU per frame for a full
+redraw with pygame.display.flip() against dirty-rect rendering with
+pygame.display.update(rects), with and without tick interpolation.
+
+Run from the repository root (add SDL_VIDEODRIVER=dummy to run headless):
+    python -m benchmarks.bench_dirty_rects
+"""
+import argparse
+import random
+import time
+import pygame
+from snake_game.core.config import SCREEN_WIDTH, SCREEN_HEIGHT, GRID_SIZE, FPS
+from snake_game.core.game import Game
+from ui.renderer import SnakeRenderer
+
+FRAMES_PER_TICK = 60 // FPS
+
+
+def make_path(length, seed=0):
+    """ Random walk over the board for the snake's head to follow. """
+    rng = random.Random(seed)
+    columns, rows = SCREEN_WIDTH // GRID_SIZE, SCREEN_HEIGHT // GRID_SIZE
+    x, y = rng.randrange(columns), rng.randrange(rows)
+    dx, dy = 1, 0
+    path = []
+    for _ in range(length):
+        path.append((x * GRID_SIZE, y * GRID_SIZE))
+        if rng.random() < 0.2:
+            dx, dy = rng.choice(((dy, dx), (-dy, -dx))) # Turn left or right, never back
+        x, y = (x + dx) % columns, (y + dy) % rows
+    return path
+
+
+def run_frames(screen, renderer, game, path, length, ticks, interpolate, dirty):
+    """
+    Returns:
+        tuple: (seconds per frame, average fraction of the screen pushed)
+    """
+    snake = game.snakes[game.local_player_id]
+    renderer.interpolation_enabled = interpolate
+    renderer.invalidate()
+    screen_area = SCREEN_WIDTH * SCREEN_HEIGHT
+    pushed = 0.0
+    frames = 0
+    start = time.perf_counter()
+    for tick in range(ticks):
+        game.previous_bodies = {game.local_player_id: list(snake.body)}
+        snake.body = list(reversed(path[tick + 1:tick + 1 + length]))
+        for frame in range(FRAMES_PER_TICK):
+            alpha = (frame + 1) / FRAMES_PER_TICK
+            if dirty:
+                rects = renderer.render_game_dirty(screen, game, alpha)
+                pygame.display.update(rects)
+                pushed += sum(rect.width * rect.height for rect in rects) / screen_area
+            else:
+                renderer.render_game(screen, game, alpha)
+                pygame.display.flip()
+                pushed += 1.0
+            frames += 1
+    return (time.perf_counter() - start) / frames, pushed / frames
+
+
+def run(ticks):
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    renderer = SnakeRenderer(SCREEN_WIDTH, SCREEN_HEIGHT)
+    game = Game(SCREEN_WIDTH, SCREEN_HEIGHT, player_ids=["player1"], local_player_id="player1")
+
+    print(f"{'length':>6} {'interp':>6} {'mode':<6} {'us/frame':>9} {'pushed':>7} {'speedup':>7}")
+    for length in (10, 100, 500, 1000):
+        path = make_path(length + ticks + 1)
+        for interpolate in (False, True):
+            full_time, _ = run_frames(screen, renderer, game, path, length, ticks, interpolate, dirty=False)
+            dirty_time, pushed = run_frames(screen, renderer, game, path, length, ticks, interpolate, dirty=True)
+            print(f"{length:>6} {'on' if interpolate else 'off':>6} {'full':<6} {full_time * 1e6:>9.1f} {1.0:>7.0%}")
+            print(f"{length:>6} {'on' if interpolate else 'off':>6} {'dirty':<6} {dirty_time * 1e6:>9.1f} "
+                  f"{pushed:>7.1%} {full_time / dirty_time:>6.1f}x")
+        print()
+    pygame.quit()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark dirty-rect rendering against full redraws.")
+    parser.add_argument("--ticks", type=int, default=50, help="Simulation ticks rendered per measurement")
+    args = parser.parse_args(argv)
+    run(args.ticks)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""
+Snake segment drawing benchmark.
+
+Draws snakes totalling up to 10,000 segments, each moving one cell per frame,
+and compares one Surface.blit() call per segment against render_snakes(): a
+single Surface.blits() call over each snake's cached sprite list, updated from
+its head and tail changes. Interpolated frames are timed too; their segment
+positions change every frame, so their sprite list is built per frame. Times
+are per frame, with the share of a 16 ms frame budget.
+
+Run from the repository root (add SDL_VIDEODRIVER=dummy to run headless):
+    python -m benchmarks.bench_segment_blits
+"""
+import argparse
+import time
+import pygame
+from snake_game.core.config import SCREEN_WIDTH, SCREEN_HEIGHT, GRID_SIZE
+from snake_game.core.snake import Snake
+from ui.renderer import SnakeRenderer
+
+FRAME_BUDGET = 1 / 60
+COLORS = [(0, 200, 0), (0, 120, 255), (255, 200, 0), (200, 0, 200)]
+
+
+def make_snakes(segments, players=4):
+    """ Snakes of segments // players each, zig-zagging over the board. """
+    columns = SCREEN_WIDTH // GRID_SIZE
+    rows = SCREEN_HEIGHT // GRID_SIZE
+    snakes = {}
+    for p in range(players):
+        snake = Snake(0, 0, f"player{p + 1}", COLORS[p % len(COLORS)])
+        cells = range(p, p + segments // players)
+        snake.body = [((i % columns) * GRID_SIZE, ((i // columns) % rows) * GRID_SIZE) for i in cells]
+        snakes[snake.player_id] = snake
+    return snakes
+
+
+def time_frames(snakes, draw, frames):
+    start = time.perf_counter()
+    for _ in range(frames):
+        for snake in snakes.values():
+            snake.move() # A tick every frame, the worst case for the cached sprites
+        draw()
+    return (time.perf_counter() - start) / frames
+
+
+def run(frames):
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    renderer = SnakeRenderer(SCREEN_WIDTH, SCREEN_HEIGHT)
+
+    print(f"{'segments':>8} {'per-blit ms':>11} {'blits() ms':>10} {'speedup':>7} {'budget':>6} "
+          f"{'interp ms':>9} {'budget':>6}")
+    for segments in (100, 1000, 10000):
+        snakes = make_snakes(segments)
+
+        def per_segment():
+            for snake in snakes.values():
+                for _, segment_surface, segment_pos in renderer._segment_sprites(snake.color, snake.body):
+                    screen.blit(segment_surface, segment_pos)
+
+        def batched():
+            renderer.render_snakes(screen, snakes)
+
+        def interpolated():
+            previous_bodies = {player_id: snake.body[1:] + snake.body[-1:] for player_id, snake in snakes.items()}
+            renderer.render_snakes(screen, snakes, 0.5, previous_bodies)
+
+        per_blit = time_frames(snakes, per_segment, frames)
+        batch = time_frames(snakes, batched, frames)
+        interp = time_frames(snakes, interpolated, frames)
+        print(f"{segments:>8} {per_blit * 1e3:>11.2f} {batch * 1e3:>10.2f} {per_blit / batch:>6.1f}x "
+              f"{batch / FRAME_BUDGET:>6.0%} {interp * 1e3:>9.2f} {interp / FRAME_BUDGET:>6.0%}")
+    pygame.quit()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark per-segment blits against cached Surface.blits() sequences.")
+    parser.add_argument("--frames", type=int, default=100, help="Frames drawn per measurement")
+    args = parser.parse_args(argv)
+    run(args.frames)
+
+
+if __name__ == '__main__':
+    main()
@@ -3,8 +3,14 @@ import sys
 import time
 import logging
 from snake_game.core.game import Game
-from snake_game.core.config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, GREEN, UP, DOWN, LEFT, RIGHT
+from snake_game.core.config import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, FPS, GREEN, UP, DOWN, LEFT, RIGHT, SESSION_GRACE_PERIOD, DIRTY_RECT_RENDERING,
+    ADAPTIVE_QUALITY,
+)
 from snake_game.core.network import Server, Client # Network imports
+from snake_game.core.jitter_buffer import JitterBuffer
+from snake_game.core.session import SessionManager
+from ui.frame_budget import FrameBudget
 from ui.renderer import SnakeRenderer
 from ui.screens import MenuScreen, GameScreen, ScreenManager
 
@@ -14,6 +20,11 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 # Global variables for network instances and game state
 server_instance = None
 client_instance = None
+snapshot_buffer = None # JitterBuffer for server snapshots when playing as a client
+host_sessions = None # SessionManager letting a dropped client resume when hosting
+reconnect_deadline = None # While set, the client is trying to resume its session until this time
+next_reconnect_attempt = 0.0
+RECONNECT_INTERVAL = 1.0 # Seconds between reconnection attempts
 game_instance = None # This will hold the current Game object
 game_mode = "menu" # 'menu', 'single', 'host', 'client'
 selected_classic_mode = {"mode": "normal"} # Keep classic mode selection separate
@@ -25,8 +36,8 @@ def main():
     Main entry point for the Snake Game
     """
     global server_instance, client_instance, game_instance, game_mode
-    global selected_classic_mode, classic_gps_value
-    global game_accumulator # Make game_accumulator global for access in callbacks
+    global selected_classic_mode, classic_gps_value, snapshot_buffer
+    global host_sessions, reconnect_deadline, next_reconnect_attempt
 
     pygame.init()
     pygame.display.set_caption("SNEKS: Multiplayer Edition")
@@ -82,12 +93,15 @@ def main():
         common_game_start_actions()
 
     def host_game():
-        global server_instance, game_instance, game_mode
+        global server_instance, game_instance, game_mode, host_sessions
         logging.info("Starting to Host Game...")
         game_mode = "host"
         host_ip = "0.0.0.0"
         port = 5555
-        server_instance = Server(host_ip, port, max_clients=1) # Max 1 client for 2 players total
+        # One player, plus room for a reconnecting client while its old connection times out
+        server_instance = Server(host_ip, port, max_clients=2, coalesce_writes=True)
+        host_sessions = SessionManager()
+        server_instance.set_message_handler("resume", handle_resume)
         
         player1_id = "player1" # Host
         # Player IDs will be updated once client connects, or assume fixed for now
@@ -108,8 +122,30 @@ def main():
         common_game_start_actions()
         logging.info(f"Server listening on {host_ip}:{port}")
 
+    def handle_resume(client_net_id, message):
+        """ Host: give a reconnecting client its snake back and catch it up. """
+        session = host_sessions.resume(message.get("token"), client_net_id)
+        if session is None or session["player_id"] not in game_instance.snakes:
+            server_instance.send_to_client(client_net_id, {"type": "resume_rejected", "reason": "session expired"})
+            return
+        if session["previous_client_id"] != client_net_id:
+            server_instance.drop_client(session["previous_client_id"], "replaced by resumed session")
+        game_instance.unfreeze_player(session["player_id"])
+        resume_state = game_instance.get_resume_state(message.get("tick"))
+        resume_state.update(player_id=session["player_id"], session_token=message["token"])
+        server_instance.send_to_client(client_net_id, resume_state)
+        logging.info(f"Server: {client_net_id} resumed {session['player_id']}")
+
+    def try_reconnect():
+        """ Client: one attempt to reconnect and resume the session. """
+        global next_reconnect_attempt
+        next_reconnect_attempt = time.time() + RECONNECT_INTERVAL
+        if client_instance.reconnect():
+            last_state = game_instance.last_server_state
+            client_instance.resume(last_state.get("tick") if last_state else None)
+
     def join_game():
-        global client_instance, game_instance, game_mode
+        global client_instance, game_instance, game_mode, snapshot_buffer
         logging.info("Attempting to Join Game...")
         game_mode = "client"
         # TODO: Add UI to input server IP
@@ -120,7 +156,7 @@ def main():
         server_host_ip = menu_screen.ip_address_str if menu_screen else "localhost"
         logging.info(f"Attempting to Join Game at IP: {server_host_ip}")
 
-        client_instance = Client(server_host_ip, port)
+        client_instance = Client(server_host_ip, port, coalesce_writes=True)
         
         current_game_screen = screen_manager.screens.get("game")
         if current_game_screen: # Set status on GameScreen if it exists
@@ -142,6 +178,7 @@ def main():
                 server_instance=None,
                 client_instance=client_instance,
             )
+            snapshot_buffer = JitterBuffer(1.0 / FPS)
             common_game_start_actions()
             # Update GameScreen's game instance if it was created before game_instance was ready
             if screen_manager.screens.get("game"):
@@ -156,7 +193,8 @@ def main():
 
 
     def return_to_menu():
-        global game_instance, game_mode, server_instance, client_instance
+        global game_instance, game_mode, server_instance, client_instance, snapshot_buffer
+        global host_sessions, reconnect_deadline
         
         current_game_screen = screen_manager.screens.get("game")
         if current_game_screen:
@@ -166,9 +204,12 @@ def main():
         if game_mode == "host" and server_instance:
             server_instance.close()
             server_instance = None
+            host_sessions = None
         elif game_mode == "client" and client_instance:
             client_instance.close()
             client_instance = None
+            snapshot_buffer = None
+            reconnect_deadline = None
         
         game_instance = None # Clear game instance
         game_mode = "menu"
@@ -204,9 +245,11 @@ def main():
     screen_manager.set_current_screen("menu")
 
     last_time = time.time()
-    # game_accumulator is now global
+    last_rendered_screen = None # Screen drawn last frame; a different one needs a full redraw
+    frame_budget = FrameBudget()
 
     while True:
+        frame_start = time.perf_counter()
         current_time = time.time()
         dt = current_time - last_time
         last_time = current_time
@@ -219,6 +262,8 @@ def main():
                 if client_instance: client_instance.close()
                 pygame.quit()
                 sys.exit()
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                last_rendered_screen = None # Window contents were lost
             
             # Pass relevant events to screen manager for button clicks etc.
             # Input handling for game actions (like snake movement) should be inside GameScreen
@@ -235,21 +280,29 @@ def main():
                 # This logic needs to be robust for more players or dynamic assignment.
                 if "player2" not in game_instance.player_ids: # Assuming player1 is host
                     new_player_id = "player2"
-                    game_instance.player_ids.append(new_player_id)
-                    # Initialize snake for new player on server
-                    # Make sure this matches client-side expectation if client also auto-creates
-                    start_x = (SCREEN_WIDTH // 2 + 1 * 3 * GRID_SIZE) // GRID_SIZE * GRID_SIZE 
-                    start_y = (SCREEN_HEIGHT // 2) // GRID_SIZE * GRID_SIZE
-                    game_instance.snakes[new_player_id] = game_instance.snakes.get(new_player_id) or \
-                        type(game_instance.snakes[game_instance.local_player_id])(start_x, start_y, new_player_id) # Create snake if not exist
+                    game_instance.add_player(new_player_id)
                     
                     logging.info(f"Server: Assigned {new_player_id} to {client_net_id}. Total players: {game_instance.player_ids}")
-                    # Server might need to send an initial full state or player assignment message here.
-                    # For now, the regular broadcast from game_instance.update() will handle it.
+                    token = host_sessions.create(client_net_id, new_player_id)
+                    server_instance.send_to_client(client_net_id, {
+                        "type": "welcome",
+                        "player_id": new_player_id,
+                        "player_ids": list(game_instance.player_ids),
+                        "session_token": token,
+                    })
                 else:
-                    logging.warning("Server: Max players reached or player2 already exists. Ignoring new connection.")
+                    # Either a returning player, which will send a resume, or one too many
+                    logging.info("Server: player2 already exists. Waiting for a resume from the new connection.")
+            for client_net_id in server_instance.pop_disconnected():
+                session = host_sessions.disconnect(client_net_id)
+                if session:
+                    game_instance.freeze_player(session["player_id"])
+                    logging.info(f"Server: {client_net_id} dropped. Keeping its snake for {SESSION_GRACE_PERIOD:.0f}s.")
+            for session in host_sessions.expire():
+                logging.info(f"Server: Session for {session['player_id']} expired.")
+                game_instance.remove_player(session["player_id"])
             # Server's game_instance.update() handles receiving inputs and broadcasting state
-            if game_instance and not game_instance.player_ids L: # if player_ids only has host
+            if game_instance and len(game_instance.player_ids) <= 1: # if player_ids only has host
                  if screen_manager.screens.get("game"):
                     screen_manager.screens.get("game").set_status_message("Waiting for player to join...")
             elif game_instance and len(game_instance.player_ids) > 1:
@@ -259,15 +312,37 @@ def main():
         elif game_mode == "client" and client_instance and game_instance:
             current_game_screen = screen_manager.screens.get("game")
             if client_instance.connected:
+                client_instance.poll_clock_sync()
+                # Drain everything that arrived this frame; snapshots are applied once per tick
                 server_data = client_instance.receive_data()
-                if server_data is False: 
+                while server_data is not None and server_data is not False:
+                    message_type = server_data.get("type") if isinstance(server_data, dict) else None
+                    if message_type == "resume_state":
+                        # Caught up in one go; buffered snapshots from before the drop are stale
+                        snapshot_buffer.clear()
+                        if not game_instance.apply_resume_state(server_data):
+                            client_instance.resume(None) # Ask for a full snapshot instead
+                        else:
+                            reconnect_deadline = None
+                            if current_game_screen: current_game_screen.set_status_message("")
+                    elif message_type == "resume_rejected":
+                        reconnect_deadline = None
+                        client_instance.close()
+                    elif message_type is None:
+                        snapshot_buffer.push(server_data)
+                    server_data = client_instance.receive_data()
+                if server_data is False and client_instance.session_token:
+                    logging.warning("Client: Connection lost. Trying to resume the session...")
+                    if current_game_screen: current_game_screen.set_status_message("Connection lost. Reconnecting...")
+                    reconnect_deadline = time.time() + SESSION_GRACE_PERIOD
+                    next_reconnect_attempt = 0.0
+                elif server_data is False:
                     logging.error("Client: Disconnected from server or error receiving data.")
                     if current_game_screen: current_game_screen.set_status_message("Disconnected from server.")
                     return_to_menu() 
-                elif server_data is not None:
-                    game_instance.update_from_server(server_data)
-                    if current_game_screen and current_game_screen.status_message == "Connected! Waiting for game state...":
-                         current_game_screen.set_status_message("") # Clear after first state update
+            elif reconnect_deadline and time.time() < reconnect_deadline:
+                if time.time() >= next_reconnect_attempt:
+                    try_reconnect()
             else: 
                 logging.info("Client: Not connected. Attempting to return to menu.")
                 if current_game_screen: current_game_screen.set_status_message("Connection lost.")
@@ -283,16 +358,43 @@ def main():
                 game_step = 1.0 / gps
                 game_accumulator += dt
                 while game_accumulator >= game_step:
+                    if game_mode == "client" and snapshot_buffer and game_instance:
+                        server_data = snapshot_buffer.pop()
+                        if server_data is not None:
+                            game_instance.update_from_server(server_data)
+                            if current_screen_obj.status_message == "Connected! Waiting for game state...":
+                                current_screen_obj.set_status_message("") # Clear after first state update
                     current_screen_obj.update(game_step * 1000.0) 
                     game_accumulator -= game_step
+                # Render the remainder of the tick as interpolated motion
+                current_screen_obj.set_interpolation_alpha(game_accumulator / game_step)
             else: 
                 current_screen_obj.update(dt * 1000.0) 
         
+        # Inputs queued during this frame go out together
+        if game_mode == "client" and client_instance and client_instance.connected:
+            client_instance.flush()
+        elif game_mode == "host" and server_instance:
+            server_instance.flush() # Heartbeats keep flowing after game over
+
         # --- Rendering ---
-        screen.fill((20, 20, 40))
-        if current_screen_obj:
-            current_screen_obj.render(screen)
-        pygame.display.flip()
+        render_start = time.perf_counter()
+        render_dirty = getattr(current_screen_obj, "render_dirty", None)
+        if DIRTY_RECT_RENDERING and render_dirty:
+            if current_screen_obj is not last_rendered_screen:
+                current_screen_obj.invalidate()
+            pygame.display.update(render_dirty(screen))
+        else:
+            screen.fill((20, 20, 40))
+            if current_screen_obj:
+                current_screen_obj.render(screen)
+            pygame.display.flip()
+        last_rendered_screen = current_screen_obj
+
+        # Shed optional effects before slow frames start delaying game ticks
+        render_end = time.perf_counter()
+        if ADAPTIVE_QUALITY and frame_budget.record(render_start - frame_start, render_end - render_start):
+            screen_manager.set_quality(frame_budget.quality)
 
         clock.tick(60) # Maintain 60 FPS rendering
 
@@ -12,6 +12,10 @@ GRID_SIZE = 20
 # Game speed (frames per second)
 FPS = 10
 
+# Rendering
+DIRTY_RECT_RENDERING = True # Push only changed screen areas during gameplay
+ADAPTIVE_QUALITY = True # Turn off optional effects while frames take longer than their budget
+
 # Colors (RGB)
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
@@ -33,3 +37,7 @@ PURPLE = (128, 0, 128)
 CYAN = (0, 255, 255)
 
 PLAYER_COLORS = [GREEN, BLUE, YELLOW, ORANGE, PURPLE, CYAN]
+
+# Reconnection
+SESSION_GRACE_PERIOD = 10.0 # Seconds a disconnected player's snake waits for a resume
+RESUME_HISTORY_TICKS = int(SESSION_GRACE_PERIOD * FPS) # Per-tick deltas kept to catch up resumed clients
@@ -7,16 +7,19 @@ class Food:
     Food class representing the food that the snake eats
     """
 
-    def __init__(self, x, y):
+    def __init__(self, x, y, rng=None):
         """
         Initialize food at the given position
 
         Args:
             x: Initial x coordinate
             y: Initial y coordinate
+            rng: random.Random to draw positions from, for reproducible games
+                (defaults to the global random module)
         """
         self.x = x
         self.y = y
+        self.rng = rng or random
 
     def randomize_position(self, max_x, max_y, all_snake_bodies=None):
         """
@@ -41,8 +44,8 @@ class Food:
 
         while attempts < max_attempts:
             # Choose a random grid-aligned position
-            new_x = random.randint(0, grid_max_x) * GRID_SIZE
-            new_y = random.randint(0, grid_max_y) * GRID_SIZE
+            new_x = self.rng.randint(0, grid_max_x) * GRID_SIZE
+            new_y = self.rng.randint(0, grid_max_y) * GRID_SIZE
 
             # Check if position is free (not on any snake body)
             if (new_x, new_y) not in all_snake_bodies:
@@ -54,8 +57,8 @@ class Food:
 
         # If we couldn't find a free spot after max attempts
         # Just choose a random spot and hope for the best
-        self.x = random.randint(0, grid_max_x) * GRID_SIZE
-        self.y = random.randint(0, grid_max_y) * GRID_SIZE
+        self.x = self.rng.randint(0, grid_max_x) * GRID_SIZE
+        self.y = self.rng.randint(0, grid_max_y) * GRID_SIZE
 
     def reposition(self, all_snake_bodies):
         """
@@ -1,7 +1,12 @@
 from snake_game.core.snake import Snake
 from snake_game.core.food import Food
-from snake_game.core.config import GRID_SIZE, UP, DOWN, LEFT, RIGHT, PLAYER_COLORS # Added PLAYER_COLORS
+from snake_game.core.input_queue import InputQueue, is_valid_turn, MAX_QUEUED_INPUTS
+from snake_game.core.config import GRID_SIZE, FPS, UP, DOWN, LEFT, RIGHT, PLAYER_COLORS, RESUME_HISTORY_TICKS # Added PLAYER_COLORS
 import logging
+import random
+import time
+import zlib
+from collections import deque
 
 class Game:
     """
@@ -17,6 +22,9 @@ class Game:
         is_server=False,
         server_instance=None,
         client_instance=None,
+        seed=None,
+        lockstep=None,
+        tick_rate=FPS,
     ):
         """
         Initialize a new game with dimensions, player info, and network instances.
@@ -29,6 +37,9 @@ class Game:
             is_server: Boolean, True if this instance is the server
             server_instance: Server network object (if is_server)
             client_instance: Client network object (if not is_server)
+            seed: Seed for food placement; games with the same seed and inputs play out identically
+            lockstep: LockstepChannel when every peer simulates and only inputs are exchanged
+            tick_rate: Simulation ticks per second, reported to clients for clock sync
         """
         self.width = width
         self.height = height
@@ -37,11 +48,38 @@ class Game:
         self.is_server = is_server
         self.server_instance = server_instance
         self.client_instance = client_instance
+        self.lockstep = lockstep
+        self.tick_rate = tick_rate
+        self.rng = random.Random(seed) if seed is not None else None
 
         self.score = 0
         self.is_game_over = False
         self.snakes = {}
 
+        # Simulation tick counter. On the server this is the authoritative tick,
+        # on a client it counts locally predicted ticks.
+        self.tick = 0
+        # Server: {player_id: client tick the player's snake state corresponds to}
+        self.client_ticks = {}
+        # Server: {player_id: InputQueue}, turns applied one per tick in arrival order
+        self.input_queues = {}
+        # Server: players whose connection dropped; their snakes wait for a resume
+        self.frozen_players = set()
+        # Client: [(tick, direction)] inputs not yet acknowledged by the server
+        self.pending_inputs = []
+        self._input_sync_sent = False
+        # {player_id: body before the latest tick}, used to interpolate rendering
+        self.previous_bodies = {}
+        # Server: per-tick changes, so a resuming client can catch up from its last state
+        self.delta_history = deque(maxlen=RESUME_HISTORY_TICKS)
+        # Server: tick at which the history was last cleared, as states up to it may lack
+        # a snake added since (None if never cleared)
+        self.history_cleared_tick = None
+        # Client: last state received from the server, the base for applying deltas
+        self.last_server_state = None
+        # Client: whether update_from_server() ran since the last update()
+        self._state_received = False
+
         # Initialize snakes for each player
         for i, player_id in enumerate(self.player_ids):
             color = PLAYER_COLORS[i % len(PLAYER_COLORS)] # Assign color based on index
@@ -51,12 +89,76 @@ class Game:
             self.snakes[player_id] = Snake(start_x, start_y, player_id, color)
 
         # Initialize food at a random position, avoiding all snakes
-        self.food = Food(0, 0)
+        self.food = Food(0, 0, rng=self.rng)
         if self.is_server or not self.client_instance: # Server or single player initializes food
             self.food.randomize_position(
                 self.width, self.height, self._get_all_snake_bodies()
             )
 
+    def add_player(self, player_id):
+        """
+        Add a player to a running game with a fresh snake
+
+        Args:
+            player_id: ID of the joining player
+
+        Returns:
+            Snake: The player's snake
+        """
+        if player_id in self.snakes:
+            return self.snakes[player_id]
+        self._clear_delta_history() # Deltas cannot describe a new snake
+        if player_id not in self.player_ids:
+            self.player_ids.append(player_id)
+        i = self.player_ids.index(player_id)
+        color = PLAYER_COLORS[i % len(PLAYER_COLORS)]
+        start_x = (self.width // 2 + i * 3 * GRID_SIZE) // GRID_SIZE * GRID_SIZE
+        start_y = (self.height // 2) // GRID_SIZE * GRID_SIZE
+        self.snakes[player_id] = Snake(start_x, start_y, player_id, color)
+        return self.snakes[player_id]
+
+    def remove_player(self, player_id):
+        """
+        Remove a player and its snake from the game
+
+        Args:
+            player_id: ID of the leaving player
+        """
+        self.snakes.pop(player_id, None)
+        self._clear_delta_history()
+        self.frozen_players.discard(player_id)
+        self.input_queues.pop(player_id, None)
+        self.client_ticks.pop(player_id, None)
+        self.previous_bodies.pop(player_id, None)
+        if player_id in self.player_ids:
+            self.player_ids.remove(player_id)
+
+    def _clear_delta_history(self):
+        """ Forget the delta history when the set of snakes changes; resumes from before now need a snapshot. """
+        self.delta_history.clear()
+        self.history_cleared_tick = self.tick
+
+    def freeze_player(self, player_id):
+        """
+        Hold a disconnected player's snake in place: it neither moves nor collides
+        until unfreeze_player(), so it cannot die while its client reconnects.
+
+        Args:
+            player_id: ID of the disconnected player
+        """
+        if player_id in self.snakes:
+            self.frozen_players.add(player_id)
+            self.input_queues.pop(player_id, None) # Turns sent before the drop are stale
+
+    def unfreeze_player(self, player_id):
+        """
+        Let a resumed player's snake move again
+
+        Args:
+            player_id: ID of the player that resumed
+        """
+        self.frozen_players.discard(player_id)
+
     def _get_all_snake_bodies(self):
         self.food.randomize_position(
             self.width, self.height, self._get_all_snake_bodies()
@@ -74,14 +176,19 @@ class Game:
     def update(self):
         """
         Update the game state for one frame.
-        If server, runs simulation and broadcasts. If client, this is a lighter update (e.g., local animations).
+        If server, runs simulation and broadcasts. If client, predicts the local snake
+        ahead of the server using the same movement rules. In lockstep mode the
+        simulation advances only once every player's input for the next tick is in.
         """
-        if self.is_server:
+        if self.lockstep:
+            self._update_lockstep()
+        elif self.is_server:
             if self.is_game_over: # Server checks game over state
                 # Broadcast game over state one last time if it just happened
                 if hasattr(self, "_last_game_over_sent") and not self._last_game_over_sent:
                     game_state = self._get_serializable_game_state()
                     self.server_instance.broadcast_data(game_state)
+                    self.server_instance.flush()
                     self._last_game_over_sent = True
                 return
 
@@ -94,58 +201,280 @@ class Game:
                     # Let's assume player_id is sent in the packet.
                     input_player_id = data_packet.get('player_id')
                     direction = data_packet.get('direction')
-                    if input_player_id in self.snakes and direction:
-                        logging.info(f"Server received input from {input_player_id}: {direction}")
-                        self.snakes[input_player_id].change_direction(direction)
+                    input_tick = data_packet.get('tick')
+                    if input_player_id not in self.snakes:
+                        continue
+                    if direction:
+                        logging.debug(f"Server received input from {input_player_id}: {direction}")
+                        self._queue_input(input_player_id, direction, input_tick)
+                    elif input_tick is not None:
+                        # Tick sync only: the client's next move is number `input_tick`
+                        self._map_client_tick(input_player_id, input_tick)
             
             # Server: Execute game logic
             if not self.is_game_over: # Re-check, as client input processing might not set it
-                for player_id, snake in self.snakes.items():
-                    snake.move()
-
-                    # Check for wall collision
-                    head_x, head_y = snake.get_head_position()
-                    if (
-                        head_x < 0
-                        or head_x >= self.width
-                        or head_y < 0
-                        or head_y >= self.height
-                    ):
-                        self.is_game_over = True
-                        logging.info(f"Game Over: Snake {player_id} hit a wall.")
-                        break 
-
-                    # Check for self-collision
-                    if snake.check_self_collision():
-                        self.is_game_over = True
-                        logging.info(f"Game Over: Snake {player_id} collided with itself.")
-                        break
-                    
-                    # Check for collision with other snakes (optional, can be complex)
-                    # For now, not implementing snake-vs-snake collision that ends game
-
-                    # Check if snake has eaten food
-                    if head_x == self.food.x and head_y == self.food.y:
-                        self.score += 1
-                        snake.grow()
-                        self.food.randomize_position(
-                            self.width, self.height, self._get_all_snake_bodies()
-                        )
-                        # Break because only one snake can eat the food per frame
-                        break 
-                
-                if self.is_game_over: # if game ended in this loop
+                self._apply_queued_inputs()
+                self._simulate_tick()
+                self.server_instance.set_tick(self.tick, self.tick_rate)
+                if self.is_game_over: # if game ended in this tick
                      self._last_game_over_sent = False # Flag to send game over state
 
             # Server: Prepare and broadcast game state
             game_state = self._get_serializable_game_state()
             self.server_instance.broadcast_data(game_state)
+            # Everything queued for this tick goes out in one write per client
+            self.server_instance.flush()
+
+        elif not self.client_instance: # Single player runs the simulation locally
+            if not self.is_game_over:
+                self._simulate_tick()
 
-        else: # Client logic (minimal, relies on update_from_server)
+        else: # Client logic: authoritative state comes from update_from_server
             if self.is_game_over:
                 return
-            # Client specific updates can go here if any (e.g., local animations not tied to server state)
-            pass
+            if not self._input_sync_sent:
+                # Let the server map our tick numbers to its own before the first real input
+                self._send_input(None)
+                self._input_sync_sent = True
+            self.tick += 1
+            if not self._state_received:
+                # No snapshot this tick (jitter or rebuffering): remote snakes hold still
+                # instead of replaying their last slide
+                for player_id, snake in self.snakes.items():
+                    if player_id != self.local_player_id:
+                        self.previous_bodies[player_id] = list(snake.body)
+            self._state_received = False
+            local_snake = self.snakes.get(self.local_player_id)
+            if local_snake and not local_snake.is_dead:
+                for input_tick, direction in self.pending_inputs:
+                    if input_tick == self.tick and direction:
+                        local_snake.change_direction(direction)
+                # Remote snakes keep the positions recorded by update_from_server
+                self.previous_bodies[self.local_player_id] = list(local_snake.body)
+                self._predict_move(local_snake)
+
+    def _update_lockstep(self):
+        """ Lockstep: run the next tick with everyone's inputs, or wait for them. """
+        if self.is_game_over:
+            return
+        self.lockstep.poll()
+        inputs = self.lockstep.pop_tick(self.tick + 1)
+        if inputs is None:
+            return # Stall until the slowest peer's input arrives
+        for player_id in self.player_ids: # Same order on every peer
+            direction = inputs.get(player_id)
+            if direction and player_id in self.snakes:
+                self.snakes[player_id].change_direction(direction)
+        self._simulate_tick()
+        self.lockstep.send_next_input(self)
+
+    def get_checksum(self):
+        """
+        Fingerprint of the simulation state, compared between lockstep peers to detect desyncs
+
+        Returns:
+            int: CRC32 of snakes, food, score and tick
+        """
+        snakes = [(player_id, tuple(self.snakes[player_id].body), self.snakes[player_id].direction)
+                  for player_id in self.player_ids if player_id in self.snakes]
+        return zlib.crc32(repr((self.tick, snakes, self.food.x, self.food.y, self.score)).encode())
+
+    def _queue_input(self, player_id, direction, input_tick=None):
+        """
+        Server: queue a turn for the player's snake
+
+        Returns:
+            bool: False if the turn was a reversal/repeat, the queue was full or the
+                player is sending too fast
+        """
+        queue = self.input_queues.get(player_id)
+        if queue is None:
+            queue = self.input_queues[player_id] = InputQueue(self.snakes[player_id].direction)
+        accepted = queue.push(direction, input_tick)
+        if not accepted:
+            logging.debug(f"Dropped input {direction} from {player_id}: {queue.rejected}")
+        return accepted
+
+    def _map_client_tick(self, player_id, input_tick):
+        """ Record that the player's next move is the client's move number `input_tick`. """
+        self.client_ticks[player_id] = max(self.client_ticks.get(player_id, input_tick - 1), input_tick - 1)
+
+    def _apply_queued_inputs(self):
+        """ Server: apply at most one queued turn per snake before this tick's move. """
+        for player_id, queue in self.input_queues.items():
+            queued = queue.pop()
+            if queued is None or player_id not in self.snakes:
+                continue
+            input_tick, direction = queued
+            if input_tick is not None:
+                # The client applied this turn before its move number `input_tick`,
+                # and the server applies it before the coming move
+                self._map_client_tick(player_id, input_tick)
+            self.snakes[player_id].change_direction(direction)
+
+    def _simulate_tick(self):
+        """
+        Advance the authoritative simulation by one tick: move every snake and
+        resolve wall, self and food collisions.
+        """
+        self.tick += 1
+        self._remember_positions()
+        food_eaten = False
+        for player_id, snake in self.snakes.items():
+            if player_id in self.frozen_players:
+                continue
+            snake.move()
+
+            # Check for wall collision
+            head_x, head_y = snake.get_head_position()
+            if self._is_out_of_bounds(head_x, head_y):
+                self.is_game_over = True
+                logging.info(f"Game Over: Snake {player_id} hit a wall.")
+                break
+
+            # Check for self-collision
+            if snake.check_self_collision():
+                self.is_game_over = True
+                logging.info(f"Game Over: Snake {player_id} collided with itself.")
+                break
+
+            # Check for collision with other snakes (optional, can be complex)
+            # For now, not implementing snake-vs-snake collision that ends game
+
+            # Check if snake has eaten food. Only one snake can eat the food per tick,
+            # but every snake still moves.
+            if not food_eaten and head_x == self.food.x and head_y == self.food.y:
+                self.score += 1
+                snake.grow()
+                self.food.randomize_position(
+                    self.width, self.height, self._get_all_snake_bodies()
+                )
+                food_eaten = True
+
+        # Every player's snake has now made one more move on behalf of its client
+        for player_id in self.client_ticks:
+            if player_id not in self.frozen_players:
+                self.client_ticks[player_id] += 1
+
+        if self.is_server:
+            self._record_delta()
+
+    def _record_delta(self):
+        """ Record what this tick changed, relative to the positions remembered before it. """
+        snakes_delta = {}
+        for player_id, snake in self.snakes.items():
+            previous_body = self.previous_bodies.get(player_id)
+            moved = previous_body is None or snake.body[0] != previous_body[0]
+            snakes_delta[player_id] = {
+                'head': snake.body[0] if moved else None,
+                'length': len(snake.body),
+                'direction': snake.direction,
+                'is_dead': snake.is_dead,
+                'growing': snake.growing,
+            }
+        self.delta_history.append({
+            'tick': self.tick,
+            'snakes': snakes_delta,
+            'food_pos': (self.food.x, self.food.y),
+            'score': self.score,
+            'is_game_over': self.is_game_over,
+        })
+
+    def get_resume_state(self, since_tick=None):
+        """
+        Server: state for a client resuming after a dropped connection. If the client's
+        last state is still covered by the delta history, only the changes since then
+        are sent; otherwise a full snapshot.
+
+        Args:
+            since_tick: Tick of the last state the client applied (None if unknown)
+
+        Returns:
+            dict: 'resume_state' message with either 'deltas' or 'snapshot'
+        """
+        state = {'type': 'resume_state'}
+        covered = (
+            since_tick is not None
+            and since_tick <= self.tick
+            and (self.history_cleared_tick is None or since_tick > self.history_cleared_tick)
+            and (since_tick == self.tick or (self.delta_history and self.delta_history[0]['tick'] <= since_tick + 1))
+        )
+        if covered:
+            state['base_tick'] = since_tick
+            state['deltas'] = [delta for delta in self.delta_history if delta['tick'] > since_tick]
+            state['tick'] = self.tick
+            state['player_ids'] = list(self.player_ids)
+            state['input_acks'] = dict(self.client_ticks)
+            state['server_time'] = time.time()
+        else:
+            state['snapshot'] = self._get_serializable_game_state()
+        return state
+
+    def apply_resume_state(self, resume_state):
+        """
+        Client: catch up from a 'resume_state' message
+
+        Args:
+            resume_state: Message produced by get_resume_state() on the server
+
+        Returns:
+            bool: False if the deltas do not start from our last server state
+        """
+        if 'snapshot' in resume_state:
+            self.update_from_server(resume_state['snapshot'])
+            return True
+
+        base = self.last_server_state
+        if base is None or base.get('tick') != resume_state['base_tick']:
+            logging.warning("Resume deltas do not match the last received state.")
+            return False
+
+        snakes = {player_id: dict(data, body=list(data['body'])) for player_id, data in base['snakes'].items()}
+        game_state = dict(base, snakes=snakes)
+        for delta in resume_state['deltas']:
+            for player_id, snake_delta in delta['snakes'].items():
+                if player_id not in snakes:
+                    logging.warning(f"Resume delta for unknown snake {player_id}.")
+                    return False
+                body = snakes[player_id]['body']
+                if snake_delta['head'] is not None:
+                    body.insert(0, snake_delta['head'])
+                del body[snake_delta['length']:]
+                snakes[player_id].update(
+                    direction=snake_delta['direction'],
+                    is_dead=snake_delta['is_dead'],
+                    growing=snake_delta['growing'],
+                )
+            game_state.update(food_pos=delta['food_pos'], score=delta['score'], is_game_over=delta['is_game_over'])
+
+        game_state.update(
+            tick=resume_state['tick'],
+            player_ids=resume_state['player_ids'],
+            input_acks=resume_state['input_acks'],
+            server_time=resume_state['server_time'],
+        )
+        self.update_from_server(game_state)
+        return True
+
+    def _remember_positions(self):
+        """ Keep each snake's body from before this tick for render interpolation. """
+        self.previous_bodies = {
+            player_id: list(snake.body) for player_id, snake in self.snakes.items()
+        }
+
+    def _is_out_of_bounds(self, x, y):
+        """ Check whether a position lies outside the playing field. """
+        return x < 0 or x >= self.width or y < 0 or y >= self.height
+
+    def _predict_move(self, snake):
+        """
+        Client-side prediction of one move, using the same movement and growth rules
+        as the server. Collisions are left to the server to decide.
+        """
+        snake.move()
+        head_x, head_y = snake.get_head_position()
+        if head_x == self.food.x and head_y == self.food.y:
+            snake.grow()
 
     def _get_serializable_game_state(self):
         """ Helper to create a dictionary of the current game state for network transfer. """
@@ -156,6 +485,7 @@ class Game:
                 'direction': snake_obj.direction,
                 'is_dead': snake_obj.is_dead,
                 'color': snake_obj.color, # Include color
+                'growing': snake_obj.growing, # Needed by clients replaying predicted moves
                 # 'player_id': snake_obj.player_id
             }
         return {
@@ -164,6 +494,9 @@ class Game:
             'score': self.score,
             'is_game_over': self.is_game_over,
             'player_ids': self.player_ids, # Useful for client to know all players
+            'tick': self.tick,
+            'server_time': time.time(), # Lets clients tell how stale the snapshot is
+            'input_acks': dict(self.client_ticks), # Client tick each player's snake reflects
         }
 
     def update_from_server(self, game_state):
@@ -174,16 +507,28 @@ class Game:
             return
 
         logging.debug(f"Client {self.local_player_id} received game state: {game_state}")
+        self.last_server_state = game_state
+        self._state_received = True
+        self._remember_positions()
+
+        # The server owns the player list; players may join or leave mid-game
+        if 'player_ids' in game_state:
+            self.player_ids = list(game_state['player_ids'])
+            for player_id in list(self.snakes):
+                if player_id not in self.player_ids:
+                    del self.snakes[player_id]
         
         # Update snakes
         received_snakes_data = game_state.get('snakes', {})
         for player_id, data in received_snakes_data.items():
             if player_id in self.snakes:
                 # Update existing snake
-                self.snakes[player_id].body = data['body']
+                # Copied so local moves never alter last_server_state
+                self.snakes[player_id].body = list(data['body'])
                 self.snakes[player_id].direction = data['direction']
                 self.snakes[player_id].is_dead = data['is_dead']
                 self.snakes[player_id].color = data.get('color', PLAYER_COLORS[0]) # Get color, default if missing
+                self.snakes[player_id].growing = data.get('growing', False)
             else:
                 # If a snake appears mid-game (e.g. late join)
                 # Create it with data from server. Client needs to know all player_ids from start.
@@ -191,7 +536,7 @@ class Game:
                     logging.info(f"Client: Creating new snake {player_id} from server data.")
                     color = data.get('color', PLAYER_COLORS[self.player_ids.index(player_id) % len(PLAYER_COLORS)])
                     self.snakes[player_id] = Snake(data['body'][0][0], data['body'][0][1], player_id, color)
-                    self.snakes[player_id].body = data['body']
+                    self.snakes[player_id].body = list(data['body'])
                     self.snakes[player_id].direction = data['direction']
                     self.snakes[player_id].is_dead = data['is_dead']
                 else:
@@ -201,6 +546,11 @@ class Game:
         food_pos = game_state.get('food_pos')
         if food_pos:
             self.food.x, self.food.y = food_pos
+
+        # Reconcile the locally predicted snake with the authoritative state
+        ack_tick = game_state.get('input_acks', {}).get(self.local_player_id)
+        if ack_tick is not None:
+            self._reconcile_local_snake(ack_tick)
         
         # Update score and game_over status
         self.score = game_state.get('score', self.score)
@@ -209,6 +559,50 @@ class Game:
             logging.info(f"Client {self.local_player_id}: Game Over message received from server.")
 
 
+    def _reconcile_local_snake(self, ack_tick):
+        """
+        Replay unacknowledged inputs on top of the server's state for the local snake.
+
+        Args:
+            ack_tick: Client tick the server's state of the local snake corresponds to
+        """
+        # Inputs up to the acknowledged tick are already reflected in the server state
+        self.pending_inputs = [
+            (tick, direction) for tick, direction in self.pending_inputs if tick > ack_tick
+        ]
+        local_snake = self.snakes.get(self.local_player_id)
+        if not local_snake or local_snake.is_dead:
+            return
+
+        # Copy the body so prediction never mutates the received state
+        local_snake.body = list(local_snake.body)
+        for tick in range(ack_tick + 1, self.tick + 1):
+            for input_tick, direction in self.pending_inputs:
+                if input_tick == tick and direction:
+                    local_snake.change_direction(direction)
+            self._predict_move(local_snake)
+
+        # Inputs for the upcoming tick have already been applied on the previous state
+        for input_tick, direction in self.pending_inputs:
+            if input_tick > self.tick and direction:
+                local_snake.change_direction(direction)
+
+    def _send_input(self, direction, input_tick=None):
+        """
+        Send a direction input tagged with the tick it applies to and keep it until
+        the server acknowledges it. A direction of None only syncs tick numbers.
+        """
+        if input_tick is None:
+            input_tick = self.tick + 1 # Applied before our next predicted move
+        self.pending_inputs.append((input_tick, direction))
+        action = {
+            'type': 'input',
+            'player_id': self.local_player_id,
+            'direction': direction,
+            'tick': input_tick,
+        }
+        self.client_instance.send_data(action)
+
     def handle_input(self, player_id, direction):
         """
         Handle direction input. Server acts directly, client sends to server.
@@ -216,17 +610,29 @@ class Game:
         if self.is_game_over: # No input if game is over
             return
 
-        if self.is_server:
+        if self.lockstep:
+            if player_id == self.local_player_id:
+                self.lockstep.queue_input(direction) # Applied by every peer on the same tick
+        elif self.is_server:
             if player_id in self.snakes:
                 logging.info(f"Server handling input for {player_id}: {direction}")
-                self.snakes[player_id].change_direction(direction)
+                # The host's own turns queue like everyone else's, one per tick
+                self._queue_input(player_id, direction)
             else:
                 logging.warning(f"Server received input for unknown player_id: {player_id}")
         else: # Client
-            if player_id == self.local_player_id and self.client_instance:
+            if player_id == self.local_player_id and self.client_instance and player_id in self.snakes:
+                # Mirror the server's queue: one turn per tick, no reversals of the turn before
+                turns = [(tick, queued) for tick, queued in self.pending_inputs if queued and tick > self.tick]
+                last_direction = turns[-1][1] if turns else self.snakes[player_id].direction
+                input_tick = turns[-1][0] + 1 if turns else self.tick + 1
+                if not is_valid_turn(last_direction, direction) or input_tick > self.tick + MAX_QUEUED_INPUTS:
+                    return
                 logging.info(f"Client {self.local_player_id} sending input: {direction}")
-                action = {'type': 'input', 'player_id': player_id, 'direction': direction}
-                self.client_instance.send_data(action)
+                self._send_input(direction, input_tick)
+                # Predict the turn locally so it shows on the next frame
+                if input_tick == self.tick + 1:
+                    self.snakes[player_id].change_direction(direction)
             # else: client should not handle input for other players
 
     def reset(self):
@@ -238,6 +644,13 @@ class Game:
         logging.info(f"Game reset called. is_server: {self.is_server}")
         self.score = 0
         self.is_game_over = False
+        self.client_ticks = {}
+        self.input_queues = {}
+        # Frozen players keep their seat through the reset: their respawned snakes stay
+        # frozen until their clients resume instead of driving off unsteered
+        self.pending_inputs = []
+        self.previous_bodies = {}
+        self._clear_delta_history()
         # Server should re-initialize snakes and food, then broadcast
         # Client should ideally wait for server's new state
         
@@ -253,7 +666,7 @@ class Game:
             self.snakes[player_id] = Snake(start_x, start_y, player_id, color)
 
         if self.is_server or not self.client_instance: # Server or single player mode
-            self.food = Food(0, 0)
+            self.food = Food(0, 0, rng=self.rng)
             self.food.randomize_position(
                 self.width, self.height, self._get_all_snake_bodies()
             )
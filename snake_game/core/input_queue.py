@@ -0,0 +1,95 @@
+import time
+from collections import deque
+from snake_game.core.config import FPS, UP, DOWN, LEFT, RIGHT
+
+OPPOSITE_DIRECTIONS = {UP: DOWN, DOWN: UP, LEFT: RIGHT, RIGHT: LEFT}
+MAX_QUEUED_INPUTS = 3       # Turns a player can have lined up for upcoming ticks
+INPUT_RATE_LIMIT = 2 * FPS  # Sustained input messages per second per player
+INPUT_BURST = 6             # Input messages a player may send at once
+
+
+def is_valid_turn(current_direction, new_direction):
+    """
+    Check whether a direction change does something: not a repeat of the current
+    direction and not a 180-degree reversal into the snake's own neck.
+    """
+    return new_direction != current_direction and OPPOSITE_DIRECTIONS.get(new_direction) != current_direction
+
+
+class InputQueue:
+    """
+    Ordered direction changes for one player, applied one per tick.
+
+    Turns are validated against the direction the snake will have after the
+    turns already queued, so UP then LEFT inside one tick becomes two turns on
+    consecutive ticks instead of the second overwriting the first. A token bucket
+    limits how many input messages a player can push.
+    """
+
+    def __init__(self, direction, max_length=MAX_QUEUED_INPUTS, rate=INPUT_RATE_LIMIT, burst=INPUT_BURST):
+        """
+        Args:
+            direction: The snake's current direction
+            max_length: Maximum number of queued turns
+            rate: Sustained input messages per second
+            burst: Bucket size, input messages accepted back to back
+        """
+        self.queue = deque()
+        self.max_length = max_length
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.last_refill = None
+        self.last_direction = direction # Direction after every queued turn
+        self.rejected = {'rate_limited': 0, 'invalid': 0, 'full': 0}
+
+    def __len__(self):
+        return len(self.queue)
+
+    def _take_token(self, now):
+        if self.last_refill is not None:
+            self.tokens = min(self.burst, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+    def push(self, direction, tick=None, now=None):
+        """
+        Queue a turn
+
+        Args:
+            direction: New direction
+            tick: Client tick the input was made for, if the client sent one
+            now: Current time (defaults to time.monotonic())
+
+        Returns:
+            bool: True if the turn was queued
+        """
+        if not self._take_token(now if now is not None else time.monotonic()):
+            self.rejected['rate_limited'] += 1
+            return False
+        if not is_valid_turn(self.last_direction, direction):
+            self.rejected['invalid'] += 1
+            return False
+        if len(self.queue) >= self.max_length:
+            self.rejected['full'] += 1
+            return False
+        self.queue.append((tick, direction))
+        self.last_direction = direction
+        return True
+
+    def pop(self):
+        """
+        Get the turn to apply this tick
+
+        Returns:
+            tuple: (tick, direction), or None if no turn is queued
+        """
+        return self.queue.popleft() if self.queue else None
+
+    def reset(self, direction):
+        """ Drop queued turns, e.g. when the snake is respawned. """
+        self.queue.clear()
+        self.last_direction = direction
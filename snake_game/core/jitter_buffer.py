@@ -0,0 +1,93 @@
+import time
+
+
+class JitterBuffer:
+    """
+    Adaptive playout buffer for server snapshots on network clients.
+
+    Snapshots are released at most one per simulation tick. The number of snapshots
+    held back grows with the measured arrival jitter, so uneven network delivery
+    turns into a small constant delay instead of visible stutter.
+    """
+
+    def __init__(self, tick_interval, min_depth=1, max_depth=6):
+        """
+        Initialize the jitter buffer
+
+        Args:
+            tick_interval: Expected time between server snapshots, in seconds
+            min_depth: Minimum number of snapshots to hold before playout
+            max_depth: Maximum number of snapshots to hold before dropping old ones
+        """
+        self.tick_interval = tick_interval
+        self.min_depth = min_depth
+        self.max_depth = max_depth
+        self.snapshots = []
+        self.jitter = 0.0  # Smoothed inter-arrival deviation, in seconds
+        self.last_arrival = None
+        self.playing = False
+        self.dropped = 0
+
+    @property
+    def target_depth(self):
+        """
+        Number of snapshots to keep buffered for the current jitter estimate
+
+        Returns:
+            int: Target buffer depth
+        """
+        # Hold back roughly two jitter deviations' worth of ticks on top of the current one
+        depth = 1 + int(2 * self.jitter / self.tick_interval) if self.tick_interval else 1
+        return max(self.min_depth, min(self.max_depth, depth))
+
+    def push(self, snapshot, arrival_time=None):
+        """
+        Add a received snapshot and update the jitter estimate
+
+        Args:
+            snapshot: Game state received from the server
+            arrival_time: Time the snapshot arrived (defaults to now)
+        """
+        if arrival_time is None:
+            arrival_time = time.time()
+        if self.last_arrival is not None:
+            deviation = abs((arrival_time - self.last_arrival) - self.tick_interval)
+            # Same smoothing as the RTP interarrival jitter estimate
+            self.jitter += (deviation - self.jitter) / 16.0
+        self.last_arrival = arrival_time
+        self.snapshots.append(snapshot)
+
+        # Too far behind: skip ahead rather than fall further behind the server
+        while len(self.snapshots) > self.max_depth:
+            self.snapshots.pop(0)
+            self.dropped += 1
+
+    def pop(self):
+        """
+        Get the next snapshot to apply for this tick
+
+        Returns:
+            The oldest buffered snapshot, or None if nothing should be applied yet
+        """
+        if not self.playing:
+            if len(self.snapshots) < self.target_depth:
+                return None  # Still filling up
+            self.playing = True
+
+        if not self.snapshots:
+            # Ran dry: rebuffer to the target depth before playing again
+            self.playing = False
+            return None
+
+        # Drain surplus snapshots gradually when jitter has dropped
+        if len(self.snapshots) > self.target_depth + 1:
+            self.snapshots.pop(0)
+            self.dropped += 1
+
+        return self.snapshots.pop(0)
+
+    def clear(self):
+        """Drop all buffered snapshots and restart buffering"""
+        self.snapshots.clear()
+        self.last_arrival = None
+        self.playing = False
@@ -0,0 +1,265 @@
+import argparse
+import logging
+import math
+import secrets
+import time
+from snake_game.core.game import Game
+from snake_game.core.network import Server
+from snake_game.core.config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+
+DEFAULT_INPUT_DELAY = 2  # Ticks between pressing a key and every peer applying it
+MAX_INPUT_DELAY = 10
+CHECKSUM_INTERVAL = 10   # Peers report a state checksum every this many ticks
+RTT_WAIT = 1.0           # Seconds to wait for peers' RTT estimates before picking the delay
+
+
+def recommended_input_delay(rtt, tick_rate=FPS):
+    """
+    Smallest input delay that hides a round trip through the server
+
+    Args:
+        rtt: Round-trip time to the server in seconds (None if unknown)
+        tick_rate: Simulation ticks per second
+
+    Returns:
+        int: Input delay in ticks
+    """
+    if rtt is None:
+        return DEFAULT_INPUT_DELAY
+    # An input must reach every peer before they simulate its tick: one round trip
+    # via the server, plus a tick of slack for the peer's own tick phase
+    return max(1, min(MAX_INPUT_DELAY, math.ceil(rtt * tick_rate) + 1))
+
+
+class LockstepChannel:
+    """
+    Client side of lockstep mode. Sends the local player's input for a future tick
+    once per simulated tick and collects the server's per-tick input bundles.
+    """
+
+    def __init__(self, client):
+        """
+        Args:
+            client: Connected Client
+        """
+        self.client = client
+        self.started = False
+        self.player_id = None
+        self.player_ids = []
+        self.seed = None
+        self.width = SCREEN_WIDTH # Board size, replaced by the server's at match start
+        self.height = SCREEN_HEIGHT
+        self.input_delay = DEFAULT_INPUT_DELAY
+        self.ticks = {} # {tick: {player_id: direction}} released by the server
+        self.pending_direction = None
+        self.next_input_tick = 1
+
+    def poll(self):
+        """ Read the match start and input bundles from the server. """
+        message = self.client.receive_data()
+        while message:
+            if isinstance(message, dict):
+                if message.get('type') == 'lockstep_start':
+                    self._start(message)
+                elif message.get('type') == 'lockstep_tick':
+                    self.ticks[message['tick']] = message['inputs']
+            message = self.client.receive_data()
+
+    def _start(self, message):
+        self.started = True
+        self.player_id = message['player_id']
+        self.player_ids = list(message['player_ids'])
+        self.seed = message['seed']
+        self.width = message['width']
+        self.height = message['height']
+        self.input_delay = message['input_delay']
+        # Nobody can have pressed anything for the first ticks yet
+        for tick in range(1, self.input_delay + 1):
+            self.client.send_data({'type': 'input', 'tick': tick, 'direction': None})
+        self.next_input_tick = self.input_delay + 1
+        self.client.flush()
+        logging.info(f"Lockstep match started as {self.player_id}, input delay {self.input_delay} ticks")
+
+    def create_game(self):
+        """
+        Create the local simulation once the match has started, on the server's board
+
+        Returns:
+            Game: Game driven by this channel
+        """
+        return Game(
+            self.width,
+            self.height,
+            player_ids=list(self.player_ids),
+            local_player_id=self.player_id,
+            is_server=False,
+            server_instance=None,
+            client_instance=None,
+            seed=self.seed,
+            lockstep=self,
+        )
+
+    def queue_input(self, direction):
+        """ Keep the latest direction to send with the next input. """
+        self.pending_direction = direction
+
+    def pop_tick(self, tick):
+        """
+        Returns:
+            dict: {player_id: direction} for the tick, or None if not all inputs are in yet
+        """
+        return self.ticks.pop(tick, None)
+
+    def send_next_input(self, game):
+        """ Send our input for the tick input_delay ticks ahead, after simulating a tick. """
+        message = {'type': 'input', 'tick': self.next_input_tick, 'direction': self.pending_direction}
+        if game.tick % CHECKSUM_INTERVAL == 0:
+            message['checksum'] = (game.tick, game.get_checksum())
+        self.client.send_data(message)
+        self.client.flush()
+        self.pending_direction = None
+        self.next_input_tick += 1
+
+
+class LockstepServer:
+    """
+    Relay for lockstep matches. The server runs no simulation: it collects each
+    player's input for a tick and releases the tick to everyone once all of them
+    are in. Traffic depends only on the number of players, not on the board.
+    """
+
+    def __init__(self, host, port, players=2, input_delay=None, width=SCREEN_WIDTH, height=SCREEN_HEIGHT):
+        """
+        Args:
+            host, port: Address to listen on
+            players: Number of players to wait for before starting
+            input_delay: Fixed input delay in ticks, or None to derive it from measured RTTs
+            width, height: Board dimensions sent to peers
+        """
+        self.server = Server(host, port, max_clients=players, coalesce_writes=True)
+        self.expected_players = players
+        self.input_delay = input_delay
+        self.width = width
+        self.height = height
+        self.players = {} # {client_id: player_id}
+        self.connected = set()
+        self.started = False
+        self.full_since = None # When the last expected player joined
+        self.inputs = {} # {tick: {player_id: direction}}
+        self.next_tick = 1 # Next tick to release
+        self.checksums = {} # {tick: {player_id: checksum}}
+        self.desyncs = 0
+
+    def start_match(self, seed=None):
+        """ Assign player ids and tell every peer to start the same simulation. """
+        if self.input_delay is None:
+            rtts = [self.server.get_clock_info(client_id)['rtt'] for client_id in self.players]
+            known = [rtt for rtt in rtts if rtt is not None]
+            self.input_delay = recommended_input_delay(max(known) if known else None)
+        seed = seed if seed is not None else secrets.randbits(32)
+        player_ids = list(self.players.values())
+        for client_id, player_id in self.players.items():
+            self.server.send_to_client(client_id, {
+                'type': 'lockstep_start',
+                'player_id': player_id,
+                'player_ids': player_ids,
+                'seed': seed,
+                'input_delay': self.input_delay,
+                'width': self.width,
+                'height': self.height,
+            })
+        self.started = True
+        logging.info(f"Lockstep match started: {player_ids}, seed {seed}, input delay {self.input_delay}")
+
+    def _rtts_known(self):
+        if self.input_delay is not None:
+            return True
+        return all(self.server.get_clock_info(client_id)['rtt'] is not None for client_id in self.players)
+
+    def _record_input(self, client_id, message):
+        player_id = self.players.get(client_id)
+        tick = message.get('tick')
+        if player_id is None or tick is None or tick < self.next_tick:
+            return # Unknown sender, or too late to change a released tick
+        self.inputs.setdefault(tick, {})[player_id] = message.get('direction')
+        if 'checksum' in message:
+            self._check_sync(player_id, *message['checksum'])
+
+    def _check_sync(self, player_id, tick, checksum):
+        reported = self.checksums.setdefault(tick, {})
+        reported[player_id] = checksum
+        if len(set(reported.values())) > 1:
+            self.desyncs += 1
+            logging.error(f"Lockstep desync at tick {tick}: {reported}")
+        if len(reported) == len(self.players):
+            del self.checksums[tick]
+
+    def _release_ready_ticks(self):
+        """ Broadcast every consecutive tick for which all connected players' inputs are in. """
+        active = [player_id for client_id, player_id in self.players.items() if client_id in self.connected]
+        while True:
+            tick_inputs = self.inputs.get(self.next_tick, {})
+            if any(player_id not in tick_inputs for player_id in active):
+                return
+            # Players who left keep going straight so the others are not stalled
+            bundle = {player_id: tick_inputs.get(player_id) for player_id in self.players.values()}
+            self.server.broadcast_data({'type': 'lockstep_tick', 'tick': self.next_tick, 'inputs': bundle})
+            self.inputs.pop(self.next_tick, None)
+            self.next_tick += 1
+
+    def poll(self):
+        """ Accept players until the match starts, then relay inputs. """
+        for client_id in self.server.accept_connections():
+            if self.started:
+                self.server.drop_client(client_id, "match already started")
+                continue
+            self.players[client_id] = f"player{len(self.players) + 1}"
+            self.connected.add(client_id)
+
+        for client_id, message in self.server.receive_data():
+            if isinstance(message, dict) and message.get('type') == 'input':
+                self._record_input(client_id, message)
+        for client_id in self.server.pop_disconnected():
+            self.connected.discard(client_id)
+            if not self.started:
+                self.players.pop(client_id, None)
+
+        if not self.started and len(self.players) == self.expected_players:
+            self.full_since = self.full_since or time.monotonic()
+            if self._rtts_known() or time.monotonic() - self.full_since >= RTT_WAIT:
+                self.start_match()
+        elif not self.started:
+            self.full_since = None
+        if self.started:
+            self._release_ready_ticks()
+        self.server.flush()
+
+    def serve_forever(self):
+        try:
+            while True:
+                self.poll()
+                time.sleep(0.001)
+        except KeyboardInterrupt:
+            logging.info("Lockstep server shutting down...")
+        finally:
+            self.close()
+
+    def close(self):
+        self.server.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Relay inputs for a lockstep Snake match.")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=5555)
+    parser.add_argument("--players", type=int, default=2)
+    parser.add_argument("--input-delay", type=int, default=None, help="Ticks (measured from RTT if omitted)")
+    args = parser.parse_args(argv)
+
+    lockstep_server = LockstepServer(args.host, args.port, players=args.players, input_delay=args.input_delay)
+    logging.info(f"Lockstep server listening on {args.host}:{args.port}, waiting for {args.players} players")
+    lockstep_server.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
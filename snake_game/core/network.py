@@ -1,23 +1,305 @@
 import socket
 import pickle
 import struct
+import zlib
 import logging
+import time
+from collections import deque
+from snake_game.core.config import FPS, GRID_SIZE, PLAYER_COLORS, UP, DOWN, LEFT, RIGHT
 
 # Configure basic logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 HEADER_LENGTH = 4  # 4 bytes for message length (unsigned int)
 
+# Compression
+COMPRESSED_FLAG = 0x80000000 # High bit of the length header marks a zlib-compressed body
+LENGTH_MASK = 0x7FFFFFFF
+COMPRESSION_THRESHOLD = 1024 # Bodies at least this many bytes are compressed
+COMPRESSION_LEVEL = 1        # Fastest level; preset dictionary does most of the work
+PICKLE_PROTOCOL = 4          # Fixed so both ends pickle the same bytes the dictionary was built from
+
+def _build_compression_dictionary():
+    """
+    Build the zlib preset dictionary from a pickled sample game state, so the first
+    snapshot on a connection already compresses as well as a warmed-up stream.
+    """
+    snakes = {}
+    for index, color in enumerate(PLAYER_COLORS[:4]):
+        x = (4 + index * 8) * GRID_SIZE
+        snakes[f"player{index + 1}"] = {
+            'body': [(x, y * GRID_SIZE) for y in range(10, 22)],
+            'direction': (UP, DOWN, LEFT, RIGHT)[index % 4],
+            'is_dead': False,
+            'color': color,
+            'growing': False,
+        }
+    sample_state = {
+        'snakes': snakes,
+        'food_pos': (20 * GRID_SIZE, 15 * GRID_SIZE),
+        'score': 0,
+        'is_game_over': False,
+        'player_ids': list(snakes),
+        'tick': 1000,
+        'server_time': 1700000000.0,
+        'input_acks': {player_id: 1000 for player_id in snakes},
+    }
+    return pickle.dumps(sample_state, protocol=PICKLE_PROTOCOL)
+
+COMPRESSION_DICTIONARY = _build_compression_dictionary()
+
+def compress_payload(data):
+    compressor = zlib.compressobj(COMPRESSION_LEVEL, zdict=COMPRESSION_DICTIONARY)
+    return compressor.compress(data) + compressor.flush()
+
+def decompress_payload(data, max_size=None):
+    """
+    Inflate a compressed body. With `max_size`, raises zlib.error instead of
+    inflating past it, so a small frame cannot expand into a huge allocation.
+    """
+    decompressor = zlib.decompressobj(zdict=COMPRESSION_DICTIONARY)
+    if max_size is None:
+        return decompressor.decompress(data) + decompressor.flush()
+    payload = decompressor.decompress(data, max_size + 1)
+    if len(payload) > max_size or decompressor.unconsumed_tail:
+        raise zlib.error(f"decompressed body exceeds {max_size} bytes")
+    return payload
+
+# Frame size limits and receive buffers
+MAX_FRAME_SIZE = 1 << 20           # Largest body accepted, checked before buffering it
+RECV_BUFFER_SIZE = 64 * 1024       # Size of pooled receive buffers; larger frames get their own
+MAX_POOLED_BUFFERS = 64            # Idle buffers kept for reuse
+MAX_SEND_QUEUE_BYTES = 4 * 1024 * 1024 # Unsent bytes a client may have before it is dropped
+
+# Clock synchronization
+CLOCK_SYNC_SAMPLES = 8          # Number of ping/pong samples kept for estimation
+CLOCK_SYNC_BURST_INTERVAL = 0.2 # Seconds between pings until the sample window is full
+CLOCK_SYNC_INTERVAL = 2.0       # Seconds between pings afterwards
+
+# Connection roles in join messages
+ROLE_PLAYER = 'player'
+ROLE_SPECTATOR = 'spectator'
+
+# Dead peer detection
+HEARTBEAT_INTERVAL = 1.0 # Seconds without sending anything before a heartbeat is sent
+IDLE_TIMEOUT = 10.0      # Seconds without hearing from a peer before it is considered gone
+KEEPALIVE_IDLE = 5       # TCP keepalive: seconds idle before the first probe
+KEEPALIVE_INTERVAL = 2   # Seconds between probes
+KEEPALIVE_COUNT = 3      # Unanswered probes before the kernel drops the connection
+
+# Write coalescing
+MAX_FRAMES_PER_WRITE = 1024 # Stay within IOV_MAX for a single sendmsg() call
+MAX_FRAMES_PER_READ = 256   # Default frames read from one client per receive_data(), so a flood cannot starve the rest
+HAS_SENDMSG = hasattr(socket.socket, 'sendmsg') # Not available on Windows
+
+def configure_socket(sock):
+    """
+    Disable Nagle's algorithm so small messages go out immediately.
+    Batching is done explicitly by the send queues instead.
+
+    Also enables TCP keepalive with short timings, so the kernel notices a peer
+    that vanished without closing the connection even when the game is idle.
+    """
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    except (OSError, AttributeError) as e:
+        logging.warning(f"Could not set TCP_NODELAY: {e}")
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        # Per-socket timings are not available everywhere (e.g. TCP_KEEPIDLE on older macOS)
+        for option, value in (('TCP_KEEPIDLE', KEEPALIVE_IDLE), ('TCP_KEEPINTVL', KEEPALIVE_INTERVAL),
+                              ('TCP_KEEPCNT', KEEPALIVE_COUNT)):
+            if hasattr(socket, option):
+                sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, option), value)
+    except OSError as e:
+        logging.warning(f"Could not configure TCP keepalive: {e}")
+
+class BufferPool:
+    """
+    Reusable fixed-size receive buffers shared by the connections of a server.
+
+    A connection only holds a buffer while a frame is partly received, so idle
+    connections cost nothing and a burst of large frames reuses the same few
+    allocations instead of building new bytes objects on every read.
+    """
+
+    def __init__(self, buffer_size=RECV_BUFFER_SIZE, max_free=MAX_POOLED_BUFFERS):
+        """
+        Args:
+            buffer_size: Capacity of pooled buffers
+            max_free: Idle buffers to keep; extra ones are left to the garbage collector
+        """
+        self.buffer_size = buffer_size
+        self.max_free = max_free
+        self.free = []
+        self.in_use = 0 # Bytes held by connections
+        self.allocations = 0
+        self.reuses = 0
+
+    def acquire(self, size):
+        """
+        Get a buffer of at least `size` bytes
+
+        Returns:
+            bytearray: A pooled buffer, or a dedicated one for frames larger than buffer_size
+        """
+        if size > self.buffer_size:
+            buffer = bytearray(size)
+            self.allocations += 1
+        elif self.free:
+            buffer = self.free.pop()
+            self.reuses += 1
+        else:
+            buffer = bytearray(self.buffer_size)
+            self.allocations += 1
+        self.in_use += len(buffer)
+        return buffer
+
+    def release(self, buffer):
+        self.in_use -= len(buffer)
+        if len(buffer) == self.buffer_size and len(self.free) < self.max_free:
+            self.free.append(buffer)
+
+    def reclaim(self, pending):
+        """ Return the buffer behind a receive buffer map entry, if it came from the pool. """
+        if isinstance(pending, memoryview):
+            storage = pending.obj
+            pending.release()
+            self.release(storage)
+
+    def get_stats(self):
+        return {
+            'in_use': self.in_use,
+            'free': len(self.free) * self.buffer_size,
+            'allocations': self.allocations,
+            'reuses': self.reuses,
+        }
+
+def held_bytes(pending):
+    """ Memory held by a receive buffer map entry. """
+    return len(pending.obj) if isinstance(pending, memoryview) else len(pending)
+
+def new_io_counters():
+    return {'syscalls': 0, 'bytes_sent': 0, 'messages_sent': 0}
+
+class ConnectionStats:
+    """
+    Traffic and timing counters for one connection. A connection's stats can
+    roll up into a parent, e.g. every client of a server into the server total.
+    """
+
+    RATE_WINDOW = 1.0 # Seconds between byte rate samples
+
+    def __init__(self, parent=None):
+        """
+        Args:
+            parent: ConnectionStats that also receives everything recorded here
+        """
+        self.parent = parent
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.messages_sent = 0
+        self.messages_received = 0
+        self.encode_time = 0.0 # Seconds spent pickling/compressing
+        self.encode_count = 0
+        self.decode_time = 0.0 # Seconds spent unpickling/decompressing
+        self.queue_depth = 0   # Frames left unwritten after the last flush
+        self.max_queue_depth = 0
+        self.rtt = None
+        self.last_snapshot_time = None # When the last game state arrived
+        self.send_rate = 0.0    # Bytes per second over the last rate window
+        self.receive_rate = 0.0
+        self._rate_mark = (time.monotonic(), 0, 0)
+
+    def record_encode(self, seconds):
+        self.encode_time += seconds
+        self.encode_count += 1
+        if self.parent:
+            self.parent.record_encode(seconds)
+
+    def record_sent(self, counters, queue_depth):
+        """ Record a flush: io counters of the write and frames still queued afterwards. """
+        self.bytes_sent += counters['bytes_sent']
+        self.messages_sent += counters['messages_sent']
+        self.queue_depth = queue_depth
+        self.max_queue_depth = max(self.max_queue_depth, queue_depth)
+        if self.parent:
+            self.parent.bytes_sent += counters['bytes_sent']
+            self.parent.messages_sent += counters['messages_sent']
+
+    def record_received(self, frame_length, decode_seconds):
+        self.bytes_received += frame_length
+        self.messages_received += 1
+        self.decode_time += decode_seconds
+        if self.parent:
+            self.parent.record_received(frame_length, decode_seconds)
+
+    def record_snapshot(self, now=None):
+        self.last_snapshot_time = now if now is not None else time.monotonic()
+
+    def _update_rates(self, now):
+        mark_time, mark_sent, mark_received = self._rate_mark
+        elapsed = now - mark_time
+        if elapsed >= self.RATE_WINDOW:
+            self.send_rate = (self.bytes_sent - mark_sent) / elapsed
+            self.receive_rate = (self.bytes_received - mark_received) / elapsed
+            self._rate_mark = (now, self.bytes_sent, self.bytes_received)
+
+    def as_dict(self, now=None):
+        """
+        Get the counters
+
+        Returns:
+            dict: Totals plus 'send_rate'/'receive_rate' (bytes/s), 'encode_ms'/'decode_ms'
+                (average per message), 'rtt_ms' and 'snapshot_age_ms' (None if unknown)
+        """
+        now = now if now is not None else time.monotonic()
+        self._update_rates(now)
+        return {
+            'bytes_sent': self.bytes_sent,
+            'bytes_received': self.bytes_received,
+            'messages_sent': self.messages_sent,
+            'messages_received': self.messages_received,
+            'send_rate': self.send_rate,
+            'receive_rate': self.receive_rate,
+            'encode_ms': self.encode_time * 1000.0 / self.encode_count if self.encode_count else 0.0,
+            'decode_ms': self.decode_time * 1000.0 / self.messages_received if self.messages_received else 0.0,
+            'queue_depth': self.queue_depth,
+            'max_queue_depth': self.max_queue_depth,
+            'rtt_ms': self.rtt * 1000.0 if self.rtt is not None else None,
+            'snapshot_age_ms': (now - self.last_snapshot_time) * 1000.0 if self.last_snapshot_time is not None else None,
+        }
+
+def encode_message(message, compress_threshold=COMPRESSION_THRESHOLD):
+    """
+    Pickles a message and prepends its length, producing a complete frame.
+    Bodies of at least `compress_threshold` bytes are zlib-compressed and flagged
+    in the header, unless that would not make them smaller. None disables compression.
+    """
+    pickled_data = pickle.dumps(message, protocol=PICKLE_PROTOCOL)
+    if compress_threshold is not None and len(pickled_data) >= compress_threshold:
+        compressed = compress_payload(pickled_data)
+        if len(compressed) < len(pickled_data):
+            return struct.pack('>I', len(compressed) | COMPRESSED_FLAG) + compressed
+    header = struct.pack('>I', len(pickled_data))
+    return header + pickled_data
+
+def decode_body(header, body, max_size=None):
+    """
+    Unpickles a frame body, decompressing it first if the header says so.
+    `max_size` bounds the decompressed size.
+    """
+    if struct.unpack('>I', header)[0] & COMPRESSED_FLAG:
+        body = decompress_payload(body, max_size)
+    return pickle.loads(body)
+
 def send_message(sock, message):
     """
     Pickles a message, prepends its length, and sends it.
     Returns True on success, False on failure.
     """
     try:
-        pickled_data = pickle.dumps(message)
-        message_length = len(pickled_data)
-        header = struct.pack('>I', message_length)
-        sock.sendall(header + pickled_data)
+        sock.sendall(encode_message(message))
         return True
     except socket.error as e:
         logging.error(f"Socket error while sending: {e} on {sock.getsockname() if sock.fileno() != -1 else 'closed socket'}")
@@ -26,7 +308,38 @@ def send_message(sock, message):
         logging.error(f"Error sending message: {e}")
         return False
 
-def receive_message(sock, recv_buffer_map, client_ident):
+def write_frames(sock, frames, counters):
+    """
+    Writes queued frames using one vectored write (sendmsg) per batch.
+    Frames that could not be written because the socket buffer is full stay at
+    the front of `frames`, partially written ones as a memoryview of the rest.
+    `counters` is an io counters dict updated with syscalls and bytes sent.
+    Raises socket.error if the connection failed.
+    """
+    while frames:
+        batch = frames[:MAX_FRAMES_PER_WRITE]
+        try:
+            if HAS_SENDMSG:
+                sent = sock.sendmsg(batch)
+            else:
+                sent = sock.send(b''.join(batch))
+        except BlockingIOError:
+            return # Socket buffer full, keep the rest for the next flush
+        counters['syscalls'] += 1
+        counters['bytes_sent'] += sent
+
+        written = 0
+        while written < len(batch) and sent >= len(batch[written]):
+            sent -= len(batch[written])
+            written += 1
+        counters['messages_sent'] += written
+        del frames[:written]
+        if sent:
+            frames[0] = memoryview(frames[0])[sent:]
+            return # Partial write means the socket buffer is full
+
+def receive_message(sock, recv_buffer_map, client_ident, raw=False, stats=None,
+                    max_frame_size=MAX_FRAME_SIZE, pool=None):
     """
     Receives a length-prefixed message from the socket.
     Manages a buffer for partial receives.
@@ -34,11 +347,14 @@ def receive_message(sock, recv_buffer_map, client_ident):
     or False if an error/disconnection occurs.
     `client_ident` is used for logging and buffer management.
     `recv_buffer_map` is a dictionary {client_ident: b''} to store buffer per client.
+    With `raw` the complete frame (header included) is returned undecoded, for relays.
+    `stats` is an optional ConnectionStats updated for every complete message.
+    Frames whose header announces more than `max_frame_size` bytes are rejected
+    before anything is buffered. With a BufferPool, partly received bodies are read
+    straight into a pooled buffer, stored in the map as a memoryview of the bytes so far.
     """
-    if client_ident not in recv_buffer_map:
-        recv_buffer_map[client_ident] = b''
-    
-    buffer = recv_buffer_map[client_ident]
+    buffer = recv_buffer_map.get(client_ident, b'')
+    storage = buffer.obj if isinstance(buffer, memoryview) else None
 
     try:
         # 1. Try to read the header if not fully received yet
@@ -48,38 +364,59 @@ def receive_message(sock, recv_buffer_map, client_ident):
             if not chunk:
                 logging.info(f"Client {client_ident} disconnected (header recv).")
                 return False  # Connection closed
-            buffer += chunk
+            buffer = bytes(buffer) + chunk # Never pooled: nothing is buffered before the header
             if len(buffer) < HEADER_LENGTH:
                 recv_buffer_map[client_ident] = buffer
                 return None  # Still waiting for full header
 
-        msg_len = struct.unpack('>I', buffer[:HEADER_LENGTH])[0]
+        header = bytes(buffer[:HEADER_LENGTH])
+        msg_len = struct.unpack('>I', header)[0] & LENGTH_MASK
+        if max_frame_size is not None and msg_len > max_frame_size:
+            logging.error(f"Frame of {msg_len} bytes from {client_ident} exceeds the {max_frame_size} byte limit.")
+            return False
+        frame_length = HEADER_LENGTH + msg_len
         
         # 2. Try to read the message body if not fully received yet
-        if len(buffer) < HEADER_LENGTH + msg_len:
-            bytes_needed = HEADER_LENGTH + msg_len - len(buffer)
-            chunk = sock.recv(bytes_needed)
+        if len(buffer) < frame_length:
+            if pool is None:
+                chunk = sock.recv(frame_length - len(buffer))
+            else:
+                if storage is None:
+                    storage = pool.acquire(frame_length)
+                    storage[:len(buffer)] = buffer
+                    buffer = memoryview(storage)[:len(buffer)]
+                    recv_buffer_map[client_ident] = buffer # Owner reclaims it if the read fails
+                filled = len(buffer)
+                received = sock.recv_into(memoryview(storage)[filled:frame_length])
+                chunk = received and memoryview(storage)[:filled + received]
             if not chunk:
                 logging.info(f"Client {client_ident} disconnected (body recv).")
                 # Potentially an incomplete message, might need cleanup or error reporting
                 return False # Connection closed
-            buffer += chunk
-            if len(buffer) < HEADER_LENGTH + msg_len:
+            buffer = chunk if pool is not None else buffer + chunk
+            if len(buffer) < frame_length:
                 recv_buffer_map[client_ident] = buffer
                 return None # Still waiting for full message body
 
         # Message fully received
-        pickled_msg = buffer[HEADER_LENGTH : HEADER_LENGTH + msg_len]
-        message = pickle.loads(pickled_msg)
+        decode_start = time.perf_counter()
+        if raw:
+            message = bytes(buffer[:frame_length])
+        else:
+            message = decode_body(header, buffer[HEADER_LENGTH:frame_length], max_frame_size)
+        if stats is not None:
+            stats.record_received(frame_length, time.perf_counter() - decode_start)
         
         # Update buffer with any excess data
-        recv_buffer_map[client_ident] = buffer[HEADER_LENGTH + msg_len:]
+        recv_buffer_map[client_ident] = bytes(buffer[frame_length:])
+        if storage is not None:
+            pool.reclaim(buffer)
         return message
 
     except BlockingIOError:
         recv_buffer_map[client_ident] = buffer # Save progress
         return None  # No data available right now
-    except (socket.error, struct.error, pickle.UnpicklingError) as e:
+    except (socket.error, struct.error, pickle.UnpicklingError, zlib.error) as e:
         logging.error(f"Error receiving/processing message from {client_ident}: {e}")
         return False # Indicate an error or disconnection
     except Exception as e:
@@ -87,33 +424,248 @@ def receive_message(sock, recv_buffer_map, client_ident):
         return False
 
 
+class ClockSync:
+    """
+    NTP-style clock offset and round-trip time estimation from ping/pong samples.
+
+    Each sample holds the client send time (t0), the server time (t1) and the
+    client receive time (t2). The offset is taken from the sample with the lowest
+    RTT, since it has the least queueing delay and therefore the least asymmetry.
+    """
+
+    def __init__(self, max_samples=CLOCK_SYNC_SAMPLES):
+        self.samples = deque(maxlen=max_samples) # [(rtt, offset)]
+        self.rtt = None          # Smoothed round-trip time in seconds
+        self.offset = 0.0        # Server clock minus client clock, in seconds
+        self.server_tick = None  # Latest known server tick
+        self.tick_time = None    # Server time at which server_tick started
+        self.tick_rate = FPS     # Server ticks per second
+
+    @property
+    def sample_count(self):
+        return len(self.samples)
+
+    def add_sample(self, client_send_time, server_time, client_recv_time):
+        """
+        Add a ping/pong measurement
+
+        Args:
+            client_send_time: Client clock when the ping was sent
+            server_time: Server clock when the ping was answered
+            client_recv_time: Client clock when the pong arrived
+        """
+        rtt = max(0.0, client_recv_time - client_send_time)
+        offset = server_time - (client_send_time + rtt / 2.0)
+        self.samples.append((rtt, offset))
+
+        # Smoothed RTT, same gain as TCP's SRTT
+        self.rtt = rtt if self.rtt is None else self.rtt + (rtt - self.rtt) / 8.0
+        self.offset = min(self.samples)[1]
+
+    def update_tick(self, server_tick, tick_time, tick_rate=None):
+        """ Record the server's current tick and the server time it started at. """
+        self.server_tick = server_tick
+        self.tick_time = tick_time
+        if tick_rate:
+            self.tick_rate = tick_rate
+
+    def server_time(self, local_time=None):
+        """ Estimate the current server clock from the local clock. """
+        if local_time is None:
+            local_time = time.time()
+        return local_time + self.offset
+
+    def estimated_server_tick(self, local_time=None):
+        """
+        Estimate the tick the server is currently simulating
+
+        Returns:
+            float: Estimated server tick, or None if no tick has been observed yet
+        """
+        if self.server_tick is None:
+            return None
+        elapsed = self.server_time(local_time) - self.tick_time
+        return self.server_tick + max(0.0, elapsed) * self.tick_rate
+
+
 class Server:
-    def __init__(self, host, port, max_clients=1):
+    def __init__(self, host, port, max_clients=1, reuse_port=False, coalesce_writes=False, idle_timeout=IDLE_TIMEOUT,
+                 max_frame_size=MAX_FRAME_SIZE, max_send_queue_bytes=MAX_SEND_QUEUE_BYTES,
+                 max_frames_per_read=MAX_FRAMES_PER_READ):
+        """
+        Args:
+            host, port: Address to listen on. With host None the server does not listen
+                and only serves connections handed to it through attach_client().
+            max_clients: Maximum number of connected clients
+            reuse_port: Set SO_REUSEPORT so several processes can share the port
+            coalesce_writes: Queue outgoing messages until flush() so each client gets
+                one write per tick. Only for owners that call flush() every tick; when
+                False every message is written immediately.
+            idle_timeout: Seconds without any message from a client before it is
+                dropped, or None to rely on the socket alone
+            max_frame_size: Largest message body accepted from a client; a client
+                announcing a larger one is disconnected
+            max_send_queue_bytes: Unsent bytes a client may have queued before it is
+                disconnected as too slow
+            max_frames_per_read: Frames read from each client per receive_data(). Frames
+                beyond it stay in the socket, e.g. for a process the client is handed to.
+        """
         self.host = host
         self.port = port
         self.max_clients = max_clients
-        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.socket.setblocking(False)
-        self.socket.bind((host, port))
-        self.socket.listen(max_clients + 1) # Listen for a bit more than max_clients
+        self.coalesce_writes = coalesce_writes
+        self.idle_timeout = idle_timeout
+        self.heartbeat_interval = HEARTBEAT_INTERVAL
+        self.max_frame_size = max_frame_size
+        self.max_send_queue_bytes = max_send_queue_bytes
+        self.max_frames_per_read = max_frames_per_read
+        self.buffer_pool = BufferPool() # Receive buffers shared by all clients
+        self.compress_threshold = COMPRESSION_THRESHOLD # None to never compress
+        self.socket = None
+        if host is not None:
+            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            if reuse_port:
+                self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            self.socket.setblocking(False)
+            self.socket.bind((host, port))
+            self.socket.listen(max_clients + 1) # Listen for a bit more than max_clients
         self.clients = {}  # {client_socket: {'addr': address, 'id': client_id_str}}
+        self.client_sockets = {} # {client_id_str: client_socket}, index for per-client sends
         self.client_recv_buffers = {} # {client_id_str: b''}
         self.client_id_counter = 0
+        self.disconnected_ids = [] # Client ids removed since the last pop_disconnected()
+        self.tick = 0 # Current simulation tick, set by the game through set_tick()
+        self.tick_time = time.time()
+        self.tick_rate = FPS
+        self.tick_io = new_io_counters()      # Writes during the current tick
+        self.last_tick_io = new_io_counters() # Writes during the previous tick
+        self.total_io = new_io_counters()
+        self.reaped_count = 0 # Clients dropped for going silent
+        self.stats = ConnectionStats() # Totals over all connections
+        self.message_handlers = {} # {message type: handler(client_id, message)}, see set_message_handler()
         logging.info(f"Server initialized on {host}:{port}, max_clients={max_clients}")
 
+    def set_tick(self, tick, tick_rate=None):
+        """ Record the current simulation tick, used to answer clock sync pings. """
+        self.tick = tick
+        self.tick_time = time.time()
+        if tick_rate:
+            self.tick_rate = tick_rate
+        self.last_tick_io, self.tick_io = self.tick_io, new_io_counters()
+
+    def get_io_stats(self):
+        """
+        Get write counters for the previous tick and since start
+
+        Returns:
+            dict: {'last_tick': counters, 'total': counters}, each with
+                'syscalls', 'bytes_sent' and 'messages_sent'
+        """
+        return {'last_tick': dict(self.last_tick_io), 'total': dict(self.total_io)}
+
+    def set_client_tick(self, client_id, tick):
+        """
+        Record the simulation tick for one client when clients play in different
+        simulations (e.g. rooms), overriding the server-wide tick in its pongs.
+        """
+        sock = self.client_sockets.get(client_id)
+        if sock is not None:
+            self.clients[sock]['tick'] = tick
+            self.clients[sock]['tick_time'] = time.time()
+
+    def get_connection_stats(self):
+        """
+        Returns:
+            dict: ConnectionStats.as_dict() totals over all connections, plus
+                'connected' (current clients) and 'reaped' (clients dropped for going silent)
+        """
+        stats = self.stats.as_dict()
+        stats['connected'] = len(self.clients)
+        stats['reaped'] = self.reaped_count
+        return stats
+
+    def get_client_stats(self, client_id):
+        """
+        Returns:
+            dict: ConnectionStats.as_dict() for one client, or None if unknown client
+        """
+        sock = self.client_sockets.get(client_id)
+        if sock is None:
+            return None
+        client_info = self.clients[sock]
+        stats = client_info['stats'].as_dict()
+        stats['recv_buffer_bytes'] = held_bytes(self.client_recv_buffers.get(client_id, b''))
+        stats['send_queue_bytes'] = client_info['queued_bytes']
+        return stats
+
+    def get_memory_stats(self):
+        """
+        Get memory held for clients
+
+        Returns:
+            dict: 'recv_buffers' and 'send_queues' (bytes over all clients), 'largest_client'
+                (bytes held for the most expensive client) and 'pool' (BufferPool.get_stats())
+        """
+        recv_bytes = {client_id: held_bytes(buffer) for client_id, buffer in self.client_recv_buffers.items()}
+        send_bytes = {info['id']: info['queued_bytes'] for info in self.clients.values()}
+        per_client = [recv_bytes.get(client_id, 0) + queued for client_id, queued in send_bytes.items()]
+        return {
+            'recv_buffers': sum(recv_bytes.values()),
+            'send_queues': sum(send_bytes.values()),
+            'largest_client': max(per_client, default=0),
+            'pool': self.buffer_pool.get_stats(),
+        }
+
+    def get_clock_info(self, client_id):
+        """
+        Get the latest clock sync figures reported by a client
+
+        Returns:
+            dict: {'rtt': seconds or None, 'clock_offset': seconds} or None if unknown client
+        """
+        sock = self.client_sockets.get(client_id)
+        if sock is None:
+            return None
+        info = self.clients[sock]
+        return {'rtt': info.get('rtt'), 'clock_offset': info.get('clock_offset', 0.0)}
+
+    def _handle_control_message(self, client_sock, client_info, message):
+        """
+        Answer network-level messages that the game never sees.
+        Returns True if the message was consumed.
+        """
+        if not isinstance(message, dict):
+            return False
+        if message.get('type') == 'heartbeat':
+            return True # Only there to refresh last_recv
+        if message.get('type') != 'ping':
+            return False
+        # Clients report their own estimates so the server can expose them per connection
+        if message.get('rtt') is not None:
+            client_info['rtt'] = client_info['stats'].rtt = message['rtt']
+            client_info['clock_offset'] = -message.get('clock_offset', 0.0)
+        pong = {
+            'type': 'pong',
+            'client_time': message.get('client_time'),
+            'server_time': time.time(),
+            'server_tick': client_info.get('tick', self.tick),
+            'tick_time': client_info.get('tick_time', self.tick_time),
+            'tick_rate': self.tick_rate,
+        }
+        # Written right away: holding a pong until the end of the tick would inflate the RTT
+        self._queue_frame(client_sock, encode_message(pong))
+        self._flush_client(client_sock)
+        return True
+
     def accept_connections(self):
         newly_connected_ids = []
-        if len(self.clients) >= self.max_clients:
+        if self.socket is None or len(self.clients) >= self.max_clients:
             return newly_connected_ids
 
         try:
             while len(self.clients) < self.max_clients:
                 conn, addr = self.socket.accept()
-                conn.setblocking(False)
-                client_id = f"client_{self.client_id_counter}"
-                self.client_id_counter += 1
-                self.clients[conn] = {'addr': addr, 'id': client_id}
-                self.client_recv_buffers[client_id] = b'' # Initialize buffer for new client
+                client_id = self.attach_client(conn, addr)
                 newly_connected_ids.append(client_id)
                 logging.info(f"Accepted connection from {addr} as {client_id}")
         except BlockingIOError:
@@ -122,81 +674,253 @@ class Server:
             logging.error(f"Error accepting connections: {e}")
         return newly_connected_ids
 
+    def attach_client(self, conn, addr, recv_buffer=b''):
+        """
+        Start serving an already connected socket, e.g. one handed over by another process
+
+        Args:
+            conn: Connected client socket
+            addr: Client address
+            recv_buffer: Bytes already read from the connection but not yet parsed
+
+        Returns:
+            str: Client id assigned to the connection
+        """
+        conn.setblocking(False)
+        configure_socket(conn)
+        client_id = f"client_{self.client_id_counter}"
+        self.client_id_counter += 1
+        now = time.monotonic()
+        self.clients[conn] = {
+            'addr': addr, 'id': client_id, 'send_queue': [], 'queued_bytes': 0, 'last_recv': now, 'last_send': now,
+            'stats': ConnectionStats(parent=self.stats),
+        }
+        self.client_sockets[client_id] = conn
+        self.client_recv_buffers[client_id] = recv_buffer # Initialize buffer for new client
+        return client_id
+
+    def detach_client(self, client_id):
+        """
+        Stop serving a client without closing its connection, so it can be handed over
+
+        Returns:
+            tuple: (socket, address, unparsed receive buffer), or None if unknown client
+        """
+        sock = self.client_sockets.get(client_id)
+        if sock is None:
+            return None
+        self._flush_client(sock) # Anything already queued belongs to this process's session
+        if sock not in self.clients:
+            return None # Failed while flushing
+        self.client_sockets.pop(client_id)
+        client_info = self.clients.pop(sock)
+        pending = self.client_recv_buffers.pop(client_id, b'')
+        recv_buffer = bytes(pending) # Plain bytes, the pooled buffer stays here
+        self.buffer_pool.reclaim(pending)
+        return sock, client_info['addr'], recv_buffer
+
+    def _remove_client(self, sock, reason):
+        """ Drop a client connection and all per-client state. """
+        client_info = self.clients.pop(sock, None)
+        if client_info:
+            client_id = client_info['id']
+            self.client_sockets.pop(client_id, None)
+            self.buffer_pool.reclaim(self.client_recv_buffers.pop(client_id, b''))
+            self.disconnected_ids.append(client_id)
+            logging.info(f"Removed client {client_id} ({client_info['addr']}): {reason}.")
+        try:
+            sock.close()
+        except socket.error as e:
+            logging.error(f"Error closing socket for removed client: {e}")
+
+    def drop_client(self, client_id, reason="dropped"):
+        """ Close a client's connection, e.g. one replaced by a resumed session. """
+        sock = self.client_sockets.get(client_id)
+        if sock is not None:
+            self._remove_client(sock, reason)
+
+    def set_message_handler(self, message_type, handler):
+        """
+        Handle messages of one type outside the game loop. They are passed to
+        handler(client_id, message) from receive_data() instead of being returned.
+        """
+        self.message_handlers[message_type] = handler
+
+    def pop_disconnected(self):
+        """
+        Get the ids of clients removed since the last call, so game state can be cleaned up
+
+        Returns:
+            list: Client id strings
+        """
+        disconnected, self.disconnected_ids = self.disconnected_ids, []
+        return disconnected
+
     def receive_data(self):
         received_messages = []
         clients_to_remove = []
+        idle_clients = []
+        now = time.monotonic()
 
         for client_sock, client_info in list(self.clients.items()): # list() for safe removal
             client_id = client_info['id']
-            message = receive_message(client_sock, self.client_recv_buffers, client_id)
+            read_options = {'stats': client_info['stats'], 'max_frame_size': self.max_frame_size, 'pool': self.buffer_pool}
+            # Read every complete frame that has arrived, not just the first, so a burst
+            # reaches the game (and its rate limits) in the tick it was sent
+            for _ in range(self.max_frames_per_read):
+                message = receive_message(client_sock, self.client_recv_buffers, client_id, **read_options)
+                if message is None or message is False:
+                    break
+                client_info['last_recv'] = now
+                if not self._handle_control_message(client_sock, client_info, message):
+                    handler = self.message_handlers.get(message.get('type')) if isinstance(message, dict) else None
+                    if handler:
+                        handler(client_id, message)
+                    else:
+                        received_messages.append((client_id, message))
+                    logging.debug(f"Received from {client_id}: {message}")
+                if client_sock not in self.clients:
+                    break # Dropped while answering, e.g. a send queue over its limit
+            if client_sock not in self.clients:
+                continue
 
             if message is False:  # Error or disconnection
                 clients_to_remove.append(client_sock)
                 logging.info(f"Client {client_id} ({client_info['addr']}) marked for removal.")
-            elif message is not None: # Successfully received a complete message
-                received_messages.append((client_id, message))
-                logging.debug(f"Received from {client_id}: {message}")
+            elif message is None:
+                if self.idle_timeout is not None and now - client_info['last_recv'] > self.idle_timeout:
+                    idle_clients.append(client_sock)
         
         for sock in clients_to_remove:
-            client_info = self.clients.pop(sock, None)
-            if client_info:
-                del self.client_recv_buffers[client_info['id']]
-                logging.info(f"Removed client {client_info['id']} ({client_info['addr']}).")
-            try:
-                sock.close()
-            except socket.error as e:
-                logging.error(f"Error closing socket for removed client: {e}")
+            self._remove_client(sock, "disconnected")
+        for sock in idle_clients:
+            # Vanished without closing (sleep, cable pull): free its seat and buffers
+            self.reaped_count += 1
+            self._remove_client(sock, f"no data for {self.idle_timeout:.0f}s")
         
         return received_messages
 
     def broadcast_data(self, data):
-        clients_to_remove = []
         if not self.clients:
             # logging.info("Broadcast: No clients connected.") # Can be noisy
             return
 
         logging.debug(f"Broadcasting data: {data}")
-        for client_sock, client_info in list(self.clients.items()):
-            if not send_message(client_sock, data):
-                logging.warning(f"Failed to send data to {client_info['id']}. Marking for removal.")
-                clients_to_remove.append(client_sock)
-        
-        for sock in clients_to_remove:
-            client_info = self.clients.pop(sock, None)
-            if client_info:
-                del self.client_recv_buffers[client_info['id']]
-                logging.info(f"Removed client {client_info['id']} due to send failure.")
-            try:
-                sock.close()
-            except socket.error as e:
-                logging.error(f"Error closing socket for client removed during broadcast: {e}")
+        self.multicast_data(list(self.client_sockets), data)
+
+    def encode(self, data):
+        """
+        Encode a message once for sending to many clients with multicast_frame().
+
+        Returns:
+            bytes: Complete frame, or None if the message could not be encoded
+        """
+        start = time.perf_counter()
+        try:
+            frame = encode_message(data, self.compress_threshold)
+        except Exception as e:
+            logging.error(f"Error encoding message for multicast: {e}")
+            return None
+        self.stats.record_encode(time.perf_counter() - start)
+        return frame
+
+    def multicast_data(self, client_ids, data):
+        """
+        Send the same data to a group of clients, encoding it only once.
+
+        Args:
+            client_ids: Ids of the clients to send to
+            data: Message to send
+        """
+        frame = self.encode(data)
+        if frame is not None:
+            self.multicast_frame(client_ids, frame)
+
+    def multicast_frame(self, client_ids, frame):
+        """
+        Send an already encoded frame to a group of clients. The same bytes object is
+        queued for every client, so fan-out costs no extra encoding or copies.
+
+        Args:
+            client_ids: Ids of the clients to send to
+            frame: Frame from encode(), or one received raw from another server
+        """
+        for client_id in client_ids:
+            sock = self.client_sockets.get(client_id)
+            if sock is not None:
+                self._queue_frame(sock, frame)
+        if not self.coalesce_writes:
+            self.flush()
 
     def send_to_client(self, client_id, data):
         """ Sends data to a specific client by client_id. """
-        target_socket = None
-        for sock, info in self.clients.items():
-            if info['id'] == client_id:
-                target_socket = sock
-                break
+        target_socket = self.client_sockets.get(client_id)
         
         if target_socket:
-            if not send_message(target_socket, data):
-                logging.warning(f"Failed to send data to specific client {client_id}. Removing.")
-                # Perform removal similar to broadcast_data
-                client_info = self.clients.pop(target_socket, None)
-                if client_info:
-                    del self.client_recv_buffers[client_info['id']]
-                    logging.info(f"Removed client {client_info['id']} due to specific send failure.")
-                try:
-                    target_socket.close()
-                except socket.error as e:
-                    logging.error(f"Error closing socket for {client_id} after send failure: {e}")
+            start = time.perf_counter()
+            try:
+                frame = encode_message(data, self.compress_threshold)
+            except Exception as e:
+                logging.error(f"Error encoding message for {client_id}: {e}")
                 return False
+            self.clients[target_socket]['stats'].record_encode(time.perf_counter() - start)
+            self._queue_frame(target_socket, frame)
+            if not self.coalesce_writes:
+                return self._flush_client(target_socket)
             return True
         else:
             logging.warning(f"Client {client_id} not found for sending data.")
             return False
 
+    def _queue_frame(self, sock, frame):
+        client_info = self.clients[sock]
+        client_info['queued_bytes'] += len(frame)
+        if client_info['queued_bytes'] > self.max_send_queue_bytes:
+            # Not reading what we send: stop buffering for it instead of growing without bound
+            self._remove_client(sock, f"over {self.max_send_queue_bytes} unsent bytes")
+            return
+        client_info['send_queue'].append(frame)
+
+    def _flush_client(self, sock):
+        """
+        Write a client's queued frames. Returns False if the client was removed.
+        """
+        client_info = self.clients.get(sock)
+        if client_info is None:
+            return False
+        if not client_info['send_queue']:
+            return True
+        counters = new_io_counters()
+        client_info['last_send'] = time.monotonic()
+        try:
+            write_frames(sock, client_info['send_queue'], counters)
+        except socket.error as e:
+            logging.warning(f"Failed to send data to {client_info['id']}: {e}. Removing.")
+            self._remove_client(sock, "send failure")
+            return False
+        finally:
+            for key, value in counters.items():
+                self.tick_io[key] += value
+                self.total_io[key] += value
+            client_info['stats'].record_sent(counters, len(client_info['send_queue']))
+            client_info['queued_bytes'] = sum(len(frame) for frame in client_info['send_queue'])
+        return True
+
+    def flush(self):
+        """
+        Write everything queued since the last flush: one vectored write per client
+        instead of one syscall per message. Clients that have not been sent
+        anything for a while get a heartbeat so they can tell the server is alive.
+        """
+        now = time.monotonic()
+        heartbeat = None
+        for sock, client_info in list(self.clients.items()):
+            if not client_info['send_queue'] and now - client_info['last_send'] >= self.heartbeat_interval:
+                heartbeat = heartbeat or encode_message({'type': 'heartbeat'})
+                client_info['send_queue'].append(heartbeat)
+            if client_info['send_queue']:
+                self._flush_client(sock)
+
     def close(self):
         logging.info("Closing server...")
         for client_sock, client_info in list(self.clients.items()):
@@ -206,29 +930,130 @@ class Server:
             except socket.error as e:
                 logging.error(f"Error closing client socket {client_info['id']}: {e}")
         self.clients.clear()
+        self.client_sockets.clear()
+        for pending in self.client_recv_buffers.values():
+            self.buffer_pool.reclaim(pending)
         self.client_recv_buffers.clear()
         try:
-            self.socket.close()
+            if self.socket is not None:
+                self.socket.close()
         except socket.error as e:
             logging.error(f"Error closing server socket: {e}")
         logging.info("Server closed.")
 
 
 class Client:
-    def __init__(self, host, port):
+    def __init__(self, host, port, coalesce_writes=False, idle_timeout=IDLE_TIMEOUT):
+        """
+        Args:
+            host, port: Server address
+            coalesce_writes: Queue outgoing messages until flush(), e.g. once per frame.
+                When False every message is written immediately.
+            idle_timeout: Seconds without any message from the server before the
+                connection is treated as lost, or None to rely on the socket alone
+        """
         self.host = host
         self.port = port
         self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self.recv_buffer = { 'client_socket': b'' } # Use a map for receive_message compatibility
         self.connected = False
+        self.coalesce_writes = coalesce_writes
+        self.compress_threshold = COMPRESSION_THRESHOLD # None to never compress
+        self.session_token = None # Issued in the server's welcome, presented to resume
+        self.room_id = None
+        self.player_id = None
+        self.send_queue = []
+        self.io_counters = new_io_counters()
+        self.idle_timeout = idle_timeout
+        self.heartbeat_interval = HEARTBEAT_INTERVAL
+        self.last_recv_time = None
+        self.last_send_time = None
+        self.stats = ConnectionStats()
+        self.clock = ClockSync()
+        self.last_ping_time = None
         logging.info(f"Client initialized for {host}:{port}")
 
+    @property
+    def rtt(self):
+        """ Smoothed round-trip time to the server in seconds, or None before the first pong. """
+        return self.clock.rtt
+
+    @property
+    def clock_offset(self):
+        """ Estimated server clock minus local clock, in seconds. """
+        return self.clock.offset
+
+    def server_time(self):
+        """ Estimate of the server's current clock. """
+        return self.clock.server_time()
+
+    def estimated_server_tick(self):
+        """ Estimate of the tick the server is simulating right now, or None if unknown. """
+        return self.clock.estimated_server_tick()
+
+    def sync_clock(self):
+        """ Send a clock sync ping. The pong is handled inside receive_data(). """
+        self.last_ping_time = time.time()
+        ping = {
+            'type': 'ping',
+            'client_time': self.last_ping_time,
+            'rtt': self.clock.rtt,
+            'clock_offset': self.clock.offset,
+        }
+        # Never held back: a queued ping would inflate the measured RTT
+        return self.send_data(ping) and self.flush()
+
+    def poll_clock_sync(self):
+        """
+        Send clock sync pings when due: a quick burst until enough samples are
+        collected, then periodically to track drift and changing latency.
+        """
+        if not self.connected:
+            return
+        interval = (
+            CLOCK_SYNC_BURST_INTERVAL
+            if self.clock.sample_count < self.clock.samples.maxlen
+            else CLOCK_SYNC_INTERVAL
+        )
+        if self.last_ping_time is None or time.time() - self.last_ping_time >= interval:
+            self.sync_clock()
+
+    def _handle_control_message(self, message):
+        """
+        Consume network-level messages and track server ticks.
+        Returns True if the message was consumed.
+        """
+        if not isinstance(message, dict):
+            return False
+        if message.get('type') == 'welcome':
+            # Remember our session so a dropped connection can be resumed
+            self.session_token = message.get('session_token', self.session_token)
+            self.room_id = message.get('room_id')
+            self.player_id = message.get('player_id')
+            return False
+        if message.get('type') == 'heartbeat':
+            return True
+        if message.get('type') == 'pong':
+            now = time.time()
+            self.clock.add_sample(message['client_time'], message['server_time'], now)
+            self.clock.update_tick(message['server_tick'], message['tick_time'], message.get('tick_rate'))
+            self.stats.rtt = self.clock.rtt
+            return True
+        if 'tick' in message and 'server_time' in message:
+            # Tick-stamped state: keeps the tick estimate fresh between pongs
+            self.clock.update_tick(message['tick'], message['server_time'])
+            self.stats.record_snapshot()
+        return False
+
     def connect(self):
         try:
             self.socket.connect((self.host, self.port))
             self.socket.setblocking(False)
+            configure_socket(self.socket)
             self.connected = True
+            self.last_recv_time = self.last_send_time = time.monotonic()
             logging.info(f"Successfully connected to server {self.host}:{self.port}")
+            self.sync_clock() # Start the clock sync handshake
             return True
         except socket.error as e:
             # For non-blocking, connect() might raise an error immediately.
@@ -249,18 +1074,116 @@ class Client:
             logging.warning("Client not connected. Cannot send data.")
             return False
         logging.debug(f"Client sending data: {data}")
-        if not send_message(self.socket, data):
+        start = time.perf_counter()
+        try:
+            self.send_queue.append(encode_message(data, self.compress_threshold))
+        except Exception as e:
+            logging.error(f"Error encoding message: {e}")
+            return False
+        self.stats.record_encode(time.perf_counter() - start)
+        if not self.coalesce_writes:
+            return self.flush()
+        return True
+
+    def flush(self):
+        """
+        Write all queued messages with a single vectored write.
+        Returns True on success, False if the connection failed.
+        """
+        if not self.connected:
+            return False
+        now = time.monotonic()
+        if self.send_queue:
+            self.last_send_time = now
+        elif now - self.last_send_time >= self.heartbeat_interval:
+            # Keeps the server from reaping us while we have nothing to say
+            self.send_queue.append(encode_message({'type': 'heartbeat'}))
+            self.last_send_time = now
+        counters = new_io_counters()
+        try:
+            write_frames(self.socket, self.send_queue, counters)
+        except socket.error as e:
             self.connected = False # Assume disconnection on send failure
-            logging.error("Failed to send data. Disconnecting client.")
+            logging.error(f"Failed to send data: {e}. Disconnecting client.")
             return False
+        finally:
+            for key, value in counters.items():
+                self.io_counters[key] += value
+            self.stats.record_sent(counters, len(self.send_queue))
         return True
 
+    def get_stats(self):
+        """
+        Returns:
+            dict: ConnectionStats.as_dict() for the connection to the server
+        """
+        return self.stats.as_dict()
+
+    def join_room(self, room_id=None):
+        """
+        Ask a room server to place this connection in a room (any open room if
+        room_id is None). The reply arrives as a 'welcome' or 'join_rejected' message.
+        """
+        return self.send_data({'type': 'join', 'room_id': room_id})
+
+    def reconnect(self):
+        """
+        Open a fresh connection to the same server, discarding anything buffered on
+        the old one. Call resume() afterwards to take back the session.
+
+        Returns:
+            bool: True if connected
+        """
+        self.close()
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.recv_buffer = { 'client_socket': b'' }
+        self.send_queue = []
+        return self.connect()
+
+    def resume(self, last_tick=None):
+        """
+        Ask the server to hand our session to this connection. The reply is a
+        'resume_state' message, or 'resume_rejected' once the grace period is over.
+
+        Args:
+            last_tick: Tick of the last state applied, so only later changes are sent
+        """
+        if self.session_token is None:
+            return False
+        sent = self.send_data({'type': 'resume', 'token': self.session_token, 'room_id': self.room_id, 'tick': last_tick})
+        return sent and self.flush()
+
+    def spectate(self, room_id=None, rate=None):
+        """
+        Join a room as a spectator: receive its state without controlling a snake.
+
+        Args:
+            room_id: Room to watch (any room with players if None)
+            rate: State updates per second wanted, None for the server's spectator rate
+        """
+        return self.send_data({'type': 'join', 'room_id': room_id, 'role': ROLE_SPECTATOR, 'rate': rate})
+
+    def timed_out(self, now=None):
+        """ True if nothing has arrived from the server for longer than idle_timeout. """
+        if self.idle_timeout is None or self.last_recv_time is None:
+            return False
+        now = now if now is not None else time.monotonic()
+        return now - self.last_recv_time > self.idle_timeout
+
     def receive_data(self):
         if not self.connected:
             # logging.warning("Client not connected. Cannot receive data.") # Can be noisy
             return None 
 
-        message = receive_message(self.socket, self.recv_buffer, 'client_socket')
+        message = receive_message(self.socket, self.recv_buffer, 'client_socket', stats=self.stats)
+        if message is not None and message is not False:
+            self.last_recv_time = time.monotonic()
+        while message and self._handle_control_message(message):
+            message = receive_message(self.socket, self.recv_buffer, 'client_socket', stats=self.stats)
+
+        if message is None and self.timed_out():
+            logging.warning(f"No data from the server for {self.idle_timeout:.0f}s. Assuming the connection is dead.")
+            message = False
         
         if message is False: # Error or disconnection
             logging.info("Disconnected from server or error receiving data.")
@@ -302,6 +1225,7 @@ if __name__ == '__main__':
                 if time.time() - last_broadcast_time > 5:
                     server.broadcast_data({"timestamp": time.time(), "message": "Server heartbeat"})
                     last_broadcast_time = time.time()
+                server.flush()
                 
                 time.sleep(0.1)
         except KeyboardInterrupt:
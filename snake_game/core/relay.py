@@ -0,0 +1,158 @@
+import argparse
+import logging
+import time
+from snake_game.core.network import (
+    Server, Client, HEADER_LENGTH, ROLE_SPECTATOR, receive_message, decode_body,
+)
+
+RECONNECT_INTERVAL = 1.0 # Seconds between attempts to reach the upstream server
+
+
+class Relay:
+    """
+    Spectator fan-out. A relay subscribes to one room on the authoritative server as a
+    single spectator and re-sends every state frame it receives, byte for byte, to
+    its own viewers. The authoritative server pays for one connection per relay no
+    matter how many viewers each relay carries.
+    """
+
+    def __init__(self, upstream_host, upstream_port, host, port, room_id=None, rate=None, max_clients=4096):
+        """
+        Initialize the relay
+
+        Args:
+            upstream_host, upstream_port: Address of the room server
+            host, port: Address viewers connect to
+            room_id: Room to relay (any room with players if None)
+            rate: State updates per second to request upstream (server default if None)
+            max_clients: Maximum number of viewers
+        """
+        self.upstream_host = upstream_host
+        self.upstream_port = upstream_port
+        self.room_id = room_id
+        self.rate = rate
+        self.upstream = None
+        self.last_connect_attempt = 0.0
+        self.server = Server(host, port, max_clients=max_clients, coalesce_writes=True)
+        self.viewers = set() # Client ids that have joined
+        self.player_ids = []
+        self.latest_frame = None # Last state frame, sent to viewers as soon as they join
+        self.frames_relayed = 0
+
+    def connect_upstream(self):
+        """
+        Connect to the room server and subscribe as a spectator
+
+        Returns:
+            bool: True if connected
+        """
+        self.last_connect_attempt = time.monotonic()
+        self.upstream = Client(self.upstream_host, self.upstream_port)
+        if not self.upstream.connect():
+            self.upstream = None
+            return False
+        return self.upstream.spectate(self.room_id, self.rate)
+
+    def _handle_upstream_frame(self, frame):
+        message = decode_body(frame[:HEADER_LENGTH], frame[HEADER_LENGTH:])
+        if isinstance(message, dict) and self.upstream._handle_control_message(message):
+            return # Our own clock sync
+        if not isinstance(message, dict):
+            return
+
+        message_type = message.get('type')
+        if message_type == 'welcome':
+            self.room_id = message['room_id']
+            self.player_ids = message.get('player_ids', [])
+            logging.info(f"Relaying room {self.room_id} at {message.get('rate')} updates/s")
+        elif message_type == 'join_rejected':
+            logging.error(f"Upstream rejected the relay: {message.get('reason')}")
+        elif message_type is None:
+            # Game state: forward the frame exactly as the server encoded it
+            self.latest_frame = frame
+            self.player_ids = message.get('player_ids', self.player_ids)
+            if message.get('tick') is not None:
+                self.server.set_tick(message['tick'])
+            self.server.multicast_frame(self.viewers, frame)
+            self.frames_relayed += 1
+
+    def _poll_upstream(self):
+        if self.upstream is None or not self.upstream.connected:
+            if time.monotonic() - self.last_connect_attempt >= RECONNECT_INTERVAL:
+                self.connect_upstream()
+            return
+
+        self.upstream.poll_clock_sync()
+        upstream = self.upstream
+        frame = receive_message(upstream.socket, upstream.recv_buffer, 'client_socket', raw=True, stats=upstream.stats)
+        while frame:
+            upstream.last_recv_time = time.monotonic()
+            self._handle_upstream_frame(frame)
+            frame = receive_message(upstream.socket, upstream.recv_buffer, 'client_socket', raw=True, stats=upstream.stats)
+        if frame is False or self.upstream.timed_out():
+            logging.warning("Lost the upstream server, reconnecting...")
+            self.upstream.close()
+            self.upstream = None
+
+    def _poll_viewers(self):
+        self.server.accept_connections()
+        for client_id, message in self.server.receive_data():
+            if isinstance(message, dict) and message.get('type') == 'join':
+                self.viewers.add(client_id)
+                self.server.send_to_client(client_id, {
+                    'type': 'welcome',
+                    'room_id': self.room_id,
+                    'player_id': None,
+                    'role': ROLE_SPECTATOR,
+                    'player_ids': list(self.player_ids),
+                })
+                if self.latest_frame is not None:
+                    self.server.multicast_frame([client_id], self.latest_frame)
+            # Viewers never send inputs; anything else is dropped
+        for client_id in self.server.pop_disconnected():
+            self.viewers.discard(client_id)
+
+    def poll(self):
+        """ Forward upstream state to viewers and serve viewer connections. """
+        self._poll_upstream()
+        self._poll_viewers()
+        self.server.flush()
+
+    def serve_forever(self):
+        self.connect_upstream()
+        try:
+            while True:
+                self.poll()
+                time.sleep(0.001)
+        except KeyboardInterrupt:
+            logging.info("Relay shutting down...")
+        finally:
+            self.close()
+
+    def close(self):
+        if self.upstream:
+            self.upstream.close()
+            self.upstream = None
+        self.server.close()
+        self.viewers.clear()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Relay one Snake room to many spectators.")
+    parser.add_argument("upstream", help="Room server address, host:port")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=5556)
+    parser.add_argument("--room", default=None, help="Room to relay (any room with players if omitted)")
+    parser.add_argument("--rate", type=float, default=None, help="Updates per second to request upstream")
+    parser.add_argument("--max-clients", type=int, default=4096)
+    args = parser.parse_args(argv)
+
+    upstream_host, _, upstream_port = args.upstream.rpartition(':')
+    relay = Relay(upstream_host, int(upstream_port), args.host, args.port,
+                  room_id=args.room, rate=args.rate, max_clients=args.max_clients)
+    logging.info(f"Relay listening on {args.host}:{args.port}")
+    relay.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
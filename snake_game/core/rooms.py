@@ -0,0 +1,493 @@
+import argparse
+import logging
+import time
+from collections import deque
+from snake_game.core.game import Game
+from snake_game.core.network import Server, ROLE_PLAYER, ROLE_SPECTATOR
+from snake_game.core.session import SessionManager
+from snake_game.core.config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, SESSION_GRACE_PERIOD
+
+DEFAULT_MAX_PLAYERS_PER_ROOM = 4
+DEFAULT_RESTART_DELAY = 3.0 # Seconds a finished match stays on screen before restarting
+DEFAULT_SPECTATOR_RATE = 5   # State updates per second sent to spectators
+
+
+class TickStats:
+    """
+    Rolling statistics over recent tick durations
+    """
+
+    def __init__(self, window=100):
+        """
+        Args:
+            window: Number of recent ticks kept for averages and percentiles
+        """
+        self.durations = deque(maxlen=window)
+        self.count = 0
+        self.max_duration = 0.0
+
+    def record(self, duration):
+        """
+        Record the duration of one tick
+
+        Args:
+            duration: Tick duration in seconds
+        """
+        self.durations.append(duration)
+        self.count += 1
+        self.max_duration = max(self.max_duration, duration)
+
+    def percentile(self, fraction):
+        """
+        Get a percentile of the recent tick durations
+
+        Args:
+            fraction: Percentile as a fraction, e.g. 0.99
+
+        Returns:
+            float: Duration in seconds, 0.0 if nothing was recorded
+        """
+        if not self.durations:
+            return 0.0
+        ordered = sorted(self.durations)
+        index = min(len(ordered) - 1, int(fraction * len(ordered)))
+        return ordered[index]
+
+    def summary(self):
+        """
+        Returns:
+            dict: Tick count and last/average/p99/max durations in milliseconds
+        """
+        last = self.durations[-1] if self.durations else 0.0
+        average = sum(self.durations) / len(self.durations) if self.durations else 0.0
+        return {
+            'ticks': self.count,
+            'last_ms': last * 1000.0,
+            'avg_ms': average * 1000.0,
+            'p99_ms': self.percentile(0.99) * 1000.0,
+            'max_ms': self.max_duration * 1000.0,
+        }
+
+
+class RoomChannel:
+    """
+    One room's view of the shared Server. It offers the calls Game makes on its
+    server_instance, so an unmodified Game can run inside a room.
+    """
+
+    def __init__(self, server, room):
+        self.server = server
+        self.room = room
+        self.inbox = [] # [(client_id, message)] routed to this room since the last tick
+        self.broadcast_count = 0
+
+    def receive_data(self):
+        messages, self.inbox = self.inbox, []
+        return messages
+
+    def broadcast_data(self, data):
+        """
+        Send a state to every player, and to the spectators whose reduced rate is due.
+        Everyone receives the same encoded frame.
+        """
+        frame = self.server.encode(data)
+        if frame is None:
+            return
+        self.broadcast_count += 1
+        recipients = list(self.room.players)
+        final_state = isinstance(data, dict) and data.get('is_game_over')
+        for client_id, interval in self.room.spectators.items():
+            if final_state or self.broadcast_count % interval == 0:
+                recipients.append(client_id)
+        self.server.multicast_frame(recipients, frame)
+
+    def send_to_client(self, client_id, data):
+        if client_id not in self.room.players and client_id not in self.room.spectators:
+            logging.warning(f"Client {client_id} is not in room {self.room.room_id}.")
+            return False
+        return self.server.send_to_client(client_id, data)
+
+    def set_tick(self, tick, tick_rate=None):
+        for client_id in self.room.players:
+            self.server.set_client_tick(client_id, tick)
+
+    def flush(self):
+        pass # The RoomServer flushes once after ticking every room
+
+
+class Room:
+    """
+    A single match: one Game and the connections playing in it
+    """
+
+    def __init__(self, room_id, server, width, height, tick_rate=FPS,
+                 max_players=DEFAULT_MAX_PLAYERS_PER_ROOM, restart_delay=DEFAULT_RESTART_DELAY,
+                 spectator_rate=DEFAULT_SPECTATOR_RATE):
+        """
+        Initialize a room
+
+        Args:
+            room_id: Identifier clients use to join this room
+            server: Shared Server carrying the room's connections
+            width, height: Board dimensions
+            tick_rate: Scheduler ticks per second
+            max_players: Maximum number of players in the room
+            restart_delay: Seconds to wait after game over before restarting the match
+            spectator_rate: Default state updates per second for spectators
+        """
+        self.room_id = room_id
+        self.max_players = max_players
+        self.channel = RoomChannel(server, self)
+        self.game = Game(
+            width,
+            height,
+            player_ids=[],
+            local_player_id=None, # Headless: nobody plays on the server itself
+            is_server=True,
+            server_instance=self.channel,
+            client_instance=None,
+        )
+        self.players = {} # {client_id: player_id}
+        self.spectators = {} # {client_id: send state every this many ticks}
+        self.tick_rate = tick_rate
+        self.spectator_rate = spectator_rate
+        self.player_counter = 0
+        self.restart_ticks = max(1, int(restart_delay * tick_rate))
+        self.game_over_ticks = 0
+        self.tick_stats = TickStats()
+
+    @property
+    def is_full(self):
+        return len(self.players) >= self.max_players
+
+    def add_client(self, client_id):
+        """
+        Add a connection to the room as a new player
+
+        Returns:
+            str: Player ID assigned to the connection
+        """
+        self.player_counter += 1
+        player_id = f"player{self.player_counter}"
+        self.players[client_id] = player_id
+        self.game.add_player(player_id)
+        return player_id
+
+    def add_spectator(self, client_id, rate=None):
+        """
+        Add a connection that watches the room without playing
+
+        Args:
+            client_id: Connection to add
+            rate: State updates per second, capped at the tick rate (room default if None)
+
+        Returns:
+            int: Number of ticks between the states the spectator receives
+        """
+        rate = rate or self.spectator_rate
+        interval = max(1, round(self.tick_rate / max(rate, 1e-3)))
+        self.spectators[client_id] = interval
+        return interval
+
+    @property
+    def is_empty(self):
+        return not self.players and not self.spectators
+
+    def rebind_client(self, old_client_id, new_client_id):
+        """ Move a player's seat to a new connection after a resume. """
+        self.players[new_client_id] = self.players.pop(old_client_id)
+
+    def remove_client(self, client_id):
+        """ Remove a connection and its snake, if it had one, from the room. """
+        self.spectators.pop(client_id, None)
+        player_id = self.players.pop(client_id, None)
+        if player_id:
+            self.game.remove_player(player_id)
+
+    def deliver(self, client_id, message):
+        """ Queue a message from one of the room's clients for the next tick. """
+        if client_id in self.spectators:
+            logging.warning(f"Ignoring message from spectator {client_id} in room {self.room_id}.")
+            return
+        if isinstance(message, dict) and message.get('type') == 'input':
+            # Clients may only steer their own snake
+            message = dict(message, player_id=self.players[client_id])
+        self.channel.inbox.append((client_id, message))
+
+    def tick(self):
+        """ Advance the match by one tick and record how long it took. """
+        start = time.perf_counter()
+        self.game.update()
+        if self.game.is_game_over:
+            self.game_over_ticks += 1
+            if self.game_over_ticks >= self.restart_ticks:
+                self.game.reset()
+                self.game_over_ticks = 0
+        self.tick_stats.record(time.perf_counter() - start)
+
+
+class RoomServer:
+    """
+    Hosts many independent matches on one listening socket. Each connection joins
+    a room by id, and one scheduler ticks every room.
+    """
+
+    def __init__(self, host, port, max_clients=512, tick_rate=FPS, width=SCREEN_WIDTH,
+                 height=SCREEN_HEIGHT, max_players_per_room=DEFAULT_MAX_PLAYERS_PER_ROOM,
+                 restart_delay=DEFAULT_RESTART_DELAY, reuse_port=False,
+                 spectator_rate=DEFAULT_SPECTATOR_RATE, grace_period=SESSION_GRACE_PERIOD):
+        """
+        Initialize the room server
+
+        Args:
+            host, port: Address to listen on (host None to only serve handed-over connections)
+            max_clients: Maximum number of connections across all rooms
+            tick_rate: Ticks per second for every room
+            width, height: Board dimensions for new rooms
+            max_players_per_room: Player limit for each room
+            restart_delay: Seconds between game over and a room's next match
+            reuse_port: Share the port with other processes through SO_REUSEPORT
+            spectator_rate: Default state updates per second for spectators
+            grace_period: Seconds a disconnected player's snake is kept for a resume
+        """
+        self.server = Server(host, port, max_clients=max_clients, reuse_port=reuse_port, coalesce_writes=True)
+        self.tick_rate = tick_rate
+        self.tick_interval = 1.0 / tick_rate
+        self.width = width
+        self.height = height
+        self.max_players_per_room = max_players_per_room
+        self.restart_delay = restart_delay
+        self.spectator_rate = spectator_rate
+        self.rooms = {} # {room_id: Room}
+        self.client_rooms = {} # {client_id: room_id}
+        self.room_prefix = "room" # Prefix for generated room ids
+        self.room_counter = 0
+        self.tick_count = 0
+        self.tick_stats = TickStats() # Cost of ticking all rooms together
+        self.sessions = SessionManager(grace_period)
+
+    def _create_room(self, room_id=None):
+        if room_id is None:
+            self.room_counter += 1
+            room_id = f"{self.room_prefix}_{self.room_counter}"
+        room = Room(room_id, self.server, self.width, self.height, self.tick_rate,
+                    self.max_players_per_room, self.restart_delay, self.spectator_rate)
+        self.rooms[room_id] = room
+        logging.info(f"Created room {room_id}. Active rooms: {len(self.rooms)}")
+        return room
+
+    def _find_open_room(self):
+        for room in self.rooms.values():
+            if not room.is_full:
+                return room
+        return self._create_room()
+
+    def _find_watched_room(self):
+        for room in self.rooms.values():
+            if room.players:
+                return room
+        return self._find_open_room()
+
+    def handle_join(self, client_id, message):
+        """
+        Route a connection to the room named in its join message, or to any open
+        room if it named none, and tell it which player it controls.
+        """
+        if client_id in self.client_rooms:
+            self.handle_leave(client_id)
+
+        spectating = message.get('role') == ROLE_SPECTATOR
+        room_id = message.get('room_id')
+        if room_id is None:
+            room = self._find_watched_room() if spectating else self._find_open_room()
+        else:
+            room = self.rooms.get(room_id) or self._create_room(room_id)
+
+        if spectating:
+            interval = room.add_spectator(client_id, message.get('rate'))
+            self.client_rooms[client_id] = room.room_id
+            self.server.send_to_client(client_id, {
+                'type': 'welcome',
+                'room_id': room.room_id,
+                'player_id': None,
+                'role': ROLE_SPECTATOR,
+                'player_ids': list(room.game.player_ids),
+                'rate': self.tick_rate / interval,
+            })
+            logging.info(f"{client_id} is spectating room {room.room_id}")
+            return room
+
+        if room.is_full:
+            self.server.send_to_client(client_id, {'type': 'join_rejected', 'room_id': room.room_id, 'reason': 'room full'})
+            return None
+
+        player_id = room.add_client(client_id)
+        self.client_rooms[client_id] = room.room_id
+        token = self.sessions.create(client_id, player_id, room_id=room.room_id)
+        self.server.send_to_client(client_id, {
+            'type': 'welcome',
+            'room_id': room.room_id,
+            'player_id': player_id,
+            'role': ROLE_PLAYER,
+            'player_ids': list(room.game.player_ids),
+            'session_token': token,
+        })
+        logging.info(f"{client_id} joined room {room.room_id} as {player_id}")
+        return room
+
+    def handle_resume(self, client_id, message):
+        """
+        Give a reconnecting player its seat back and catch it up from the last state
+        it applied. The connection it replaces, if still open, is closed.
+        """
+        session = self.sessions.resume(message.get('token'), client_id)
+        room = self.rooms.get(session['room_id']) if session else None
+        if room is None or session['previous_client_id'] not in room.players:
+            if session:
+                self.sessions.remove(client_id)
+            self.server.send_to_client(client_id, {'type': 'resume_rejected', 'reason': 'session expired'})
+            return None
+
+        previous_client_id = session['previous_client_id']
+        room.rebind_client(previous_client_id, client_id)
+        del self.client_rooms[previous_client_id]
+        self.client_rooms[client_id] = room.room_id
+        self.server.drop_client(previous_client_id, "replaced by resumed session")
+        room.game.unfreeze_player(session['player_id'])
+
+        resume_state = room.game.get_resume_state(message.get('tick'))
+        resume_state.update(room_id=room.room_id, player_id=session['player_id'], session_token=message['token'])
+        self.server.send_to_client(client_id, resume_state)
+        logging.info(f"{client_id} resumed {session['player_id']} in room {room.room_id}")
+        return room
+
+    def handle_leave(self, client_id):
+        """ Remove a connection from its room, closing the room once it is empty. """
+        self.sessions.remove(client_id)
+        room_id = self.client_rooms.pop(client_id, None)
+        room = self.rooms.get(room_id)
+        if not room:
+            return
+        room.remove_client(client_id)
+        if room.is_empty:
+            del self.rooms[room_id]
+            logging.info(f"Closed empty room {room_id}. Active rooms: {len(self.rooms)}")
+
+    def poll(self):
+        """ Accept connections and route received messages to their rooms. """
+        self.server.accept_connections()
+        for client_id, message in self.server.receive_data():
+            if isinstance(message, dict) and message.get('type') == 'join':
+                self.handle_join(client_id, message)
+            elif isinstance(message, dict) and message.get('type') == 'resume':
+                self.handle_resume(client_id, message)
+            elif client_id in self.client_rooms:
+                self.rooms[self.client_rooms[client_id]].deliver(client_id, message)
+            else:
+                logging.warning(f"Ignoring message from {client_id} before it joined a room.")
+        self.server.flush() # Join replies
+        for client_id in self.server.pop_disconnected():
+            # Players keep their snake, frozen, through the grace period in case they come back
+            session = self.sessions.disconnect(client_id)
+            if session is None:
+                self.handle_leave(client_id)
+            elif session.get('room_id') in self.rooms:
+                self.rooms[session['room_id']].game.freeze_player(session['player_id'])
+        for session in self.sessions.expire():
+            logging.info(f"Session for {session['player_id']} expired.")
+            self.handle_leave(session['client_id'])
+
+    def tick(self):
+        """ Advance every room by one tick. """
+        start = time.perf_counter()
+        self.tick_count += 1
+        self.server.set_tick(self.tick_count, self.tick_rate)
+        for room in list(self.rooms.values()):
+            room.tick()
+        self.server.flush()
+        self.tick_stats.record(time.perf_counter() - start)
+
+    def get_player_count(self):
+        return sum(len(room.players) for room in self.rooms.values())
+
+    def get_room_stats(self):
+        """
+        Get per-room tick cost and player counts
+
+        Returns:
+            dict: {room_id: {'players', 'spectators', 'ticks': int, 'last_ms', 'avg_ms', 'p99_ms', 'max_ms': float}}
+        """
+        stats = {}
+        for room_id, room in self.rooms.items():
+            room_stats = room.tick_stats.summary()
+            room_stats['players'] = len(room.players)
+            room_stats['spectators'] = len(room.spectators)
+            stats[room_id] = room_stats
+        return stats
+
+    def log_stats(self):
+        total = self.tick_stats.summary()
+        players = self.get_player_count()
+        logging.info(
+            f"{len(self.rooms)} rooms, {players} players, tick avg {total['avg_ms']:.2f} ms, "
+            f"p99 {total['p99_ms']:.2f} ms (budget {self.tick_interval * 1000.0:.0f} ms), "
+            f"{self.server.reaped_count} idle clients reaped"
+        )
+        slowest = sorted(self.get_room_stats().items(), key=lambda item: item[1]['avg_ms'], reverse=True)[:3]
+        for room_id, room_stats in slowest:
+            logging.info(f"  {room_id}: {room_stats['players']} players, avg {room_stats['avg_ms']:.3f} ms, max {room_stats['max_ms']:.3f} ms")
+
+    def serve_forever(self, report_interval=10.0):
+        """
+        Run the scheduler: poll the network continuously and tick all rooms at a
+        fixed rate, catching up if a tick ran late.
+        """
+        next_tick = time.perf_counter()
+        next_report = next_tick + report_interval
+        try:
+            while True:
+                self.poll()
+                now = time.perf_counter()
+                if now >= next_tick:
+                    self.tick()
+                    next_tick += self.tick_interval
+                    if now - next_tick > 1.0:
+                        # Far behind (e.g. suspended): skip missed ticks instead of bursting
+                        next_tick = now + self.tick_interval
+                if now >= next_report:
+                    self.log_stats()
+                    next_report = now + report_interval
+                time.sleep(max(0.0, min(0.001, next_tick - time.perf_counter())))
+        except KeyboardInterrupt:
+            logging.info("Room server shutting down...")
+        finally:
+            self.close()
+
+    def close(self):
+        self.server.close()
+        self.rooms.clear()
+        self.client_rooms.clear()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Host many Snake matches in one process.")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=5555)
+    parser.add_argument("--max-clients", type=int, default=512)
+    parser.add_argument("--players-per-room", type=int, default=DEFAULT_MAX_PLAYERS_PER_ROOM)
+    parser.add_argument("--tick-rate", type=int, default=FPS)
+    args = parser.parse_args(argv)
+
+    room_server = RoomServer(
+        args.host,
+        args.port,
+        max_clients=args.max_clients,
+        tick_rate=args.tick_rate,
+        max_players_per_room=args.players_per_room,
+    )
+    logging.info(f"Room server listening on {args.host}:{args.port}")
+    room_server.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
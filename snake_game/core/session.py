@@ -0,0 +1,102 @@
+import secrets
+import time
+from snake_game.core.config import SESSION_GRACE_PERIOD
+
+
+class SessionManager:
+    """
+    Session tokens for reconnecting players. A token is issued when a player joins;
+    if the connection drops, the player's seat is held for a grace period during
+    which a new connection presenting the token takes it over.
+    """
+
+    def __init__(self, grace_period=SESSION_GRACE_PERIOD):
+        """
+        Args:
+            grace_period: Seconds a disconnected session can still be resumed
+        """
+        self.grace_period = grace_period
+        self.sessions = {} # {token: {'client_id', 'player_id', 'expires', ...}}
+        self.client_tokens = {} # {client_id: token} for connected and waiting sessions
+
+    def create(self, client_id, player_id, **info):
+        """
+        Issue a token for a newly joined player
+
+        Args:
+            client_id: Network id of the player's connection
+            player_id: Player the token resumes
+            info: Extra fields to keep with the session, e.g. room_id
+
+        Returns:
+            str: The session token
+        """
+        token = secrets.token_urlsafe(16)
+        self.sessions[token] = dict(info, client_id=client_id, player_id=player_id, expires=None)
+        self.client_tokens[client_id] = token
+        return token
+
+    def get(self, client_id):
+        token = self.client_tokens.get(client_id)
+        return self.sessions.get(token) if token else None
+
+    def disconnect(self, client_id, now=None):
+        """
+        Start the grace period for a dropped connection
+
+        Returns:
+            dict: The session now waiting for a resume, or None if the connection had none
+        """
+        session = self.get(client_id)
+        if session is None:
+            return None
+        session['expires'] = (now if now is not None else time.monotonic()) + self.grace_period
+        return session
+
+    def resume(self, token, client_id, now=None):
+        """
+        Move a session onto a new connection
+
+        Args:
+            token: Token presented by the reconnecting client
+            client_id: Network id of the new connection
+
+        Returns:
+            dict: Copy of the session with 'previous_client_id' set to the connection it
+                replaced, or None if the token is unknown or expired
+        """
+        session = self.sessions.get(token)
+        now = now if now is not None else time.monotonic()
+        if session is None or (session['expires'] is not None and now >= session['expires']):
+            return None
+        previous_client_id = session['client_id']
+        if self.client_tokens.get(previous_client_id) == token:
+            del self.client_tokens[previous_client_id]
+        session['client_id'] = client_id
+        session['expires'] = None
+        self.client_tokens[client_id] = token
+        return dict(session, previous_client_id=previous_client_id)
+
+    def expire(self, now=None):
+        """
+        Drop sessions whose grace period has run out
+
+        Returns:
+            list: The expired sessions
+        """
+        now = now if now is not None else time.monotonic()
+        expired = [token for token, session in self.sessions.items()
+                   if session['expires'] is not None and now >= session['expires']]
+        return [self._drop(token) for token in expired]
+
+    def remove(self, client_id):
+        """ Forget a connection's session, e.g. when the player leaves on purpose. """
+        token = self.client_tokens.get(client_id)
+        if token:
+            self._drop(token)
+
+    def _drop(self, token):
+        session = self.sessions.pop(token)
+        if self.client_tokens.get(session['client_id']) == token:
+            del self.client_tokens[session['client_id']]
+        return session
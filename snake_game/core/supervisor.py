@@ -0,0 +1,339 @@
+import argparse
+import logging
+import multiprocessing
+import os
+import pickle
+import socket
+import time
+from snake_game.core.network import Server
+from snake_game.core.rooms import RoomServer, DEFAULT_MAX_PLAYERS_PER_ROOM
+from snake_game.core.config import FPS
+
+METRICS_INTERVAL = 1.0   # Seconds between worker metrics reports
+HEALTH_TIMEOUT = 5.0     # A worker silent for this long is considered unhealthy
+CONTROL_MESSAGE_SIZE = 65536
+MODE_LOBBY = "lobby"         # Supervisor accepts connections and hands them to workers
+MODE_REUSEPORT = "reuseport" # Workers share the port and the kernel spreads connections
+
+
+class WorkerRoomServer(RoomServer):
+    """
+    RoomServer running in a worker process. Besides its own sockets it receives
+    handed-over connections from the supervisor and reports metrics back to it.
+    """
+
+    def __init__(self, worker_index, control_sock, host=None, port=0, **room_server_args):
+        """
+        Args:
+            worker_index: Position of this worker in the supervisor's worker list
+            control_sock: SOCK_SEQPACKET socket connected to the supervisor
+            host, port: Address to listen on in reuseport mode, host None in lobby mode
+            room_server_args: Passed through to RoomServer
+        """
+        super().__init__(host, port, reuse_port=host is not None, **room_server_args)
+        self.worker_index = worker_index
+        self.control_sock = control_sock
+        self.control_sock.setblocking(False)
+        self.room_prefix = f"w{worker_index}_room"
+        self.last_metrics_time = 0.0
+
+    def _receive_handoffs(self):
+        """ Adopt connections the supervisor passed over the control socket. """
+        while True:
+            try:
+                data, fds, _flags, _addr = socket.recv_fds(self.control_sock, CONTROL_MESSAGE_SIZE, 1)
+            except BlockingIOError:
+                return
+            if not data:
+                raise ConnectionError("Supervisor closed the control socket")
+            handoff = pickle.loads(data)
+            if not fds:
+                continue
+            conn = socket.socket(fileno=fds[0])
+            client_id = self.server.attach_client(conn, handoff['addr'], handoff['buffer'])
+            if handoff['join'].get('type') == 'resume':
+                self.handle_resume(client_id, handoff['join'])
+            else:
+                self.handle_join(client_id, handoff['join'])
+
+    def _send_metrics(self):
+        metrics = {
+            'type': 'metrics',
+            'worker': self.worker_index,
+            'pid': os.getpid(),
+            'rooms': {room_id: len(room.players) for room_id, room in self.rooms.items()},
+            'players': self.get_player_count(),
+            'connections': len(self.server.clients),
+            'reaped': self.server.reaped_count,
+            'memory': self.server.get_memory_stats(),
+            'tick': self.tick_stats.summary(),
+        }
+        try:
+            self.control_sock.send(pickle.dumps(metrics))
+        except BlockingIOError:
+            pass # Supervisor is busy; the next report carries fresher numbers anyway
+
+    def poll(self):
+        self._receive_handoffs()
+        super().poll()
+        now = time.monotonic()
+        if now - self.last_metrics_time >= METRICS_INTERVAL:
+            self._send_metrics()
+            self.last_metrics_time = now
+
+
+def _worker_main(worker_index, control_sock, host, port, room_server_args, inherited_fds=()):
+    """ Entry point of a worker process. """
+    # A forked worker must not keep the supervisor's other sockets open, or
+    # closing them in the supervisor would never reach their peers
+    for fd in inherited_fds:
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+    try:
+        worker = WorkerRoomServer(worker_index, control_sock, host, port, **room_server_args)
+    except OSError as e:
+        logging.error(f"Worker {worker_index} failed to start: {e}")
+        return
+    logging.info(f"Worker {worker_index} started (pid {os.getpid()})")
+    try:
+        worker.serve_forever(report_interval=float('inf'))
+    except ConnectionError as e:
+        logging.info(f"Worker {worker_index} stopping: {e}")
+
+
+class Supervisor:
+    """
+    Runs room servers in several worker processes so hosting scales past one core.
+
+    In lobby mode the supervisor owns the listening socket. It reads each
+    connection's join message, picks a worker (the one already hosting the room,
+    else the least loaded) and passes the socket to it. In reuseport mode every
+    worker listens on the same port through SO_REUSEPORT and the kernel spreads
+    connections; players asking for the same room id may then end up on
+    different workers.
+    """
+
+    def __init__(self, host, port, workers=None, mode=MODE_LOBBY, **room_server_args):
+        """
+        Args:
+            host, port: Public address of the server
+            workers: Number of worker processes (defaults to the CPU count)
+            mode: MODE_LOBBY or MODE_REUSEPORT
+            room_server_args: Passed to each worker's RoomServer
+        """
+        if mode == MODE_REUSEPORT and not hasattr(socket, "SO_REUSEPORT"):
+            raise ValueError("SO_REUSEPORT is not available on this platform")
+        if mode == MODE_LOBBY and not hasattr(socket, "send_fds"):
+            raise ValueError("Passing sockets between processes is not available on this platform")
+        self.host = host
+        self.port = port
+        self.worker_count = workers or os.cpu_count() or 1
+        self.mode = mode
+        self.room_server_args = room_server_args
+        self.workers = [] # [{'process', 'control', 'metrics', 'last_report', 'pending'}]
+        self.room_assignments = {} # {room_id: worker index}
+        self.lobby = None
+        if mode == MODE_LOBBY:
+            # Large client limit: connections only wait here until they send a join.
+            # One frame per read, so whatever follows a join or resume stays in the
+            # socket for the worker it is handed to.
+            self.lobby = Server(host, port, max_clients=4096, max_frames_per_read=1)
+            self.port = self.lobby.socket.getsockname()[1]
+        # Fork where possible so workers start quickly and inherit the imported modules
+        methods = multiprocessing.get_all_start_methods()
+        self.context = multiprocessing.get_context("fork" if "fork" in methods else None)
+
+    def start(self):
+        """ Start all worker processes. """
+        for index in range(self.worker_count):
+            self.workers.append(self._spawn_worker(index))
+
+    def _spawn_worker(self, index):
+        parent_sock, child_sock = socket.socketpair(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+        worker_host = self.host if self.mode == MODE_REUSEPORT else None
+        inherited_fds = []
+        if self.context.get_start_method() == "fork":
+            inherited_fds = [parent_sock.fileno()] + [worker['control'].fileno() for worker in self.workers]
+            if self.lobby:
+                inherited_fds.append(self.lobby.socket.fileno())
+                inherited_fds.extend(sock.fileno() for sock in self.lobby.clients)
+        process = self.context.Process(
+            target=_worker_main,
+            args=(index, child_sock, worker_host, self.port, self.room_server_args, inherited_fds),
+            daemon=True,
+        )
+        process.start()
+        child_sock.close()
+        parent_sock.setblocking(False)
+        logging.info(f"Started worker {index} (pid {process.pid})")
+        return {
+            'process': process,
+            'control': parent_sock,
+            'metrics': None,
+            'last_report': time.monotonic(),
+            'pending': 0, # Connections handed over since the last metrics report
+        }
+
+    def _worker_load(self, index):
+        worker = self.workers[index]
+        reported = worker['metrics']['players'] if worker['metrics'] else 0
+        return reported + worker['pending']
+
+    def _choose_worker(self, room_id):
+        """ Keep a room on the worker that hosts it, otherwise use the least loaded healthy worker. """
+        if room_id is not None and room_id in self.room_assignments:
+            return self.room_assignments[room_id]
+        candidates = [i for i in range(len(self.workers)) if self.is_worker_healthy(i)] or list(range(len(self.workers)))
+        return min(candidates, key=self._worker_load)
+
+    def _hand_off(self, client_id, join_message):
+        room_id = join_message.get('room_id')
+        index = self._choose_worker(room_id)
+        detached = self.lobby.detach_client(client_id)
+        if detached is None:
+            return
+        conn, addr, recv_buffer = detached
+        handoff = {'addr': addr, 'join': join_message, 'buffer': recv_buffer}
+        try:
+            socket.send_fds(self.workers[index]['control'], [pickle.dumps(handoff)], [conn.fileno()])
+        except OSError as e:
+            logging.error(f"Failed to hand {client_id} to worker {index}: {e}")
+        else:
+            self.workers[index]['pending'] += 1
+            if room_id is not None:
+                self.room_assignments[room_id] = index
+        finally:
+            conn.close() # The worker holds its own duplicate of the descriptor
+
+    def _poll_lobby(self):
+        self.lobby.accept_connections()
+        for client_id, message in self.lobby.receive_data():
+            # Resumes carry their room id, so they reach the worker holding the session
+            if isinstance(message, dict) and message.get('type') in ('join', 'resume'):
+                self._hand_off(client_id, message)
+        self.lobby.pop_disconnected()
+        self.lobby.flush() # Heartbeats for connections still waiting to join
+
+    def _poll_workers(self):
+        for index, worker in enumerate(self.workers):
+            while True:
+                try:
+                    data = worker['control'].recv(CONTROL_MESSAGE_SIZE)
+                except BlockingIOError:
+                    break
+                except OSError:
+                    data = b''
+                if not data:
+                    break
+                metrics = pickle.loads(data)
+                worker['metrics'] = metrics
+                worker['last_report'] = time.monotonic()
+                worker['pending'] = 0
+                # Forget assignments for rooms the worker has closed
+                for room_id, assigned in list(self.room_assignments.items()):
+                    if assigned == index and room_id not in metrics['rooms']:
+                        del self.room_assignments[room_id]
+
+            if not worker['process'].is_alive():
+                logging.error(f"Worker {index} (pid {worker['process'].pid}) died, restarting it.")
+                worker['control'].close()
+                for room_id, assigned in list(self.room_assignments.items()):
+                    if assigned == index:
+                        del self.room_assignments[room_id]
+                self.workers[index] = self._spawn_worker(index)
+
+    def poll(self):
+        """ Hand over waiting connections and collect worker reports. """
+        if self.lobby:
+            self._poll_lobby()
+        self._poll_workers()
+
+    def is_worker_healthy(self, index):
+        worker = self.workers[index]
+        return worker['process'].is_alive() and time.monotonic() - worker['last_report'] < HEALTH_TIMEOUT
+
+    def get_metrics(self):
+        """
+        Aggregate the latest reports of all workers
+
+        Returns:
+            dict: Totals plus a per-worker breakdown
+        """
+        per_worker = []
+        for index, worker in enumerate(self.workers):
+            metrics = worker['metrics'] or {}
+            per_worker.append({
+                'worker': index,
+                'pid': worker['process'].pid,
+                'healthy': self.is_worker_healthy(index),
+                'rooms': len(metrics.get('rooms', {})),
+                'players': metrics.get('players', 0),
+                'tick_avg_ms': metrics.get('tick', {}).get('avg_ms', 0.0),
+                'tick_p99_ms': metrics.get('tick', {}).get('p99_ms', 0.0),
+            })
+        return {
+            'workers': len(self.workers),
+            'healthy_workers': sum(1 for worker in per_worker if worker['healthy']),
+            'rooms': sum(worker['rooms'] for worker in per_worker),
+            'players': sum(worker['players'] for worker in per_worker),
+            'worst_tick_p99_ms': max((worker['tick_p99_ms'] for worker in per_worker), default=0.0),
+            'per_worker': per_worker,
+        }
+
+    def serve_forever(self, report_interval=10.0):
+        self.start()
+        next_report = time.monotonic() + report_interval
+        try:
+            while True:
+                self.poll()
+                if time.monotonic() >= next_report:
+                    metrics = self.get_metrics()
+                    logging.info(
+                        f"{metrics['healthy_workers']}/{metrics['workers']} workers healthy, "
+                        f"{metrics['rooms']} rooms, {metrics['players']} players, "
+                        f"worst tick p99 {metrics['worst_tick_p99_ms']:.2f} ms"
+                    )
+                    next_report = time.monotonic() + report_interval
+                time.sleep(0.001)
+        except KeyboardInterrupt:
+            logging.info("Supervisor shutting down...")
+        finally:
+            self.close()
+
+    def close(self):
+        for worker in self.workers:
+            worker['control'].close() # Workers exit when their control socket closes
+            worker['process'].join(timeout=2.0)
+            if worker['process'].is_alive():
+                worker['process'].terminate()
+        self.workers = []
+        if self.lobby:
+            self.lobby.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Host Snake rooms across several worker processes.")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=5555)
+    parser.add_argument("--workers", type=int, default=None, help="defaults to the CPU count")
+    parser.add_argument("--mode", choices=[MODE_LOBBY, MODE_REUSEPORT], default=MODE_LOBBY)
+    parser.add_argument("--players-per-room", type=int, default=DEFAULT_MAX_PLAYERS_PER_ROOM)
+    parser.add_argument("--tick-rate", type=int, default=FPS)
+    args = parser.parse_args(argv)
+
+    supervisor = Supervisor(
+        args.host,
+        args.port,
+        workers=args.workers,
+        mode=args.mode,
+        tick_rate=args.tick_rate,
+        max_players_per_room=args.players_per_room,
+    )
+    logging.info(f"Supervisor listening on {args.host}:{supervisor.port} in {args.mode} mode")
+    supervisor.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
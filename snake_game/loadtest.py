@@ -0,0 +1,336 @@
+"""
+Local load test for the room server.
+
+Starts a RoomServer in a separate process and ramps up headless bot clients over
+loopback, reporting tick cost, input-to-ack latency and bandwidth at each step
+until the server starts missing its tick deadline.
+
+    python -m snake_game.loadtest --clients 400 --step 50
+"""
+import argparse
+import logging
+import multiprocessing
+import random
+import threading
+import time
+from snake_game.core.config import FPS, UP, DOWN, LEFT, RIGHT
+from snake_game.core.network import Client
+from snake_game.core.rooms import RoomServer, TickStats
+
+DIRECTIONS = (UP, DOWN, LEFT, RIGHT)
+OPPOSITES = {UP: DOWN, DOWN: UP, LEFT: RIGHT, RIGHT: LEFT}
+TICK_AHEAD = 1000 # Bots number inputs this far past the last ack, see Bot._send_input
+MISSED_TICK_RATIO = 0.01 # Fraction of late ticks at which a level counts as over capacity
+
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class Bot:
+    """
+    A headless player: joins any open room and steers at random at a set input rate
+    """
+
+    def __init__(self, host, port, input_rate, rng):
+        """
+        Args:
+            host, port: Server address
+            input_rate: Average direction changes per second
+            rng: random.Random used for this bot's decisions
+        """
+        self.client = Client(host, port, coalesce_writes=True)
+        self.input_rate = input_rate
+        self.rng = rng
+        self.player_id = None
+        self.direction = RIGHT
+        self.next_input_time = 0.0
+        self.last_ack = 0
+        self.last_sent_tick = 0
+        self.pending_inputs = {} # {tick: send time}
+        self.latencies = []      # Seconds from sending an input to the first state reflecting it
+        self.states_received = 0
+
+    def connect(self):
+        if not self.client.connect():
+            return False
+        self.client.join_room()
+        return self.client.flush()
+
+    def _schedule_next_input(self, now):
+        self.next_input_time = now + self.rng.expovariate(self.input_rate)
+
+    def _send_input(self, now):
+        choices = [d for d in DIRECTIONS if d != OPPOSITES[self.direction] and d != self.direction]
+        self.direction = self.rng.choice(choices)
+        # The server maps a client's tick numbers onto its own with max(), so jumping
+        # well past the last ack means only the state that applied this input can ack it
+        tick = max(self.last_ack, self.last_sent_tick) + TICK_AHEAD
+        self.last_sent_tick = tick
+        self.pending_inputs[tick] = now
+        self.client.send_data({'type': 'input', 'player_id': self.player_id, 'direction': self.direction, 'tick': tick})
+
+    def _handle_message(self, message, now):
+        if not isinstance(message, dict):
+            return
+        message_type = message.get('type')
+        if message_type == 'welcome':
+            self.player_id = message['player_id']
+            self._schedule_next_input(now)
+        elif message_type is None and 'snakes' in message:
+            self.states_received += 1
+            ack = message.get('input_acks', {}).get(self.player_id)
+            if ack is None:
+                return
+            self.last_ack = ack
+            for tick in [tick for tick in self.pending_inputs if tick <= ack]:
+                self.latencies.append(now - self.pending_inputs.pop(tick))
+
+    def step(self, now):
+        """
+        Read everything that arrived, send an input if one is due
+
+        Returns:
+            bool: False once the connection is lost
+        """
+        if not self.client.connected:
+            return False
+        message = self.client.receive_data()
+        while message is not None and message is not False:
+            self._handle_message(message, now)
+            message = self.client.receive_data()
+        if message is False:
+            return False
+        if self.player_id and now >= self.next_input_time:
+            self._send_input(now)
+            self._schedule_next_input(now)
+        return self.client.flush()
+
+    def close(self):
+        self.client.close()
+
+
+class BotGroup(threading.Thread):
+    """
+    Drives a share of the bots from one thread
+    """
+
+    def __init__(self, stop_event):
+        super().__init__(daemon=True)
+        self.stop_event = stop_event
+        self.bots = []
+        self.lock = threading.Lock()
+        self.disconnects = 0
+
+    def add(self, bot):
+        with self.lock:
+            self.bots.append(bot)
+
+    def collect_latencies(self):
+        with self.lock:
+            latencies = []
+            for bot in self.bots:
+                latencies.extend(bot.latencies)
+                bot.latencies = []
+            return latencies
+
+    def run(self):
+        while not self.stop_event.is_set():
+            now = time.perf_counter()
+            with self.lock:
+                for bot in list(self.bots):
+                    if not bot.step(now):
+                        self.bots.remove(bot)
+                        self.disconnects += 1
+            time.sleep(0.001)
+        with self.lock:
+            for bot in self.bots:
+                bot.close()
+
+
+def _serve(conn, tick_rate, players_per_room, max_clients):
+    """
+    Server process: run a RoomServer and answer 'report' requests from the
+    load test with statistics for the ticks since the previous report.
+    """
+    logging.getLogger().setLevel(logging.WARNING)
+    room_server = RoomServer("127.0.0.1", 0, max_clients=max_clients, tick_rate=tick_rate,
+                             max_players_per_room=players_per_room, restart_delay=0.5)
+    conn.send(room_server.server.socket.getsockname()[1])
+
+    tick_interval = 1.0 / tick_rate
+    window = TickStats(window=tick_rate * 600)
+    missed = 0
+    io_start = dict(room_server.server.total_io)
+    next_tick = time.perf_counter()
+    try:
+        while True:
+            if conn.poll():
+                command = conn.recv()
+                if command == 'stop':
+                    break
+                io_total = room_server.server.total_io
+                conn.send({
+                    'ticks': window.summary(),
+                    'p50_ms': window.percentile(0.5) * 1000.0,
+                    'missed': missed,
+                    'bytes_sent': io_total['bytes_sent'] - io_start['bytes_sent'],
+                    'syscalls': io_total['syscalls'] - io_start['syscalls'],
+                    'players': room_server.get_player_count(),
+                    'rooms': len(room_server.rooms),
+                })
+                window = TickStats(window=tick_rate * 600)
+                missed = 0
+                io_start = dict(io_total)
+
+            room_server.poll()
+            now = time.perf_counter()
+            if now >= next_tick:
+                room_server.tick()
+                window.record(room_server.tick_stats.durations[-1])
+                if time.perf_counter() - next_tick > tick_interval:
+                    missed += 1 # Finished after the next tick was already due
+                next_tick += tick_interval
+                if now - next_tick > 1.0:
+                    next_tick = now + tick_interval
+            time.sleep(max(0.0, min(0.001, next_tick - time.perf_counter())))
+    finally:
+        room_server.close()
+
+
+def run_load_test(clients, step, duration, input_rate, tick_rate=FPS, players_per_room=4,
+                  bot_threads=4, warmup=1.0, seed=0, on_result=None):
+    """
+    Ramp up bots in steps and measure the server at each level
+
+    Args:
+        clients: Maximum number of bots
+        step: Bots added per level
+        duration: Seconds measured at each level
+        input_rate: Direction changes per second per bot
+        tick_rate: Server ticks per second
+        players_per_room: Room size on the server
+        bot_threads: Threads sharing the bots
+        warmup: Seconds to let new bots join before measuring
+        seed: Seed for the bots' random decisions
+        on_result: Called with each level's result dict as soon as it is measured
+
+    Returns:
+        tuple: (list of per-level result dicts, player count at which the server
+            first missed its deadline or None)
+    """
+    parent_conn, child_conn = multiprocessing.Pipe()
+    server_process = multiprocessing.Process(
+        target=_serve, args=(child_conn, tick_rate, players_per_room, clients + 16), daemon=True
+    )
+    server_process.start()
+    port = parent_conn.recv()
+
+    stop_event = threading.Event()
+    groups = [BotGroup(stop_event) for _ in range(bot_threads)]
+    for group in groups:
+        group.start()
+
+    rng = random.Random(seed)
+    results = []
+    capacity = None
+    bot_count = 0
+    try:
+        while bot_count < clients:
+            for _ in range(min(step, clients - bot_count)):
+                bot = Bot("127.0.0.1", port, input_rate, random.Random(rng.random()))
+                if bot.connect():
+                    groups[bot_count % len(groups)].add(bot)
+                    bot_count += 1
+                else:
+                    logging.warning("Bot failed to connect")
+            time.sleep(warmup)
+
+            for group in groups:
+                group.collect_latencies() # Discard joins and warmup
+            parent_conn.send('report')
+            parent_conn.recv()
+            time.sleep(duration)
+            parent_conn.send('report')
+            server_stats = parent_conn.recv()
+
+            latencies = []
+            for group in groups:
+                latencies.extend(group.collect_latencies())
+            ticks = server_stats['ticks']['ticks']
+            players = server_stats['players']
+            result = {
+                'bots': bot_count,
+                'players': players,
+                'rooms': server_stats['rooms'],
+                'tick_p50_ms': server_stats['p50_ms'],
+                'tick_p99_ms': server_stats['ticks']['p99_ms'],
+                'tick_max_ms': server_stats['ticks']['max_ms'],
+                'missed': server_stats['missed'],
+                'ticks': ticks,
+                'ack_p50_ms': percentile(latencies, 0.5) * 1000.0,
+                'ack_p99_ms': percentile(latencies, 0.99) * 1000.0,
+                'kbps_per_client': server_stats['bytes_sent'] * 8 / 1000.0 / duration / max(1, players),
+                'writes_per_tick': server_stats['syscalls'] / max(1, ticks),
+                'disconnects': sum(group.disconnects for group in groups),
+            }
+            results.append(result)
+            if on_result:
+                on_result(result)
+
+            if ticks and server_stats['missed'] / ticks > MISSED_TICK_RATIO:
+                capacity = players
+                break
+    finally:
+        stop_event.set()
+        for group in groups:
+            group.join(timeout=2.0)
+        parent_conn.send('stop')
+        server_process.join(timeout=5.0)
+        if server_process.is_alive():
+            server_process.terminate()
+    return results, capacity
+
+
+def _print_row(result):
+    print(
+        f"{result['bots']:>5} {result['players']:>7} {result['rooms']:>5} "
+        f"{result['tick_p50_ms']:>8.2f} {result['tick_p99_ms']:>8.2f} {result['tick_max_ms']:>8.2f} "
+        f"{result['missed']:>6}/{result['ticks']:<5} {result['ack_p50_ms']:>8.1f} {result['ack_p99_ms']:>8.1f} "
+        f"{result['kbps_per_client']:>9.1f} {result['writes_per_tick']:>8.1f}",
+        flush=True,
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test the room server with simulated clients.")
+    parser.add_argument("--clients", type=int, default=200, help="Maximum number of bots")
+    parser.add_argument("--step", type=int, default=25, help="Bots added per level")
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds measured per level")
+    parser.add_argument("--input-rate", type=float, default=3.0, help="Inputs per second per bot")
+    parser.add_argument("--tick-rate", type=int, default=FPS)
+    parser.add_argument("--players-per-room", type=int, default=4)
+    parser.add_argument("--bot-threads", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    logging.getLogger().setLevel(logging.WARNING)
+
+    print(f"Tick budget {1000.0 / args.tick_rate:.1f} ms at {args.tick_rate} ticks/s")
+    print(f"{'bots':>5} {'players':>7} {'rooms':>5} {'tick p50':>8} {'tick p99':>8} {'tick max':>8} "
+          f"{'missed':>12} {'ack p50':>8} {'ack p99':>8} {'kbit/s/cl':>9} {'writes/t':>8}")
+    _, capacity = run_load_test(
+        args.clients, args.step, args.duration, args.input_rate, tick_rate=args.tick_rate,
+        players_per_room=args.players_per_room, bot_threads=args.bot_threads, seed=args.seed,
+        on_result=_print_row,
+    )
+    if capacity is None:
+        print(f"No missed deadlines up to {args.clients} clients")
+    else:
+        print(f"Server missed its tick deadline at {capacity} players")
+
+
+if __name__ == '__main__':
+    main()
@@ -30,6 +30,23 @@ class TestButton(unittest.TestCase):
         button.action()
         self.assertTrue(action_called)
 
+    def test_draw_reuses_baked_surfaces(self):
+        button = Button(100, 200, 200, 50, "Play")
+        button.draw(self.screen)
+        surfaces = button._surfaces
+        button.hovered = True
+        button.draw(self.screen)
+        self.assertIs(button._surfaces, surfaces)
+        self.assertEqual(surfaces['hovered'].get_at((100, 40))[:3], (80, 180, 80))
+
+    def test_text_change_rebakes(self):
+        button = Button(100, 200, 200, 50, "Play")
+        button.draw(self.screen)
+        surfaces = button._surfaces
+        button.text = "Stop"
+        button.draw(self.screen)
+        self.assertIsNot(button._surfaces, surfaces)
+
 
 
 
@@ -61,6 +78,16 @@ class TestPanel(unittest.TestCase):
         # Just verify it doesn't throw an exception
         # Testing the actual render would require more complex pixel inspection
 
+    def test_size_change_rebakes(self):
+        panel = Panel(50, 50, 300, 200)
+        panel.draw(self.screen)
+        baked = panel._surface
+        panel.draw(self.screen)
+        self.assertIs(panel._surface, baked)
+        panel.rect.width = 400
+        panel.draw(self.screen)
+        self.assertEqual(panel._surface.get_width(), 400)
+
 
 class TestScoreDisplay(unittest.TestCase):
     def setUp(self):
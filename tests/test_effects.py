@@ -1,6 +1,6 @@
 import unittest
 import pygame
-from ui.effects import Particle, ParticleSystem, AnimationManager
+from ui.effects import Particle, ParticleSystem, ScrollingGrid, AnimationManager
 
 
 class TestParticle(unittest.TestCase):
@@ -50,6 +50,41 @@ class TestParticleSystem(unittest.TestCase):
         ps.add_explosion(400, 300, count=10)
         self.assertEqual(len(ps.particles), 10)
 
+    def test_max_particles(self):
+        ps = ParticleSystem(800, 600)
+        ps.add_explosion(400, 300, count=30)
+        ps.set_max_particles(5)
+        self.assertEqual(len(ps.particles), 5)
+        ps.add_explosion(400, 300, count=10)
+        self.assertEqual(len(ps.particles), 5)
+        ps.set_max_particles(None)
+        ps.add_explosion(400, 300, count=10)
+        self.assertEqual(len(ps.particles), 15)
+
+
+
+class TestScrollingGrid(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_matches_lines_drawn_per_frame(self):
+        grid = ScrollingGrid(200, 120)
+        for offset in (0, 7.6, 39.9):
+            expected = pygame.Surface((200, 120))
+            expected.fill((5, 5, 30))
+            for x in range(-40 + int(offset), 200, 40):
+                pygame.draw.line(expected, (20, 20, 50), (x, 0), (x, 120))
+            for y in range(-40 + int(offset), 120, 40):
+                pygame.draw.line(expected, (20, 20, 50), (0, y), (200, y))
+
+            actual = pygame.Surface((200, 120))
+            rect = grid.draw(actual, offset)
+            self.assertEqual(rect, actual.get_rect())
+            self.assertEqual(pygame.image.tostring(actual, "RGB"), pygame.image.tostring(expected, "RGB"))
+
 
 
 class TestAnimationManager(unittest.TestCase):
@@ -0,0 +1,43 @@
+import unittest
+from ui.frame_budget import FrameBudget, DEGRADE_FRAMES, RESTORE_FRAMES, QUALITY_FEATURES
+
+
+class TestFrameBudget(unittest.TestCase):
+    def setUp(self):
+        self.budget = FrameBudget(budget=0.016)
+
+    def run_frames(self, frames, update_seconds, render_seconds=0.0):
+        changes = 0
+        for _ in range(frames):
+            changes += self.budget.record(update_seconds, render_seconds)
+        return changes
+
+    def test_full_quality_within_budget(self):
+        self.assertEqual(self.run_frames(200, 0.004, 0.004), 0)
+        self.assertTrue(all(self.budget.quality.values()))
+
+    def test_degrades_in_order(self):
+        self.run_frames(DEGRADE_FRAMES, 0.010, 0.020)
+        self.assertEqual(self.budget.get_stats()['disabled'], ["glow"])
+        self.run_frames(DEGRADE_FRAMES * 10, 0.010, 0.020)
+        quality = self.budget.quality
+        self.assertEqual([feature for feature in QUALITY_FEATURES if not quality[feature]], list(QUALITY_FEATURES))
+
+    def test_brief_spike_does_not_degrade(self):
+        self.run_frames(100, 0.004)
+        self.run_frames(3, 0.100)
+        self.run_frames(100, 0.004)
+        self.assertTrue(all(self.budget.quality.values()))
+
+    def test_restores_after_sustained_headroom(self):
+        self.run_frames(DEGRADE_FRAMES * 2, 0.030)
+        self.assertEqual(self.budget.level, 2)
+        # Frames just under budget are not enough headroom
+        self.run_frames(RESTORE_FRAMES * 2, 0.015)
+        self.assertEqual(self.budget.level, 2)
+        self.run_frames(RESTORE_FRAMES * 2 + 50, 0.002)
+        self.assertEqual(self.budget.level, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
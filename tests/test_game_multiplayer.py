@@ -1,3 +1,4 @@
+import copy
 import unittest
 from unittest.mock import MagicMock
 from snake_game.core.game import Game
@@ -73,8 +74,66 @@ class TestGameMultiplayer(unittest.TestCase):
         self.assertNotEqual(initial_direction, UP) # Assuming initial direction is not UP
 
         game.handle_input(self.player1_id, UP)
+        game.update() # Queued turns are applied at the start of the next tick
         self.assertEqual(game.snakes[self.player1_id].direction, UP)
 
+    def test_server_reports_its_tick_rate(self):
+        """Test the server's clock sync uses the game's tick rate, e.g. in classic mode."""
+        game = self.create_server_game(player_ids=[self.player1_id])
+        game.tick_rate = 12
+        self.mock_server_instance.receive_data.return_value = []
+        game.update()
+        self.mock_server_instance.set_tick.assert_called_with(1, 12)
+
+    def test_server_applies_one_queued_turn_per_tick(self):
+        """Test two turns received in one tick are applied on consecutive ticks."""
+        game = self.create_server_game(player_ids=self.player_ids)
+        snake = game.snakes[self.player2_id]
+        snake.direction = RIGHT
+        start = snake.get_head_position()
+        self.mock_server_instance.receive_data.return_value = [
+            ("net_p2", {'type': 'input', 'player_id': self.player2_id, 'direction': UP, 'tick': 1}),
+            ("net_p2", {'type': 'input', 'player_id': self.player2_id, 'direction': LEFT, 'tick': 2}),
+        ]
+
+        game.update()
+        self.assertEqual(snake.direction, UP)
+        self.assertEqual(snake.get_head_position(), (start[0], start[1] - GRID_SIZE))
+
+        self.mock_server_instance.receive_data.return_value = []
+        game.update()
+        self.assertEqual(snake.direction, LEFT)
+        self.assertEqual(snake.get_head_position(), (start[0] - GRID_SIZE, start[1] - GRID_SIZE))
+        self.assertEqual(game._get_serializable_game_state()['input_acks'][self.player2_id], 2)
+
+    def test_server_rejects_reversal(self):
+        """Test a 180-degree turn is dropped instead of killing the snake."""
+        game = self.create_server_game(player_ids=self.player_ids)
+        snake = game.snakes[self.player2_id]
+        snake.direction = RIGHT
+        self.mock_server_instance.receive_data.return_value = [
+            ("net_p2", {'type': 'input', 'player_id': self.player2_id, 'direction': LEFT, 'tick': 1}),
+        ]
+
+        game.update()
+        self.assertEqual(snake.direction, RIGHT)
+        self.assertFalse(snake.is_dead)
+        self.assertEqual(game.input_queues[self.player2_id].rejected['invalid'], 1)
+
+    def test_client_queues_second_turn_for_next_tick(self):
+        """Test a quick second turn is tagged for the tick after the first."""
+        game = self.create_client_game(local_player_id=self.player1_id, all_player_ids=self.player_ids)
+        game.snakes[self.player1_id].direction = RIGHT
+
+        game.handle_input(self.player1_id, UP)
+        game.handle_input(self.player1_id, LEFT)
+        self.assertEqual(game.pending_inputs, [(1, UP), (2, LEFT)])
+        self.assertEqual(game.snakes[self.player1_id].direction, UP)
+
+        game.update()
+        game.update()
+        self.assertEqual(game.snakes[self.player1_id].direction, LEFT)
+
     def test_server_processes_received_client_input(self):
         """Test server game processes input received from a client via server_instance."""
         # Server game with two players already known
@@ -97,8 +156,69 @@ class TestGameMultiplayer(unittest.TestCase):
         
         game.handle_input(self.player1_id, DOWN)
         
-        expected_action = {'type': 'input', 'player_id': self.player1_id, 'direction': DOWN}
+        expected_action = {'type': 'input', 'player_id': self.player1_id, 'direction': DOWN, 'tick': 1}
         self.mock_client_instance.send_data.assert_called_with(expected_action)
+        self.assertEqual(game.pending_inputs, [(1, DOWN)])
+
+    def test_client_predicts_local_snake_movement(self):
+        """Test client moves its own snake immediately instead of waiting for the server."""
+        game = self.create_client_game(local_player_id=self.player1_id, all_player_ids=self.player_ids)
+        local_snake = game.snakes[self.player1_id]
+        remote_snake = game.snakes[self.player2_id]
+        start_local = local_snake.get_head_position()
+        start_remote = remote_snake.get_head_position()
+
+        game.handle_input(self.player1_id, DOWN)
+        game.update()
+
+        self.assertEqual(local_snake.get_head_position(), (start_local[0], start_local[1] + GRID_SIZE))
+        self.assertEqual(remote_snake.get_head_position(), start_remote, "Remote snakes are not predicted.")
+
+    def test_server_acknowledges_input_ticks(self):
+        """Test server reports which client tick each player's snake state reflects."""
+        game = self.create_server_game(player_ids=self.player_ids)
+        client_input_data = {'type': 'input', 'player_id': self.player2_id, 'direction': DOWN, 'tick': 7}
+        self.mock_server_instance.receive_data.return_value = [("net_p2", client_input_data)]
+
+        game.update()
+        state = game._get_serializable_game_state()
+        self.assertEqual(state['input_acks'][self.player2_id], 7)
+        self.assertEqual(state['tick'], 1)
+
+        self.mock_server_instance.receive_data.return_value = []
+        game.update()
+        self.assertEqual(game._get_serializable_game_state()['input_acks'][self.player2_id], 8)
+
+    def test_client_reconciles_with_server_state(self):
+        """Test client replays unacknowledged inputs on top of an authoritative snapshot."""
+        game = self.create_client_game(local_player_id=self.player1_id, all_player_ids=self.player_ids)
+        game.food.x, game.food.y = -GRID_SIZE, -GRID_SIZE # Keep food out of the way
+        start_x, start_y = game.snakes[self.player1_id].get_head_position()
+
+        game.update()                             # tick 1, moving RIGHT
+        game.handle_input(self.player1_id, DOWN)  # applies to tick 2
+        game.update()                             # tick 2, moving DOWN
+        game.update()                             # tick 3, moving DOWN
+        predicted_head = game.snakes[self.player1_id].get_head_position()
+
+        # Server has only seen up to tick 1 of this client
+        server_state = {
+            'snakes': {
+                self.player1_id: {'body': [(start_x + GRID_SIZE, start_y)], 'direction': RIGHT,
+                                  'is_dead': False, 'color': PLAYER_COLORS[0]},
+            },
+            'food_pos': (-GRID_SIZE, -GRID_SIZE),
+            'score': 0,
+            'is_game_over': False,
+            'player_ids': self.player_ids,
+            'tick': 1,
+            'input_acks': {self.player1_id: 1},
+        }
+        game.update_from_server(server_state)
+
+        self.assertEqual(game.snakes[self.player1_id].get_head_position(), predicted_head)
+        self.assertEqual(game.snakes[self.player1_id].direction, DOWN)
+        self.assertEqual(game.pending_inputs, [(2, DOWN)])
 
     def test_multi_snake_movement_and_food_consumption(self):
         """Test movement of multiple snakes and one eating food on server."""
@@ -175,6 +295,53 @@ class TestGameMultiplayer(unittest.TestCase):
         self.assertEqual(snake1.get_head_position(), (GRID_SIZE * 3, GRID_SIZE * 2))
         self.assertEqual(snake2.get_head_position(), (GRID_SIZE * 2, GRID_SIZE * 2))
 
+    def test_add_and_remove_player(self):
+        """Test players can join and leave a running game."""
+        game = self.create_server_game(player_ids=[self.player1_id])
+        snake = game.add_player(self.player2_id)
+
+        self.assertEqual(game.player_ids, self.player_ids)
+        self.assertIs(game.snakes[self.player2_id], snake)
+        self.assertEqual(snake.color, PLAYER_COLORS[1])
+
+        game.remove_player(self.player1_id)
+        self.assertEqual(game.player_ids, [self.player2_id])
+        self.assertNotIn(self.player1_id, game.snakes)
+
+    def test_frozen_snake_does_not_move(self):
+        """A disconnected player's snake holds still, even facing a wall, until it resumes."""
+        game = self.create_server_game(player_ids=self.player_ids)
+        self.mock_server_instance.receive_data.return_value = []
+        snake1, snake2 = game.snakes[self.player1_id], game.snakes[self.player2_id]
+        snake2.body = [(SCREEN_WIDTH - GRID_SIZE, GRID_SIZE * 2)]
+        snake2.direction = RIGHT
+
+        game.freeze_player(self.player2_id)
+        start = snake1.get_head_position()
+        for _ in range(3):
+            game.update()
+        self.assertEqual(snake2.body, [(SCREEN_WIDTH - GRID_SIZE, GRID_SIZE * 2)])
+        self.assertNotEqual(snake1.get_head_position(), start, "Connected players keep moving")
+        self.assertFalse(game.is_game_over)
+
+        game.unfreeze_player(self.player2_id)
+        game.update()
+        self.assertTrue(game.is_game_over, "Resumed snake moves again")
+
+    def test_frozen_snake_stays_frozen_across_reset(self):
+        """A match restarted during a player's grace period does not respawn its snake unsteered."""
+        game = self.create_server_game(player_ids=self.player_ids)
+        self.mock_server_instance.receive_data.return_value = []
+        game.freeze_player(self.player2_id)
+        game.is_game_over = True
+        game.reset()
+
+        body = list(game.snakes[self.player2_id].body)
+        for _ in range(3):
+            game.update()
+        self.assertEqual(game.snakes[self.player2_id].body, body)
+        self.assertIn(self.player2_id, game.frozen_players)
+
     def test_game_state_serialization(self):
         """Test _get_serializable_game_state contains essential info."""
         game = self.create_server_game(player_ids=self.player_ids)
@@ -205,6 +372,21 @@ class TestGameMultiplayer(unittest.TestCase):
         self.assertEqual(state['score'], game.score)
         self.assertEqual(state['is_game_over'], game.is_game_over)
 
+    def test_remote_snake_holds_still_without_snapshot(self):
+        """A tick with no new server state does not replay a remote snake's last slide."""
+        server_game = self.create_server_game(player_ids=self.player_ids)
+        client_game = self.create_client_game(local_player_id=self.player2_id, all_player_ids=self.player_ids)
+        client_game.update_from_server(copy.deepcopy(server_game._get_serializable_game_state()))
+        client_game.update()
+        server_game._simulate_tick()
+        client_game.update_from_server(copy.deepcopy(server_game._get_serializable_game_state()))
+        client_game.update()
+        remote = client_game.snakes[self.player1_id]
+        self.assertNotEqual(client_game.previous_bodies[self.player1_id], remote.body, "Slides on a new state")
+
+        client_game.update() # The jitter buffer had nothing for this tick
+        self.assertEqual(client_game.previous_bodies[self.player1_id], remote.body)
+
     def test_client_update_from_server_state(self):
         """Test client game updates its local state from a received server state."""
         client_game = self.create_client_game(local_player_id=self.player1_id, all_player_ids=self.player_ids)
@@ -242,5 +424,41 @@ class TestGameMultiplayer(unittest.TestCase):
         self.assertTrue(client_snake2.is_dead)
         self.assertEqual(client_snake2.color, PLAYER_COLORS[1])
 
+    def test_resume_catches_up_with_deltas(self):
+        """Test a resuming client rebuilds the current state from its last state plus deltas."""
+        server_game = self.create_server_game(player_ids=self.player_ids)
+        client_game = self.create_client_game(local_player_id=self.player2_id, all_player_ids=self.player_ids)
+        server_game._simulate_tick()
+        client_game.update_from_server(copy.deepcopy(server_game._get_serializable_game_state()))
+
+        # Connection drops; meanwhile player1 turns and eats
+        server_game.snakes[self.player1_id].change_direction(UP)
+        head_x, head_y = server_game.snakes[self.player1_id].get_head_position()
+        server_game.food.x, server_game.food.y = head_x, head_y - GRID_SIZE
+        for _ in range(4):
+            server_game._simulate_tick()
+
+        resume_state = server_game.get_resume_state(since_tick=1)
+        self.assertNotIn('snapshot', resume_state)
+        self.assertEqual(len(resume_state['deltas']), 4)
+
+        self.assertTrue(client_game.apply_resume_state(copy.deepcopy(resume_state)))
+        for player_id in self.player_ids:
+            self.assertEqual(client_game.snakes[player_id].body, server_game.snakes[player_id].body)
+        self.assertEqual(client_game.score, 1)
+        self.assertEqual((client_game.food.x, client_game.food.y), (server_game.food.x, server_game.food.y))
+
+    def test_resume_falls_back_to_snapshot(self):
+        """Test a resume from before the delta history (or an unknown tick) gets a full snapshot."""
+        server_game = self.create_server_game(player_ids=self.player_ids)
+        server_game._simulate_tick()
+        server_game.add_player("player3") # History no longer describes every snake
+        server_game._simulate_tick()
+
+        self.assertIn('snapshot', server_game.get_resume_state(since_tick=0))
+        self.assertIn('snapshot', server_game.get_resume_state(since_tick=None))
+        self.assertIn('snapshot', server_game.get_resume_state(since_tick=1), "State from before player3 joined")
+        self.assertNotIn('snapshot', server_game.get_resume_state(since_tick=2))
+
 if __name__ == '__main__':
     unittest.main()
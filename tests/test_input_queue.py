@@ -0,0 +1,49 @@
+import unittest
+from snake_game.core.input_queue import InputQueue, is_valid_turn
+from snake_game.core.config import UP, DOWN, LEFT, RIGHT
+
+
+class TestInputQueue(unittest.TestCase):
+    def test_valid_turns(self):
+        self.assertTrue(is_valid_turn(RIGHT, UP))
+        self.assertFalse(is_valid_turn(RIGHT, LEFT))
+        self.assertFalse(is_valid_turn(RIGHT, RIGHT))
+
+    def test_turns_are_validated_against_queued_direction(self):
+        queue = InputQueue(RIGHT)
+        self.assertTrue(queue.push(UP, tick=1, now=0.0))
+        # LEFT reverses RIGHT, but after UP it is a legal turn
+        self.assertTrue(queue.push(LEFT, tick=2, now=0.0))
+        self.assertFalse(queue.push(RIGHT, tick=3, now=0.0))
+        self.assertEqual(queue.pop(), (1, UP))
+        self.assertEqual(queue.pop(), (2, LEFT))
+        self.assertIsNone(queue.pop())
+        self.assertEqual(queue.rejected['invalid'], 1)
+
+    def test_queue_length_is_bounded(self):
+        queue = InputQueue(RIGHT, max_length=2)
+        queue.push(UP, now=0.0)
+        queue.push(LEFT, now=0.0)
+        self.assertFalse(queue.push(DOWN, now=0.0))
+        self.assertEqual(queue.rejected['full'], 1)
+        self.assertEqual(len(queue), 2)
+
+    def test_rate_limit(self):
+        queue = InputQueue(RIGHT, max_length=100, rate=10, burst=2)
+        self.assertTrue(queue.push(UP, now=0.0))
+        self.assertTrue(queue.push(LEFT, now=0.0))
+        self.assertFalse(queue.push(DOWN, now=0.0))
+        self.assertEqual(queue.rejected['rate_limited'], 1)
+        # One token back after 1/rate seconds
+        self.assertTrue(queue.push(DOWN, now=0.1))
+
+    def test_reset(self):
+        queue = InputQueue(RIGHT)
+        queue.push(UP, now=0.0)
+        queue.reset(DOWN)
+        self.assertIsNone(queue.pop())
+        self.assertTrue(queue.push(LEFT, now=0.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
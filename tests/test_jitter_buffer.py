@@ -0,0 +1,49 @@
+import unittest
+from snake_game.core.jitter_buffer import JitterBuffer
+
+
+class TestJitterBuffer(unittest.TestCase):
+    def test_buffers_until_target_depth(self):
+        buffer = JitterBuffer(0.1, min_depth=2)
+        buffer.push("s1", arrival_time=0.0)
+        self.assertIsNone(buffer.pop(), "Should wait until min_depth snapshots are buffered")
+        buffer.push("s2", arrival_time=0.1)
+        self.assertEqual(buffer.pop(), "s1")
+        self.assertEqual(buffer.pop(), "s2")
+
+    def test_steady_arrivals_keep_jitter_low(self):
+        buffer = JitterBuffer(0.1)
+        for i in range(20):
+            buffer.push(i, arrival_time=i * 0.1)
+            buffer.pop()
+        self.assertLess(buffer.jitter, 0.001)
+        self.assertEqual(buffer.target_depth, 1)
+
+    def test_jittery_arrivals_increase_depth(self):
+        buffer = JitterBuffer(0.1, max_depth=6)
+        arrival = 0.0
+        for i in range(40):
+            arrival += 0.02 if i % 2 else 0.18 # Bursty delivery, same average rate
+            buffer.push(i, arrival_time=arrival)
+        self.assertGreater(buffer.target_depth, 1)
+
+    def test_drops_oldest_when_over_max_depth(self):
+        buffer = JitterBuffer(0.1, max_depth=3)
+        for i in range(5):
+            buffer.push(i, arrival_time=i * 0.1)
+        self.assertEqual(buffer.snapshots, [2, 3, 4])
+        self.assertEqual(buffer.dropped, 2)
+
+    def test_rebuffers_after_running_dry(self):
+        buffer = JitterBuffer(0.1, min_depth=2)
+        buffer.push("s1", arrival_time=0.0)
+        buffer.push("s2", arrival_time=0.1)
+        buffer.pop()
+        buffer.pop()
+        self.assertIsNone(buffer.pop())
+        buffer.push("s3", arrival_time=0.3)
+        self.assertIsNone(buffer.pop(), "Should refill to the target depth after an underrun")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import random
+import unittest
+from snake_game.loadtest import Bot, run_load_test, percentile
+
+
+class TestBot(unittest.TestCase):
+
+    def setUp(self):
+        self.bot = Bot("127.0.0.1", 0, input_rate=5.0, rng=random.Random(1))
+        self.bot._handle_message({'type': 'welcome', 'player_id': 'player3'}, now=0.0)
+
+    def test_welcome_assigns_player(self):
+        self.assertEqual(self.bot.player_id, 'player3')
+
+    def test_input_acked_by_later_state(self):
+        self.bot.client.connected = False # Keep send_data off the network
+        self.bot._send_input(now=1.0)
+        tick = self.bot.last_sent_tick
+
+        self.bot._handle_message({'snakes': {}, 'input_acks': {'player3': tick - 1}}, now=1.05)
+        self.assertEqual(self.bot.latencies, [])
+        self.bot._handle_message({'snakes': {}, 'input_acks': {'player3': tick}}, now=1.1)
+        self.assertEqual(len(self.bot.latencies), 1)
+        self.assertAlmostEqual(self.bot.latencies[0], 0.1)
+        self.assertEqual(self.bot.pending_inputs, {})
+
+
+class TestLoadTest(unittest.TestCase):
+
+    def test_percentile(self):
+        self.assertEqual(percentile([], 0.5), 0.0)
+        self.assertEqual(percentile([3, 1, 2], 0.5), 2)
+
+    def test_small_run(self):
+        results, capacity = run_load_test(clients=4, step=4, duration=1.0, input_rate=10.0,
+                                          players_per_room=2, bot_threads=1, warmup=0.5)
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]['players'], 4)
+        self.assertEqual(results[0]['rooms'], 2)
+        self.assertGreater(results[0]['ticks'], 0)
+        self.assertGreater(results[0]['kbps_per_client'], 0)
+        self.assertIsNone(capacity)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+import time
+from snake_game.core.lockstep import LockstepServer, LockstepChannel, recommended_input_delay, DEFAULT_INPUT_DELAY
+from snake_game.core.game import Game
+from snake_game.core.network import Client
+from snake_game.core.config import SCREEN_WIDTH, SCREEN_HEIGHT, UP, GRID_SIZE
+
+
+class TestSeededSimulation(unittest.TestCase):
+    def _play(self, seed):
+        game = Game(SCREEN_WIDTH, SCREEN_HEIGHT, player_ids=["player1"], local_player_id="player1", seed=seed)
+        positions = [(game.food.x, game.food.y)]
+        for _ in range(5):
+            game.food.randomize_position(game.width, game.height, game._get_all_snake_bodies())
+            positions.append((game.food.x, game.food.y))
+        return positions
+
+    def test_same_seed_same_food(self):
+        self.assertEqual(self._play(7), self._play(7))
+        self.assertNotEqual(self._play(7), self._play(8))
+
+
+class TestInputDelay(unittest.TestCase):
+    def test_recommended_input_delay(self):
+        self.assertEqual(recommended_input_delay(None), DEFAULT_INPUT_DELAY)
+        self.assertEqual(recommended_input_delay(0.01, tick_rate=10), 2)
+        self.assertEqual(recommended_input_delay(0.25, tick_rate=10), 4)
+        self.assertEqual(recommended_input_delay(60.0, tick_rate=10), 10)
+
+
+class TestLockstepLoopback(unittest.TestCase):
+    def setUp(self):
+        self.server = LockstepServer("127.0.0.1", 0, players=2, input_delay=2, width=640, height=480)
+        port = self.server.server.socket.getsockname()[1]
+        self.clients = [Client("127.0.0.1", port) for _ in range(2)]
+        for client in self.clients:
+            self.assertTrue(client.connect())
+        self.channels = [LockstepChannel(client) for client in self.clients]
+
+    def tearDown(self):
+        for client in self.clients:
+            client.close()
+        self.server.close()
+
+    def _pump(self, until, timeout=2.0):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            self.server.poll()
+            if until():
+                return
+            time.sleep(0.002)
+        self.fail("Timed out")
+
+    def test_peers_stay_in_sync(self):
+        def started():
+            for channel in self.channels:
+                channel.poll()
+            return all(channel.started for channel in self.channels)
+        self._pump(started)
+        games = [channel.create_game() for channel in self.channels]
+        for game in games:
+            self.assertEqual((game.width, game.height), (640, 480), "Peers play on the server's board")
+        self.assertEqual(games[0].food.get_position(), games[1].food.get_position())
+        self.assertEqual({channel.player_id for channel in self.channels}, {"player1", "player2"})
+
+        player1 = next(game for game in games if game.local_player_id == "player1")
+        player1.handle_input("player1", UP)
+        start_y = player1.snakes["player1"].get_head_position()[1]
+
+        for _ in range(12):
+            target = games[0].tick + 1
+            def advanced():
+                for game in games:
+                    if game.tick < target:
+                        game.update()
+                return all(game.tick >= target for game in games)
+            self._pump(advanced)
+
+        self.assertEqual(games[0].tick, games[1].tick)
+        self.assertEqual(games[0].get_checksum(), games[1].get_checksum())
+        # Made before tick 1, the turn was applied from tick 1 + input_delay on both peers
+        for game in games:
+            self.assertEqual(game.snakes["player1"].direction, UP)
+            self.assertEqual(game.snakes["player1"].get_head_position()[1], start_y - 10 * GRID_SIZE)
+        self._pump(lambda: self.server.next_tick > 12)
+        self.assertEqual(self.server.desyncs, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
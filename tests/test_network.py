@@ -2,7 +2,16 @@ import unittest
 import pickle
 import struct
 import io
-from snake_game.core.network import send_message, receive_message, HEADER_LENGTH
+import time
+import select
+import socket
+from snake_game.core.config import SCREEN_WIDTH, SCREEN_HEIGHT, UP, RIGHT
+from snake_game.core.game import Game
+from snake_game.core.input_queue import INPUT_BURST
+from snake_game.core.network import (
+    send_message, receive_message, write_frames, encode_message, compress_payload, HEADER_LENGTH, COMPRESSED_FLAG,
+    BufferPool, ClockSync, ConnectionStats, Server, Client,
+)
 
 class MockSocket:
     def __init__(self, initial_buffer=b''):
@@ -34,6 +43,22 @@ class MockSocket:
     def close(self):
         self.closed = True
 
+def connect_loopback(test, server, **client_options):
+    """
+    Connect a Client to a loopback Server and wait until the server has accepted it
+
+    Returns:
+        tuple: (client, client_id on the server)
+    """
+    client = Client("127.0.0.1", server.socket.getsockname()[1], **client_options)
+    test.assertTrue(client.connect())
+    deadline = time.time() + 2.0
+    while not server.clients and time.time() < deadline:
+        server.accept_connections()
+        time.sleep(0.01)
+    return client, next(iter(server.clients.values()))['id']
+
+
 class TestNetworkMessaging(unittest.TestCase):
 
     def test_send_and_receive_simple_dict(self):
@@ -189,5 +214,396 @@ class TestNetworkMessaging(unittest.TestCase):
         # send_message should return False and log an error (manual log check)
         self.assertFalse(send_message(mock_sock, test_data))
 
+class TestCompression(unittest.TestCase):
+
+    def _snapshot(self, length):
+        body = [(x * 20, 100) for x in range(length)]
+        return {'snakes': {'player1': {'body': body, 'direction': 'RIGHT', 'is_dead': False}}, 'tick': 7}
+
+    def _round_trip(self, frame):
+        mock_sock = MockSocket(initial_buffer=frame)
+        recv_buffer_map = {'mock_socket': b''}
+        return receive_message(mock_sock, recv_buffer_map, 'mock_socket')
+
+    def test_large_message_compressed(self):
+        snapshot = self._snapshot(500)
+        frame = encode_message(snapshot)
+        header = struct.unpack('>I', frame[:HEADER_LENGTH])[0]
+        self.assertTrue(header & COMPRESSED_FLAG)
+        self.assertLess(len(frame), len(pickle.dumps(snapshot)))
+        self.assertEqual(self._round_trip(frame), snapshot)
+
+    def test_small_message_not_compressed(self):
+        frame = encode_message({"action": "move", "direction": "UP"})
+        header = struct.unpack('>I', frame[:HEADER_LENGTH])[0]
+        self.assertFalse(header & COMPRESSED_FLAG)
+        self.assertEqual(header, len(frame) - HEADER_LENGTH)
+
+    def test_compression_disabled(self):
+        snapshot = self._snapshot(500)
+        frame = encode_message(snapshot, compress_threshold=None)
+        self.assertFalse(struct.unpack('>I', frame[:HEADER_LENGTH])[0] & COMPRESSED_FLAG)
+        self.assertEqual(self._round_trip(frame), snapshot)
+
+    def test_corrupt_compressed_body(self):
+        frame = bytearray(encode_message(self._snapshot(500)))
+        frame[HEADER_LENGTH + 2] ^= 0xFF
+        self.assertFalse(self._round_trip(bytes(frame)))
+
+
+class TestClockSync(unittest.TestCase):
+
+    def test_offset_and_rtt_from_single_sample(self):
+        clock = ClockSync()
+        # Server clock is 10s ahead, 100ms round trip
+        clock.add_sample(client_send_time=100.0, server_time=110.05, client_recv_time=100.1)
+        self.assertAlmostEqual(clock.rtt, 0.1)
+        self.assertAlmostEqual(clock.offset, 10.0)
+
+    def test_offset_uses_lowest_rtt_sample(self):
+        clock = ClockSync()
+        clock.add_sample(100.0, 110.05, 100.1)   # Symmetric, 100ms
+        clock.add_sample(200.0, 210.45, 200.5)   # Delayed on the way out only, 500ms
+        self.assertAlmostEqual(clock.offset, 10.0)
+        self.assertGreater(clock.rtt, 0.1)
+
+    def test_estimated_server_tick(self):
+        clock = ClockSync()
+        clock.add_sample(100.0, 110.05, 100.1)
+        clock.update_tick(server_tick=50, tick_time=110.0, tick_rate=10)
+        # Local 100.5 is server 110.5, half a second after tick 50 started
+        self.assertAlmostEqual(clock.estimated_server_tick(local_time=100.5), 55.0)
+
+    def test_unknown_tick(self):
+        self.assertIsNone(ClockSync().estimated_server_tick())
+
+
+class TestClockSyncLoopback(unittest.TestCase):
+
+    def setUp(self):
+        self.server = Server("127.0.0.1", 0)
+        self.client, self.client_id = connect_loopback(self, self.server)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.close()
+
+    def test_ping_pong_handshake(self):
+        self.server.set_tick(42)
+
+        deadline = time.time() + 2.0
+        while self.client.rtt is None and time.time() < deadline:
+            self.assertEqual(self.server.receive_data(), [], "Pings should not reach the game")
+            self.assertIsNone(self.client.receive_data(), "Pongs should not reach the game")
+            time.sleep(0.01)
+
+        self.assertIsNotNone(self.client.rtt)
+        self.assertLess(abs(self.client.clock_offset), 0.5)
+        self.assertGreaterEqual(self.client.estimated_server_tick(), 42)
+
+        # The next ping carries the client's estimates to the server
+        self.client.sync_clock()
+        deadline = time.time() + 2.0
+        while self.server.get_clock_info(self.client_id)['rtt'] is None and time.time() < deadline:
+            self.server.receive_data()
+            time.sleep(0.01)
+        self.assertIsNotNone(self.server.get_clock_info(self.client_id)['rtt'])
+
+
+class TestWriteCoalescing(unittest.TestCase):
+
+    def setUp(self):
+        self.server = Server("127.0.0.1", 0, coalesce_writes=True)
+        self.client, self.client_id = connect_loopback(self, self.server)
+        # Finish the clock sync handshake so only test messages are in flight
+        deadline = time.time() + 2.0
+        while self.client.rtt is None and time.time() < deadline:
+            self.server.receive_data()
+            self.client.receive_data()
+            time.sleep(0.005)
+        self.server.set_tick(1)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.close()
+
+    def _receive_on_client(self, count):
+        received = []
+        deadline = time.time() + 2.0
+        while len(received) < count and time.time() < deadline:
+            data = self.client.receive_data()
+            if data is None:
+                time.sleep(0.005)
+            elif data is not False:
+                received.append(data)
+        return received
+
+    def test_nodelay_enabled(self):
+        sock = next(iter(self.server.clients))
+        self.assertTrue(sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY))
+        self.assertTrue(self.client.socket.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY))
+
+    def test_messages_queued_until_flush(self):
+        for i in range(5):
+            self.server.send_to_client(self.client_id, {'seq': i})
+        self.server.broadcast_data({'seq': 5})
+        self.assertEqual(self.server.tick_io['syscalls'], 0)
+
+        self.server.flush()
+        self.server.set_tick(2)
+        stats = self.server.get_io_stats()['last_tick']
+        self.assertEqual(stats['syscalls'], 1)
+        self.assertEqual(stats['messages_sent'], 6)
+        self.assertGreater(stats['bytes_sent'], 0)
+
+        received = self._receive_on_client(6)
+        self.assertEqual([message['seq'] for message in received], list(range(6)))
+
+    def test_default_writes_immediately(self):
+        self.assertFalse(Server(None, None).coalesce_writes, "Owners that never flush must not strand messages")
+
+    def test_uncoalesced_writes_immediately(self):
+        self.server.coalesce_writes = False
+        self.server.send_to_client(self.client_id, {'seq': 0})
+        self.server.send_to_client(self.client_id, {'seq': 1})
+        self.assertEqual(self.server.tick_io['syscalls'], 2)
+        self.assertEqual(len(self._receive_on_client(2)), 2)
+
+    def test_client_flush(self):
+        self.client.coalesce_writes = True
+        self.client.send_data({'seq': 0})
+        self.client.send_data({'seq': 1})
+        self.assertEqual(len(self.client.send_queue), 2)
+        self.assertTrue(self.client.flush())
+        self.assertEqual(self.client.send_queue, [])
+
+        received = []
+        deadline = time.time() + 2.0
+        while len(received) < 2 and time.time() < deadline:
+            received.extend(data for _, data in self.server.receive_data())
+            time.sleep(0.005)
+        self.assertEqual(received, [{'seq': 0}, {'seq': 1}])
+
+
+class TestConnectionStats(unittest.TestCase):
+
+    def test_rates_and_averages(self):
+        total = ConnectionStats()
+        stats = ConnectionStats(parent=total)
+        stats._rate_mark = (100.0, 0, 0)
+        stats.record_encode(0.002)
+        stats.record_sent({'syscalls': 1, 'bytes_sent': 2048, 'messages_sent': 2}, queue_depth=3)
+        stats.record_received(512, 0.001)
+        stats.record_snapshot(now=101.95)
+
+        result = stats.as_dict(now=102.0)
+        self.assertEqual(result['send_rate'], 1024.0)
+        self.assertEqual(result['receive_rate'], 256.0)
+        self.assertAlmostEqual(result['encode_ms'], 2.0)
+        self.assertAlmostEqual(result['decode_ms'], 1.0)
+        self.assertAlmostEqual(result['snapshot_age_ms'], 50.0)
+        self.assertEqual((result['queue_depth'], result['max_queue_depth']), (3, 3))
+        self.assertIsNone(result['rtt_ms'])
+        self.assertEqual((total.bytes_sent, total.bytes_received, total.encode_count), (2048, 512, 1))
+
+    def test_loopback_counts(self):
+        server = Server("127.0.0.1", 0)
+        client, client_id = connect_loopback(self, server)
+        try:
+            deadline = time.time() + 2.0
+            while client.rtt is None and time.time() < deadline:
+                server.receive_data()
+                client.receive_data()
+                time.sleep(0.005)
+
+            client_stats = client.get_stats()
+            server_stats = server.get_client_stats(client_id)
+            self.assertEqual(client_stats['messages_sent'], server_stats['messages_received'])
+            self.assertEqual(client_stats['bytes_sent'], server_stats['bytes_received'])
+            self.assertEqual(client_stats['bytes_received'], server_stats['bytes_sent'])
+            self.assertIsNotNone(client_stats['rtt_ms'])
+            self.assertEqual(server.get_connection_stats()['bytes_sent'], server_stats['bytes_sent'])
+        finally:
+            client.close()
+            server.close()
+
+
+class TestFrameLimits(unittest.TestCase):
+
+    def setUp(self):
+        self.reader, self.writer = socket.socketpair()
+        self.reader.setblocking(False)
+
+    def tearDown(self):
+        self.reader.close()
+        self.writer.close()
+
+    def test_oversized_frame_rejected_before_buffering(self):
+        self.writer.sendall(struct.pack('>I', 0x7FFFFFFF) + b'x' * 100)
+        recv_buffer_map = {}
+        self.assertFalse(receive_message(self.reader, recv_buffer_map, 'peer', max_frame_size=1024))
+        self.assertEqual(len(recv_buffer_map.get('peer', b'')), 0)
+
+    def test_decompressed_size_is_bounded(self):
+        body = compress_payload(b'\0' * 100000)
+        self.writer.sendall(struct.pack('>I', len(body) | COMPRESSED_FLAG) + body)
+        self.assertFalse(receive_message(self.reader, {}, 'peer', max_frame_size=4096))
+
+    def test_pooled_partial_receive(self):
+        pool = BufferPool(buffer_size=4096)
+        recv_buffer_map = {}
+        frame = encode_message({'data': list(range(500))}, compress_threshold=None)
+        self.writer.sendall(frame[:100])
+        self.assertIsNone(receive_message(self.reader, recv_buffer_map, 'peer', pool=pool))
+        self.assertEqual(bytes(recv_buffer_map['peer']), frame[:100])
+        self.assertEqual(pool.get_stats()['in_use'], 4096)
+
+        self.writer.sendall(frame[100:] + frame)
+        self.assertEqual(receive_message(self.reader, recv_buffer_map, 'peer', pool=pool), {'data': list(range(500))})
+        self.assertEqual(receive_message(self.reader, recv_buffer_map, 'peer', pool=pool), {'data': list(range(500))})
+        self.assertEqual(recv_buffer_map['peer'], b'')
+        stats = pool.get_stats()
+        self.assertEqual((stats['in_use'], stats['allocations'], stats['reuses']), (0, 1, 1))
+
+
+class TestServerMemoryBounds(unittest.TestCase):
+
+    def setUp(self):
+        self.server = Server("127.0.0.1", 0, coalesce_writes=True, max_send_queue_bytes=64 * 1024)
+        self.client, self.client_id = connect_loopback(self, self.server)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.close()
+
+    def test_memory_accounting(self):
+        self.server.compress_threshold = None
+        self.server.send_to_client(self.client_id, {'payload': b'x' * 1000})
+        self.assertGreater(self.server.get_client_stats(self.client_id)['send_queue_bytes'], 1000)
+        self.assertGreater(self.server.get_memory_stats()['send_queues'], 1000)
+        self.server.flush()
+        memory = self.server.get_memory_stats()
+        self.assertEqual((memory['send_queues'], memory['recv_buffers']), (0, 0))
+
+    def test_client_that_never_reads_is_dropped(self):
+        self.server.compress_threshold = None
+        next(iter(self.server.clients)).setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4096)
+        for _ in range(2000):
+            self.server.send_to_client(self.client_id, {'payload': b'x' * 10000})
+            self.server.flush()
+            if self.client_id not in self.server.client_sockets:
+                break
+        self.assertNotIn(self.client_id, self.server.client_sockets)
+        self.assertEqual(self.server.pop_disconnected(), [self.client_id])
+
+
+class TestReceiveBurst(unittest.TestCase):
+
+    def setUp(self):
+        self.server = Server("127.0.0.1", 0, coalesce_writes=True)
+        self.client, self.client_id = connect_loopback(self, self.server, coalesce_writes=True)
+        self.server.receive_data() # Consume the clock sync ping
+        self.game = Game(SCREEN_WIDTH, SCREEN_HEIGHT, player_ids=["player1"], local_player_id="player1",
+                         is_server=True, server_instance=self.server)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.close()
+
+    def test_burst_reaches_the_rate_limit_in_one_tick(self):
+        turns = [UP, RIGHT] * INPUT_BURST
+        for direction in turns:
+            self.client.send_data({'type': 'input', 'player_id': "player1", 'direction': direction})
+        self.assertTrue(self.client.flush())
+        select.select([next(iter(self.server.clients))], [], [], 2.0)
+
+        self.game.update()
+        queue = self.game.input_queues["player1"]
+        self.assertEqual(queue.rejected['rate_limited'], len(turns) - INPUT_BURST, "Every frame was read this tick")
+        self.assertEqual(sum(queue.rejected.values()) + len(queue), len(turns) - 1, "One turn applied by the tick")
+
+    def test_read_limit_leaves_later_frames_in_the_socket(self):
+        self.server.max_frames_per_read = 1
+        self.client.send_data({'type': 'join'})
+        self.client.send_data({'type': 'input', 'direction': UP})
+        self.assertTrue(self.client.flush())
+        sock = next(iter(self.server.clients))
+        select.select([sock], [], [], 2.0)
+
+        self.assertEqual(self.server.receive_data(), [(self.client_id, {'type': 'join'})])
+        conn, _, recv_buffer = self.server.detach_client(self.client_id)
+        self.assertEqual(recv_buffer, b'')
+        self.assertEqual(receive_message(conn, {}, 'handed over'), {'type': 'input', 'direction': UP})
+        conn.close()
+
+
+class TestWriteFrames(unittest.TestCase):
+
+    def test_partial_write_keeps_remainder(self):
+        class ShortWriteSocket:
+            def __init__(self):
+                self.calls = 0
+            def sendmsg(self, buffers):
+                self.calls += 1
+                if self.calls > 1:
+                    raise BlockingIOError()
+                return 6 # All of the first frame and part of the second
+            send = lambda self, data: self.sendmsg([data])
+
+        frames = [b'abcd', b'efgh', b'ijkl']
+        counters = {'syscalls': 0, 'bytes_sent': 0, 'messages_sent': 0}
+        write_frames(ShortWriteSocket(), frames, counters)
+        self.assertEqual([bytes(frame) for frame in frames], [b'gh', b'ijkl'])
+        self.assertEqual(counters, {'syscalls': 1, 'bytes_sent': 6, 'messages_sent': 1})
+
+
+class TestHeartbeats(unittest.TestCase):
+
+    def setUp(self):
+        self.server = Server("127.0.0.1", 0)
+        self.client, self.client_id = connect_loopback(self, self.server)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.close()
+
+    def test_keepalive_enabled(self):
+        sock = next(iter(self.server.clients))
+        self.assertTrue(sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE))
+        self.assertTrue(self.client.socket.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE))
+
+    def test_silent_client_is_reaped(self):
+        self.server.receive_data() # Consume the clock sync ping
+        self.server.idle_timeout = 0.05
+        time.sleep(0.1)
+        self.server.receive_data()
+        self.assertNotIn(self.client_id, self.server.client_sockets)
+        self.assertEqual(self.server.pop_disconnected(), [self.client_id])
+        stats = self.server.get_connection_stats()
+        self.assertEqual((stats['connected'], stats['reaped']), (0, 1))
+
+    def test_heartbeats_keep_idle_peers_connected(self):
+        self.server.idle_timeout = 0.2
+        self.client.idle_timeout = 0.2
+        self.server.heartbeat_interval = self.client.heartbeat_interval = 0.02
+        end = time.time() + 0.5
+        while time.time() < end:
+            self.client.flush()
+            self.server.flush()
+            self.assertEqual(self.server.receive_data(), [], "Heartbeats never reach the game")
+            self.assertIsNone(self.client.receive_data())
+            time.sleep(0.01)
+        self.assertIn(self.client_id, self.server.client_sockets)
+        self.assertTrue(self.client.connected)
+        self.assertEqual(self.server.reaped_count, 0)
+
+    def test_client_detects_silent_server(self):
+        self.client.idle_timeout = 0.05
+        time.sleep(0.1)
+        while self.client.receive_data() is not False:
+            pass # Drain the pong; the server sends nothing after that
+        self.assertFalse(self.client.connected)
+
+
 if __name__ == '__main__':
     unittest.main()
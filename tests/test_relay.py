@@ -0,0 +1,71 @@
+import unittest
+import time
+from snake_game.core.relay import Relay
+from snake_game.core.rooms import RoomServer
+from snake_game.core.network import Client
+
+
+class TestRelayLoopback(unittest.TestCase):
+    def setUp(self):
+        self.room_server = RoomServer("127.0.0.1", 0)
+        upstream_port = self.room_server.server.socket.getsockname()[1]
+        self.relay = Relay("127.0.0.1", upstream_port, "127.0.0.1", 0, room_id="alpha", rate=self.room_server.tick_rate)
+        self.relay_port = self.relay.server.socket.getsockname()[1]
+        self.clients = []
+
+    def tearDown(self):
+        for client in self.clients:
+            client.close()
+        self.relay.close()
+        self.room_server.close()
+
+    def _connect(self, port):
+        client = Client("127.0.0.1", port)
+        self.assertTrue(client.connect())
+        self.clients.append(client)
+        return client
+
+    def _pump(self, until, timeout=2.0):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            self.room_server.poll()
+            self.relay.poll()
+            if until():
+                return
+            time.sleep(0.005)
+        self.fail("Timed out")
+
+    def test_viewers_receive_upstream_frames(self):
+        player = self._connect(self.room_server.server.socket.getsockname()[1])
+        player.join_room("alpha")
+        self.assertTrue(self.relay.connect_upstream())
+        self._pump(lambda: len(self.room_server.rooms.get("alpha").spectators) == 1
+                   if "alpha" in self.room_server.rooms else False)
+
+        viewers = [self._connect(self.relay_port) for _ in range(3)]
+        for viewer in viewers:
+            viewer.spectate()
+        self._pump(lambda: len(self.relay.viewers) == 3)
+
+        self.room_server.tick()
+        states = {}
+
+        def all_viewers_have_state():
+            for index, viewer in enumerate(viewers):
+                message = viewer.receive_data()
+                while message:
+                    if isinstance(message, dict) and 'snakes' in message:
+                        states[index] = message
+                    message = viewer.receive_data()
+            return len(states) == len(viewers)
+
+        self._pump(all_viewers_have_state)
+        self.assertEqual(set(states[0]['snakes']), {"player1"})
+        self.assertTrue(all(state['tick'] == states[0]['tick'] for state in states.values()))
+        # The room server still serves exactly one player and one spectator connection
+        self.assertEqual(len(self.room_server.server.clients), 2)
+        self.assertEqual(self.relay.frames_relayed, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
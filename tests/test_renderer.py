@@ -0,0 +1,226 @@
+import unittest
+from types import SimpleNamespace
+import pygame
+from snake_game.core.snake import Snake
+from snake_game.core.food import Food
+from snake_game.core.config import GRID_SIZE, GREEN, UP
+from ui.renderer import SnakeRenderer
+
+
+class TestSnakeRendererInterpolation(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.renderer = SnakeRenderer(800, 600)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_interpolates_between_ticks(self):
+        previous = [(40, 40), (20, 40)]
+        current = [(60, 40), (40, 40)]
+        positions = self.renderer._interpolate_body(current, previous, 0.5)
+        self.assertEqual(positions, [(50, 40), (30, 40)])
+
+    def test_grown_segment_and_teleport_are_not_interpolated(self):
+        previous = [(40, 40)]
+        current = [(400, 300), (40, 40)]
+        positions = self.renderer._interpolate_body(current, previous, 0.5)
+        self.assertEqual(positions, [(400, 300), (40, 40)])
+
+    def test_render_snakes_draws_interpolated_head(self):
+        screen = pygame.Surface((200, 200))
+        screen.fill((0, 0, 0))
+        snake = Snake(2 * GRID_SIZE, 0, "player1", GREEN)
+        previous_bodies = {"player1": [(GRID_SIZE, 0)]}
+        self.renderer.render_snakes(screen, {"player1": snake}, 0.5, previous_bodies)
+        # Halfway between x=20 and x=40 the head covers x=30..49
+        self.assertNotEqual(screen.get_at((2 * GRID_SIZE, GRID_SIZE // 2))[:3], (0, 0, 0))
+        self.assertEqual(screen.get_at((GRID_SIZE + 2, GRID_SIZE // 2))[:3], (0, 0, 0))
+        self.assertEqual(screen.get_at((3 * GRID_SIZE + 5, GRID_SIZE // 2))[:3], (0, 0, 0))
+
+
+class TestFoodPulseFrames(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.renderer = SnakeRenderer(800, 600)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_frames_follow_pulse_and_share_surfaces(self):
+        frames = self.renderer.food_pulse_frames["food"]
+        sizes = [size for size, _ in frames]
+        self.assertEqual(max(sizes), GRID_SIZE)
+        self.assertEqual(min(sizes), int(GRID_SIZE * 0.8))
+        surfaces = {id(surface) for _, surface in frames}
+        self.assertEqual(len(surfaces), len(set(sizes)))
+
+    def test_food_sprite_reuses_precomputed_frame(self):
+        food = Food(100, 100)
+        for phase in (0.0, 1.0, 3.0, 5.5):
+            self.renderer.food_pulse = phase
+            (_, size, position), surface, _ = self.renderer._food_sprite(food)
+            self.assertIn((size, surface), self.renderer.food_pulse_frames["food"])
+            offset = (GRID_SIZE - size) // 2
+            self.assertEqual(position, (100 + offset, 100 + offset))
+
+
+class TestSegmentSprites(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.renderer = SnakeRenderer(800, 600)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_segments_are_cached_standalone_surfaces(self):
+        head = self.renderer._get_or_create_snake_segment_surface(GREEN, "head")
+        body = self.renderer._get_or_create_snake_segment_surface(GREEN, "body")
+        self.assertIs(self.renderer._get_or_create_snake_segment_surface(GREEN, "body"), body)
+        self.assertIsNot(head, body)
+        for segment in (head, body):
+            self.assertIsNone(segment.get_parent(), "Subsurfaces cannot be RLE-accelerated")
+            self.assertEqual(segment.get_size(), (GRID_SIZE, GRID_SIZE))
+        self.assertEqual(body.get_at((GRID_SIZE // 2, GRID_SIZE // 2))[:3], GREEN[:3])
+
+    def test_tick_sprites_updated_from_head_and_tail(self):
+        snake = Snake(5 * GRID_SIZE, 0, "player1", GREEN)
+        snake.body = [(5 * GRID_SIZE, 0), (4 * GRID_SIZE, 0), (3 * GRID_SIZE, 0)]
+        cached = self.renderer._get_tick_sprites("player1", snake)
+        sprites = cached['sprites']
+        snake.grow()
+        snake.move()
+        snake.move()
+        self.assertIs(self.renderer._get_tick_sprites("player1", snake)['sprites'], sprites, "Updated in place")
+        self.assertEqual(sprites, self.renderer._segment_sprites(GREEN, snake.body))
+        self.assertEqual(cached['blits'], [(surface, position) for _, surface, position in sprites])
+
+        self.renderer._snake_sprites({})
+        self.assertEqual(self.renderer.tick_sprites, {}, "Departed snakes are forgotten")
+
+    def test_snake_sprites_draw_head_last(self):
+        snake = Snake(2 * GRID_SIZE, 0, "player1", GREEN)
+        snake.body = [(2 * GRID_SIZE, 0), (GRID_SIZE, 0), (0, 0)]
+        sprites = self.renderer._snake_sprites({"player1": snake})
+        self.assertEqual([key for key, _, _ in sprites], [
+            (GREEN, "body", (0, 0)),
+            (GREEN, "body", (GRID_SIZE, 0)),
+            (GREEN, "head", (2 * GRID_SIZE, 0)),
+        ])
+
+
+class TestDirtyRectRendering(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.renderer = SnakeRenderer(200, 200)
+        self.snake = Snake(4 * GRID_SIZE, 4 * GRID_SIZE, "player1", GREEN)
+        self.game = SimpleNamespace(
+            snakes={"player1": self.snake}, food=Food(0, 0), is_game_over=False, previous_bodies={}
+        )
+        self.screen = pygame.Surface((200, 200))
+
+    def tearDown(self):
+        pygame.quit()
+
+    def assertMatchesFullRender(self):
+        expected = pygame.Surface((200, 200))
+        SnakeRenderer(200, 200).render_game(expected, self.game)
+        self.assertEqual(pygame.image.tostring(self.screen, "RGB"), pygame.image.tostring(expected, "RGB"))
+
+    def test_first_frame_is_full(self):
+        self.assertEqual(self.renderer.render_game_dirty(self.screen, self.game), [self.screen.get_rect()])
+        self.assertMatchesFullRender()
+
+    def test_move_updates_only_changed_cells(self):
+        self.renderer.render_game_dirty(self.screen, self.game)
+        self.snake.move()
+        rects = self.renderer.render_game_dirty(self.screen, self.game)
+        self.assertMatchesFullRender()
+        self.assertLessEqual(sum(rect.width * rect.height for rect in rects), 4 * GRID_SIZE * GRID_SIZE)
+        self.assertEqual(self.renderer.render_game_dirty(self.screen, self.game), [], "Nothing changed")
+
+    def test_restore_rects_are_repainted(self):
+        self.renderer.render_game_dirty(self.screen, self.game)
+        hud = self.screen.fill((255, 255, 255), pygame.Rect(70, 70, 50, 15))
+        rects = self.renderer.render_game_dirty(self.screen, self.game, restore=[hud])
+        self.assertIn(hud, rects)
+        self.assertMatchesFullRender()
+
+    def test_game_over_and_invalidate_redraw_everything(self):
+        self.renderer.render_game_dirty(self.screen, self.game)
+        self.renderer.invalidate()
+        self.assertEqual(self.renderer.render_game_dirty(self.screen, self.game), [self.screen.get_rect()])
+        self.game.is_game_over = True
+        self.assertEqual(self.renderer.render_game_dirty(self.screen, self.game), [self.screen.get_rect()])
+
+    def test_game_over_overlay_is_cached_until_restart(self):
+        self.game.is_game_over = True
+        self.renderer.render_game(self.screen, self.game)
+        overlay = self.renderer.game_over_overlay
+        self.renderer.render_game(self.screen, self.game)
+        self.assertIs(self.renderer.game_over_overlay, overlay)
+        self.game.is_game_over = False
+        self.renderer.render_game(self.screen, self.game)
+        self.assertIsNone(self.renderer.game_over_overlay)
+
+
+
+class TestSnakeLayer(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.renderer = SnakeRenderer(200, 200)
+        self.snake = Snake(4 * GRID_SIZE, 4 * GRID_SIZE, "player1", GREEN)
+        self.snake.body = [(4 * GRID_SIZE, 4 * GRID_SIZE), (3 * GRID_SIZE, 4 * GRID_SIZE), (2 * GRID_SIZE, 4 * GRID_SIZE)]
+        self.snakes = {"player1": self.snake}
+
+    def tearDown(self):
+        pygame.quit()
+
+    def assertLayerMatchesFullRender(self):
+        expected = self.renderer.background.copy()
+        self.renderer.render_snakes(expected, self.snakes)
+        self.assertEqual(pygame.image.tostring(self.renderer.snake_layer, "RGB"),
+                         pygame.image.tostring(expected, "RGB"))
+
+    def test_moves_and_growth_update_the_layer_in_place(self):
+        self.renderer._update_snake_layer(self.snakes)
+        calls = []
+        self.renderer._rebuild_snake_layer = lambda snakes: calls.append(snakes)
+        self.snake.move()
+        self.renderer._update_snake_layer(self.snakes)
+        self.assertLayerMatchesFullRender()
+        self.snake.change_direction(UP)
+        self.snake.grow()
+        self.snake.move()
+        self.snake.move() # Two ticks between frames
+        self.renderer._update_snake_layer(self.snakes)
+        self.assertLayerMatchesFullRender()
+        self.assertEqual(calls, [])
+        self.assertEqual(len(self.renderer.layer_bodies["player1"]), 4)
+
+    def test_respawn_and_overlap_rebuild_the_layer(self):
+        self.renderer._update_snake_layer(self.snakes)
+        self.snake.body = [(GRID_SIZE, GRID_SIZE)] # Respawned elsewhere
+        self.renderer._update_snake_layer(self.snakes)
+        self.assertLayerMatchesFullRender()
+
+        other = Snake(0, GRID_SIZE, "player2", (0, 0, 255))
+        self.snakes["player2"] = other
+        self.renderer._update_snake_layer(self.snakes)
+        other.move() # Onto player1's cell
+        self.renderer._update_snake_layer(self.snakes)
+        self.assertLayerMatchesFullRender()
+        self.assertEqual(self.renderer.layer_counts[(GRID_SIZE, GRID_SIZE)], 2)
+
+    def test_render_game_uses_the_layer_when_not_interpolating(self):
+        game = SimpleNamespace(snakes=self.snakes, food=Food(0, 0), is_game_over=False, previous_bodies={})
+        screen = pygame.Surface((200, 200))
+        self.renderer.render_game(screen, game)
+        self.assertIsNotNone(self.renderer.snake_layer)
+        self.assertIsNone(self.renderer.last_sprites, "Sprites were not listed")
+        self.assertEqual(screen.get_at((4 * GRID_SIZE + GRID_SIZE // 2, 4 * GRID_SIZE + GRID_SIZE // 2)),
+                         self.renderer.snake_layer.get_at((4 * GRID_SIZE + GRID_SIZE // 2, 4 * GRID_SIZE + GRID_SIZE // 2)))
+
+
+if __name__ == '__main__':
+    unittest.main()
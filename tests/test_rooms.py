@@ -0,0 +1,214 @@
+import unittest
+import time
+from unittest.mock import MagicMock
+from snake_game.core.rooms import Room, RoomServer, TickStats
+from snake_game.core.network import Client
+from snake_game.core.config import SCREEN_WIDTH, SCREEN_HEIGHT, UP
+
+
+class TestTickStats(unittest.TestCase):
+    def test_summary(self):
+        stats = TickStats()
+        for duration in (0.001, 0.002, 0.003):
+            stats.record(duration)
+        summary = stats.summary()
+        self.assertEqual(summary['ticks'], 3)
+        self.assertAlmostEqual(summary['avg_ms'], 2.0)
+        self.assertAlmostEqual(summary['max_ms'], 3.0)
+        self.assertAlmostEqual(summary['last_ms'], 3.0)
+
+    def test_percentile_of_empty_stats(self):
+        self.assertEqual(TickStats().percentile(0.99), 0.0)
+
+
+class TestRoom(unittest.TestCase):
+    def setUp(self):
+        self.server = MagicMock()
+        self.server.encode.side_effect = lambda data: data # Frames are the states themselves
+        self.room = Room("r1", self.server, SCREEN_WIDTH, SCREEN_HEIGHT, max_players=2)
+
+    def test_players_get_snakes(self):
+        self.assertEqual(self.room.add_client("client_0"), "player1")
+        self.assertEqual(self.room.add_client("client_1"), "player2")
+        self.assertTrue(self.room.is_full)
+        self.assertEqual(set(self.room.game.snakes), {"player1", "player2"})
+
+        self.room.remove_client("client_0")
+        self.assertEqual(set(self.room.game.snakes), {"player2"})
+
+    def test_inputs_are_bound_to_the_sender(self):
+        self.room.add_client("client_0")
+        self.room.add_client("client_1")
+        # client_1 tries to steer player1's snake
+        self.room.deliver("client_1", {'type': 'input', 'player_id': 'player1', 'direction': UP, 'tick': 1})
+        self.room.tick()
+        self.assertEqual(self.room.game.snakes["player2"].direction, UP)
+        self.assertNotEqual(self.room.game.snakes["player1"].direction, UP)
+
+    def test_tick_broadcasts_to_room_and_records_cost(self):
+        self.room.add_client("client_0")
+        self.room.tick()
+        client_ids, state = self.server.multicast_frame.call_args[0]
+        self.assertEqual(client_ids, ["client_0"])
+        self.assertEqual(state['tick'], 1)
+        self.assertEqual(self.room.tick_stats.count, 1)
+
+    def test_spectators_get_reduced_rate(self):
+        self.room.add_client("client_0")
+        interval = self.room.add_spectator("client_1", rate=self.room.tick_rate / 2)
+        self.assertEqual(interval, 2)
+        self.assertFalse(self.room.is_full)
+        self.assertNotIn("client_1", self.room.players)
+
+        recipients = []
+        for _ in range(4):
+            self.room.tick()
+            recipients.append(self.server.multicast_frame.call_args[0][0])
+        self.assertEqual([ids.count("client_1") for ids in recipients], [0, 1, 0, 1])
+        self.assertTrue(all("client_0" in ids for ids in recipients))
+
+    def test_spectator_inputs_ignored(self):
+        self.room.add_client("client_0")
+        self.room.add_spectator("client_1")
+        self.room.deliver("client_1", {'type': 'input', 'player_id': 'player1', 'direction': UP, 'tick': 1})
+        self.assertEqual(self.room.channel.inbox, [])
+
+    def test_room_with_only_spectators_is_not_empty(self):
+        self.room.add_spectator("client_1")
+        self.assertFalse(self.room.is_empty)
+        self.room.remove_client("client_1")
+        self.assertTrue(self.room.is_empty)
+
+
+class TestRoomServerLoopback(unittest.TestCase):
+    def setUp(self):
+        self.room_server = RoomServer("127.0.0.1", 0, max_players_per_room=2)
+        self.port = self.room_server.server.socket.getsockname()[1]
+        self.clients = []
+
+    def tearDown(self):
+        for client in self.clients:
+            client.close()
+        self.room_server.close()
+
+    def _connect(self):
+        client = Client("127.0.0.1", self.port)
+        self.assertTrue(client.connect())
+        self.clients.append(client)
+        return client
+
+    def _receive(self, client, message_type, timeout=2.0):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            self.room_server.poll()
+            message = client.receive_data()
+            if isinstance(message, dict) and message.get('type') == message_type:
+                return message
+            time.sleep(0.005)
+        self.fail(f"No '{message_type}' message received")
+
+    def _receive_state(self, client, timeout=2.0):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            message = client.receive_data()
+            if isinstance(message, dict) and 'snakes' in message:
+                return message
+            time.sleep(0.005)
+        self.fail("No state received")
+
+    def test_rooms_are_independent(self):
+        a, b, c = self._connect(), self._connect(), self._connect()
+        a.join_room("alpha")
+        welcome_a = self._receive(a, 'welcome')
+        b.join_room("alpha")
+        welcome_b = self._receive(b, 'welcome')
+        c.join_room("beta")
+        welcome_c = self._receive(c, 'welcome')
+
+        self.assertEqual(welcome_a['room_id'], "alpha")
+        self.assertEqual(welcome_b['player_ids'], ["player1", "player2"])
+        self.assertEqual(welcome_c['player_id'], "player1")
+        self.assertEqual(len(self.room_server.rooms), 2)
+
+        self.room_server.tick()
+        state = None
+        deadline = time.time() + 2.0
+        while state is None and time.time() < deadline:
+            message = c.receive_data()
+            if isinstance(message, dict) and 'snakes' in message:
+                state = message
+        self.assertEqual(list(state['snakes']), ["player1"], "Room beta only sees its own snake")
+        self.assertIn("alpha", self.room_server.get_room_stats())
+
+    def test_full_room_rejects_join(self):
+        clients = [self._connect() for _ in range(3)]
+        for client in clients[:2]:
+            client.join_room("alpha")
+            self._receive(client, 'welcome')
+        clients[2].join_room("alpha")
+        self.assertEqual(self._receive(clients[2], 'join_rejected')['reason'], 'room full')
+
+    def test_spectator_joins_watched_room(self):
+        a, viewer = self._connect(), self._connect()
+        a.join_room("alpha")
+        self._receive(a, 'welcome')
+        viewer.spectate()
+        welcome = self._receive(viewer, 'welcome')
+        self.assertEqual(welcome['room_id'], "alpha")
+        self.assertEqual(welcome['role'], 'spectator')
+        self.assertIsNone(welcome['player_id'])
+        self.assertEqual(self.room_server.get_room_stats()["alpha"]['spectators'], 1)
+        self.assertEqual(self.room_server.get_player_count(), 1)
+
+    def test_dropped_player_resumes_session(self):
+        a, b = self._connect(), self._connect()
+        a.join_room("alpha")
+        welcome = self._receive(a, 'welcome')
+        b.join_room("alpha")
+        self._receive(b, 'welcome')
+        self.assertEqual(a.session_token, welcome['session_token'])
+
+        self.room_server.tick()
+        state = self._receive_state(a)
+        a.socket.close() # Connection drops without a goodbye
+        deadline = time.time() + 2.0
+        while not self.room_server.sessions.get("client_0")['expires'] and time.time() < deadline:
+            self.room_server.poll()
+            time.sleep(0.005)
+        game = self.room_server.rooms["alpha"].game
+        body = list(game.snakes["player1"].body)
+        self.room_server.tick()
+        self.room_server.tick()
+        self.assertIn("player1", game.snakes, "Snake kept during the grace period")
+        self.assertEqual(game.snakes["player1"].body, body, "Snake frozen during the grace period")
+
+        self.assertTrue(a.reconnect())
+        a.resume(state['tick'])
+        resume_state = self._receive(a, 'resume_state')
+        self.assertEqual(resume_state['player_id'], "player1")
+        self.assertEqual(len(resume_state['deltas']), 2)
+        self.assertNotIn("player1", game.frozen_players)
+        self.assertEqual(self.room_server.rooms["alpha"].players, {"client_1": "player2", "client_2": "player1"})
+
+    def test_resume_with_unknown_token_is_rejected(self):
+        a = self._connect()
+        a.session_token = "bogus"
+        a.resume()
+        self.assertEqual(self._receive(a, 'resume_rejected')['reason'], 'session expired')
+
+    def test_empty_room_is_closed(self):
+        self.room_server.sessions.grace_period = 0.0 # Do not hold the seat for a resume
+        a = self._connect()
+        a.join_room()
+        self._receive(a, 'welcome')
+        self.assertEqual(len(self.room_server.rooms), 1)
+        a.close()
+        deadline = time.time() + 2.0
+        while self.room_server.rooms and time.time() < deadline:
+            self.room_server.poll()
+            time.sleep(0.005)
+        self.assertEqual(self.room_server.rooms, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
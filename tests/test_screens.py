@@ -1,5 +1,8 @@
 import unittest
+import socket
+from unittest.mock import MagicMock
 import pygame
+from snake_game.core.network import Client, Server
 from ui.screens import ScreenManager, Screen, MenuScreen, GameScreen
 
 
@@ -81,3 +84,93 @@ class TestScreenManager(unittest.TestCase):
 
         self.screen_manager.render(self.test_surface)
         self.assertTrue(mock_screen.render_called)
+
+
+class TestGameScreenNetStats(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.game = MagicMock()
+        self.game.is_server = False
+        self.game.score = 0
+        self.game.local_player_id = "player1"
+        self.game.server_instance = None
+        self.game_screen = GameScreen(800, 600, self.game, MagicMock(), MagicMock())
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_f3_toggles_overlay(self):
+        self.assertFalse(self.game_screen.show_net_stats)
+        self.game_screen.handle_events([pygame.event.Event(pygame.KEYDOWN, key=pygame.K_F3)])
+        self.assertTrue(self.game_screen.show_net_stats)
+        self.game_screen.handle_events([pygame.event.Event(pygame.KEYDOWN, key=pygame.K_F3)])
+        self.assertFalse(self.game_screen.show_net_stats)
+
+    def test_overlay_shows_client_stats(self):
+        self.game.client_instance = Client("127.0.0.1", 0)
+        self.game.client_instance.stats.rtt = 0.042
+        lines = self.game_screen.get_net_stats_lines()
+        self.assertEqual(lines[0], "Net: client")
+        self.assertIn("RTT 42 ms", lines[1])
+
+        self.game_screen.show_net_stats = True
+        self.game_screen.render(pygame.Surface((800, 600)))
+        self.game.client_instance.close()
+
+    def test_overlay_shows_rtt_per_client_on_host(self):
+        self.game.client_instance = None
+        server = self.game.server_instance = Server(None, None)
+        conn, peer = socket.socketpair()
+        client_id = server.attach_client(conn, ("127.0.0.1", 5000))
+        server.clients[conn]['stats'].rtt = 0.042 # As reported by the client's clock sync
+        lines = self.game_screen.get_net_stats_lines()
+        self.assertEqual(lines[0], "Net: host, 1 clients, 0 reaped")
+        self.assertIn(f"{client_id} RTT 42 ms", lines[1])
+        server.close()
+        peer.close()
+
+    def test_overlay_offline(self):
+        self.game.client_instance = None
+        self.assertEqual(self.game_screen.get_net_stats_lines(), ["Net: offline"])
+
+
+class TestGameScreenPauseOverlay(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.game = MagicMock()
+        self.game.is_server = False
+        self.game.is_game_over = False
+        self.game.score = 0
+        self.game.local_player_id = "player1"
+        self.game.client_instance = None
+        self.game.server_instance = None
+        self.game_screen = GameScreen(800, 600, self.game, MagicMock(), MagicMock())
+        self.surface = pygame.Surface((800, 600))
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_overlay_composed_once_while_paused(self):
+        self.game_screen.paused = True
+        self.game_screen.render(self.surface)
+        overlay = self.game_screen.pause_overlay
+        self.assertEqual(overlay.get_size(), (800, 600))
+        self.game_screen.render(self.surface)
+        self.assertIs(self.game_screen.pause_overlay, overlay)
+
+        self.game_screen.paused = False
+        self.game_screen.render(self.surface)
+        self.assertIsNone(self.game_screen.pause_overlay)
+
+    def test_quality_reaches_screens_added_later(self):
+        manager = ScreenManager(800, 600)
+        quality = {"glow": False, "particles": False, "food_pulse": False, "interpolation": False}
+        manager.set_quality(quality)
+        manager.add_screen("game", self.game_screen)
+        self.assertFalse(self.game_screen.renderer.interpolation_enabled)
+        self.assertFalse(self.game_screen.renderer.food_pulse_enabled)
+        self.assertIsNotNone(self.game_screen.particles.max_particles)
+
+        manager.set_quality(dict.fromkeys(quality, True))
+        self.assertTrue(self.game_screen.renderer.interpolation_enabled)
+        self.assertIsNone(self.game_screen.particles.max_particles)
@@ -0,0 +1,38 @@
+import unittest
+from snake_game.core.session import SessionManager
+
+
+class TestSessionManager(unittest.TestCase):
+    def setUp(self):
+        self.sessions = SessionManager(grace_period=5.0)
+        self.token = self.sessions.create("client_0", "player2", room_id="alpha")
+
+    def test_tokens_are_unique(self):
+        self.assertNotEqual(self.token, self.sessions.create("client_1", "player3"))
+        self.assertEqual(self.sessions.get("client_0")['room_id'], "alpha")
+
+    def test_resume_within_grace_period(self):
+        self.sessions.disconnect("client_0", now=100.0)
+        session = self.sessions.resume(self.token, "client_1", now=104.0)
+        self.assertEqual(session['player_id'], "player2")
+        self.assertEqual(session['previous_client_id'], "client_0")
+        self.assertIsNone(self.sessions.get("client_0"))
+        self.assertEqual(self.sessions.expire(now=200.0), [], "Resumed sessions do not expire")
+
+    def test_resume_after_grace_period(self):
+        self.sessions.disconnect("client_0", now=100.0)
+        self.assertIsNone(self.sessions.resume(self.token, "client_1", now=105.0))
+        expired = self.sessions.expire(now=105.0)
+        self.assertEqual([session['player_id'] for session in expired], ["player2"])
+        self.assertIsNone(self.sessions.get("client_0"))
+
+    def test_unknown_token(self):
+        self.assertIsNone(self.sessions.resume("not-a-token", "client_1"))
+
+    def test_remove(self):
+        self.sessions.remove("client_0")
+        self.assertIsNone(self.sessions.resume(self.token, "client_1"))
+
+
+if __name__ == '__main__':
+    unittest.main()
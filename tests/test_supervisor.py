@@ -0,0 +1,59 @@
+import unittest
+import socket
+import time
+from snake_game.core.network import Client
+from snake_game.core.supervisor import Supervisor, MODE_LOBBY
+
+
+@unittest.skipUnless(hasattr(socket, "send_fds"), "needs socket passing between processes")
+class TestSupervisorLobby(unittest.TestCase):
+    def setUp(self):
+        self.supervisor = Supervisor("127.0.0.1", 0, workers=2, mode=MODE_LOBBY)
+        self.supervisor.start()
+        self.clients = []
+
+    def tearDown(self):
+        for client in self.clients:
+            client.close()
+        self.supervisor.close()
+
+    def _join(self, room_id):
+        client = Client("127.0.0.1", self.supervisor.port)
+        self.assertTrue(client.connect())
+        self.clients.append(client)
+        client.join_room(room_id)
+        deadline = time.time() + 5.0
+        while time.time() < deadline:
+            self.supervisor.poll()
+            message = client.receive_data()
+            if isinstance(message, dict) and message.get('type') == 'welcome':
+                return message
+            time.sleep(0.005)
+        self.fail("No welcome from a worker")
+
+    def test_rooms_stay_on_one_worker_and_metrics_aggregate(self):
+        first = self._join("alpha")
+        second = self._join("alpha")
+        other = self._join("beta")
+
+        self.assertEqual(first['player_id'], "player1")
+        self.assertEqual(second['player_ids'], ["player1", "player2"], "Same room id lands on the same worker")
+        self.assertEqual(other['player_id'], "player1")
+        self.assertNotEqual(
+            self.supervisor.room_assignments["alpha"], self.supervisor.room_assignments["beta"],
+            "A new room goes to the less loaded worker",
+        )
+
+        deadline = time.time() + 5.0
+        metrics = self.supervisor.get_metrics()
+        while metrics['players'] < 3 and time.time() < deadline:
+            self.supervisor.poll()
+            time.sleep(0.05)
+            metrics = self.supervisor.get_metrics()
+        self.assertEqual(metrics['players'], 3)
+        self.assertEqual(metrics['rooms'], 2)
+        self.assertEqual(metrics['healthy_workers'], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
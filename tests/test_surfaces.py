@@ -0,0 +1,57 @@
+import unittest
+import pygame
+from ui.surfaces import create_surface, display_ready, prepare_surface
+
+
+class TestPrepareSurfaceWithoutDisplay(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_surface_returned_unchanged(self):
+        surface = create_surface((20, 20), alpha=True)
+        self.assertFalse(display_ready())
+        self.assertIs(prepare_surface(surface), surface)
+
+
+class TestPrepareSurface(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        try:
+            self.screen = pygame.display.set_mode((100, 100))
+        except pygame.error:
+            pygame.quit()
+            self.skipTest("No video device")
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_alpha_art_is_converted_and_rle_accelerated(self):
+        surface = create_surface((20, 20), alpha=True)
+        pygame.draw.circle(surface, (255, 50, 50), (10, 10), 8)
+        prepared = prepare_surface(surface)
+        self.assertIsNot(prepared, surface)
+        self.assertTrue(prepared.get_flags() & pygame.SRCALPHA)
+        self.assertTrue(prepared.get_flags() & pygame.RLEACCELOK)
+
+        # Blitting gives the same pixels as the original art
+        expected = pygame.Surface((20, 20))
+        expected.blit(surface, (0, 0))
+        actual = pygame.Surface((20, 20))
+        actual.blit(prepared, (0, 0))
+        self.assertEqual(pygame.image.tostring(actual, "RGB"), pygame.image.tostring(expected, "RGB"))
+
+    def test_opaque_art_matches_display_format(self):
+        surface = create_surface((20, 20))
+        prepared = prepare_surface(surface, alpha=False)
+        self.assertEqual(prepared.get_bitsize(), self.screen.get_bitsize())
+        self.assertFalse(prepared.get_flags() & pygame.RLEACCELOK, "Nothing to skip without a colorkey")
+
+        surface.set_colorkey((0, 0, 0))
+        self.assertTrue(prepare_surface(surface, alpha=False).get_flags() & pygame.RLEACCELOK)
+
+
+if __name__ == '__main__':
+    unittest.main()
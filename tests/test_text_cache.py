@@ -0,0 +1,69 @@
+import unittest
+import pygame
+from ui import text_cache
+from ui.text_cache import TextCache, get_font, render_text
+
+
+class TestFontRegistry(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_fonts_are_shared(self):
+        self.assertIs(get_font("Arial", 20), get_font("Arial", 20))
+        self.assertIsNot(get_font("Arial", 20), get_font("Arial", 20, bold=True))
+        self.assertIs(get_font(None, 36), get_font(None, 36))
+
+    def test_registry_cleared_on_quit(self):
+        get_font("Arial", 20)
+        render_text("hello", 20, (255, 255, 255))
+        pygame.quit()
+        self.assertEqual(text_cache._fonts, {})
+        self.assertEqual(len(text_cache.text_cache), 0)
+
+        # Fonts are reloaded after pygame comes back up
+        pygame.init()
+        self.assertGreater(render_text("hello", 20, (255, 255, 255)).get_width(), 0)
+
+
+class TestTextCache(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_repeated_text_is_rendered_once(self):
+        cache = TextCache()
+        first = cache.render("Score: 10", 28, (220, 220, 255), bold=True)
+        second = cache.render("Score: 10", 28, (220, 220, 255), bold=True)
+        self.assertIs(first, second)
+        self.assertEqual(cache.get_stats(), {'entries': 1, 'hits': 1, 'misses': 1})
+
+    def test_key_includes_font_size_and_color(self):
+        cache = TextCache()
+        cache.render("Score", 28, (255, 255, 255))
+        cache.render("Score", 28, (0, 0, 0))
+        cache.render("Score", 20, (255, 255, 255))
+        cache.render("Score", 28, (255, 255, 255), font_name=None)
+        cache.render("Score", 28, (255, 255, 255), bold=True)
+        self.assertEqual(len(cache), 5)
+        self.assertEqual(cache.hits, 0)
+
+    def test_least_recently_used_is_evicted(self):
+        cache = TextCache(max_entries=2)
+        a = cache.render("a", 20, (255, 255, 255))
+        cache.render("b", 20, (255, 255, 255))
+        cache.render("a", 20, (255, 255, 255)) # "b" is now the oldest
+        cache.render("c", 20, (255, 255, 255))
+        self.assertEqual(len(cache), 2)
+        self.assertIs(cache.render("a", 20, (255, 255, 255)), a)
+        misses = cache.misses
+        cache.render("b", 20, (255, 255, 255))
+        self.assertEqual(cache.misses, misses + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,8 @@
 import pygame
 import math
 from pygame import gfxdraw
+from ui.surfaces import create_surface, prepare_surface
+from ui.text_cache import render_text
 
 
 class Button:
@@ -22,6 +24,11 @@ class Button:
         self.text = text
         self.action = action
         self.hovered = False
+        self.glow_enabled = True # Turned off to save time on slow machines
+
+        # Baked look for each hover state, rebuilt when the text or size changes
+        self._surfaces = None
+        self._surfaces_key = None
 
     def update(self, events):
         # Check if the mouse is hovering over the button
@@ -37,22 +44,33 @@ class Button:
                 if self.hovered and self.action:
                     self.action()
 
-    def draw(self, surface):
+    def _get_surfaces(self):
         """
-        Draw the button on the given surface with visual feedback for hover state
+        Get the baked surfaces for the button's look, rebuilding them when the
+        text or size changed
 
-        Args:
-            surface: The pygame surface to draw on
+        Returns:
+            dict: {'normal': Surface, 'hovered': Surface, 'glow': Surface}
         """
+        key = (self.text, self.rect.width, self.rect.height)
+        if self._surfaces_key != key:
+            self._surfaces = {
+                'normal': self._bake(hovered=False),
+                'hovered': self._bake(hovered=True),
+                'glow': self._bake_glow(),
+            }
+            self._surfaces_key = key
+        return self._surfaces
+
+    def _bake(self, hovered):
+        """Draw the button body and text for one hover state onto a new surface"""
         # Determine colors based on hover state
-        bg_color = (80, 180, 80) if self.hovered else (60, 140, 60)
-        border_color = (120, 255, 120) if self.hovered else (100, 200, 100)
+        bg_color = (80, 180, 80) if hovered else (60, 140, 60)
+        border_color = (120, 255, 120) if hovered else (100, 200, 100)
         text_color = (255, 255, 255)
 
         # Create button surface with alpha for glow effects
-        button_surface = pygame.Surface(
-            (self.rect.width, self.rect.height), pygame.SRCALPHA
-        )
+        button_surface = create_surface((self.rect.width, self.rect.height), alpha=True)
 
         # Draw button base
         pygame.draw.rect(
@@ -83,31 +101,40 @@ class Button:
             )
 
         # Draw text
-        font = pygame.font.SysFont("Arial", 20, bold=True)
-        text_surf = font.render(self.text, True, text_color)
+        text_surf = render_text(self.text, 20, text_color, bold=True)
         text_pos = (
             self.rect.width // 2 - text_surf.get_width() // 2,
             self.rect.height // 2 - text_surf.get_height() // 2,
         )
         button_surface.blit(text_surf, text_pos)
+        return prepare_surface(button_surface)
 
-        # Draw button on target surface
-        surface.blit(button_surface, (self.rect.x, self.rect.y))
+    def _bake_glow(self):
+        """Draw the hover glow onto a new surface 5 pixels larger on each side"""
+        glow_surf = create_surface((self.rect.width + 10, self.rect.height + 10), alpha=True)
+        for i in range(5):
+            alpha = 10 - i * 2
+            pygame.draw.rect(
+                glow_surf,
+                (120, 255, 120, alpha),
+                (5 - i, 5 - i, self.rect.width + i * 2, self.rect.height + i * 2),
+                border_radius=10 + i,
+            )
+        return prepare_surface(glow_surf)
+
+    def draw(self, surface):
+        """
+        Draw the button on the given surface with visual feedback for hover state
+
+        Args:
+            surface: The pygame surface to draw on
+        """
+        surfaces = self._get_surfaces()
+        surface.blit(surfaces['hovered' if self.hovered else 'normal'], (self.rect.x, self.rect.y))
 
         # Add glow effect if hovered
-        if self.hovered:
-            glow_surf = pygame.Surface(
-                (self.rect.width + 10, self.rect.height + 10), pygame.SRCALPHA
-            )
-            for i in range(5):
-                alpha = 10 - i * 2
-                pygame.draw.rect(
-                    glow_surf,
-                    (120, 255, 120, alpha),
-                    (5 - i, 5 - i, self.rect.width + i * 2, self.rect.height + i * 2),
-                    border_radius=10 + i,
-                )
-            surface.blit(glow_surf, (self.rect.x - 5, self.rect.y - 5))
+        if self.hovered and self.glow_enabled:
+            surface.blit(surfaces['glow'], (self.rect.x - 5, self.rect.y - 5))
 
 
 class Panel:
@@ -128,23 +155,23 @@ class Panel:
         self.bg_color = bg_color
         self.shadow_offset = 5
 
-    def draw(self, surface):
-        """Render the panel with shadow effect"""
-        # Draw shadow
-        shadow_rect = self.rect.copy()
-        shadow_rect.x += self.shadow_offset
-        shadow_rect.y += self.shadow_offset
-        pygame.draw.rect(
-            surface,
-            (0, 0, 0, 100),  # Semi-transparent black
-            shadow_rect,
-            border_radius=15,
-        )
+        # Baked panel body, rebuilt when the size or color changes
+        self._surface = None
+        self._surface_key = None
+
+    def _get_surface(self):
+        """
+        Get the baked panel body, rebuilding it when the size or color changed
+
+        Returns:
+            pygame.Surface: Panel background, highlight and border
+        """
+        key = (self.rect.width, self.rect.height, tuple(self.bg_color))
+        if self._surface_key == key:
+            return self._surface
 
         # Draw panel background
-        panel_surface = pygame.Surface(
-            (self.rect.width, self.rect.height), pygame.SRCALPHA
-        )
+        panel_surface = create_surface((self.rect.width, self.rect.height), alpha=True)
         pygame.draw.rect(
             panel_surface,
             self.bg_color,
@@ -172,7 +199,24 @@ class Panel:
             width=2,
         )
 
-        surface.blit(panel_surface, (self.rect.x, self.rect.y))
+        self._surface = prepare_surface(panel_surface)
+        self._surface_key = key
+        return self._surface
+
+    def draw(self, surface):
+        """Render the panel with shadow effect"""
+        # Draw shadow
+        shadow_rect = self.rect.copy()
+        shadow_rect.x += self.shadow_offset
+        shadow_rect.y += self.shadow_offset
+        pygame.draw.rect(
+            surface,
+            (0, 0, 0, 100),  # Semi-transparent black
+            shadow_rect,
+            border_radius=15,
+        )
+
+        surface.blit(self._get_surface(), (self.rect.x, self.rect.y))
 
 
 class ScoreDisplay:
@@ -229,12 +273,14 @@ class ScoreDisplay:
         Args:
             surface: The surface to draw on
             score: The current game score to display (optional)
+
+        Returns:
+            pygame.Rect: Area drawn over
         """
         # Implementation to draw the score
         # Only render if not already handled by the renderer
         if score is None:
             score = self.current_displayed_score
 
-        font = pygame.font.Font(None, 36)
-        text = font.render(f"Score: {score}", True, (255, 255, 255))
-        surface.blit(text, (self.x, self.y))
+        text = render_text(f"Score: {score}", 36, (255, 255, 255), font_name=None)
+        return surface.blit(text, (self.x, self.y))
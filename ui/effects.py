@@ -1,6 +1,9 @@
 import pygame
 import random
 import math
+from ui.surfaces import create_surface, prepare_surface
+
+REDUCED_PARTICLE_LIMIT = 20 # Live particles kept when particle effects are scaled down
 
 
 class Particle:
@@ -32,7 +35,7 @@ class Particle:
             self.size = max(0.1, self.size * (self.lifetime / self.original_lifetime))
 
     def draw(self, surface):
-        """Draw particle on surface"""
+        """Draw particle on surface, returning the rect drawn over"""
         # Fade out as lifetime decreases
         alpha = (
             int(255 * (self.lifetime / self.original_lifetime)) if self.fade else 255
@@ -46,12 +49,13 @@ class Particle:
 
         # Draw as a circle with anti-aliasing if size permits
         if self.size >= 1:
-            pygame.draw.circle(
+            return pygame.draw.circle(
                 surface, color_with_alpha, (int(self.x), int(self.y)), int(self.size)
             )
         else:
             # For very small particles, just draw a pixel
             surface.set_at((int(self.x), int(self.y)), color_with_alpha)
+            return pygame.Rect(int(self.x), int(self.y), 1, 1)
 
 
 class ParticleSystem:
@@ -61,9 +65,18 @@ class ParticleSystem:
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.particles = []
+        self.max_particles = None # No limit
+
+    def set_max_particles(self, limit):
+        """Limit the number of live particles (None for no limit), dropping the oldest extras"""
+        self.max_particles = limit
+        if limit is not None and len(self.particles) > limit:
+            self.particles = self.particles[-limit:]
 
     def add_particle(self, x, y, velocity, color, lifetime, size=2, fade=True):
         """Add a single particle to the system"""
+        if self.max_particles is not None and len(self.particles) >= self.max_particles:
+            return
         self.particles.append(Particle(x, y, velocity, color, lifetime, size, fade))
 
     def add_explosion(
@@ -94,9 +107,49 @@ class ParticleSystem:
         self.particles = [p for p in self.particles if not p.is_dead]
 
     def draw(self, surface):
-        """Draw all particles on the given surface"""
-        for particle in self.particles:
-            particle.draw(surface)
+        """Draw all particles on the given surface, returning the rects drawn over"""
+        return [particle.draw(surface) for particle in self.particles]
+
+
+class ScrollingGrid:
+    """
+    Grid background that scrolls diagonally. The grid is drawn once onto a
+    surface one cell larger than the screen, and each frame is a single blit of
+    it shifted by the scroll offset.
+    """
+
+    def __init__(self, screen_width, screen_height, spacing=40, bg_color=(5, 5, 30), line_color=(20, 20, 50)):
+        """
+        Args:
+            screen_width, screen_height: Area to cover
+            spacing: Distance between grid lines
+            bg_color: Color between the lines
+            line_color: Grid line color
+        """
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.spacing = spacing
+        self.surface = create_surface((screen_width + spacing, screen_height + spacing))
+        self.surface.fill(bg_color)
+        for x in range(0, screen_width + spacing, spacing):
+            pygame.draw.line(self.surface, line_color, (x, 0), (x, screen_height + spacing))
+        for y in range(0, screen_height + spacing, spacing):
+            pygame.draw.line(self.surface, line_color, (0, y), (screen_width + spacing, y))
+        self.surface = prepare_surface(self.surface, alpha=False)
+
+    def draw(self, surface, offset):
+        """
+        Fill the surface with the grid
+
+        Args:
+            surface: The surface to draw on
+            offset: Scroll offset in pixels; lines sit at offset plus multiples of spacing
+
+        Returns:
+            pygame.Rect: Area drawn over
+        """
+        shift = int(offset) % self.spacing - self.spacing
+        return surface.blit(self.surface, (shift, shift))
 
 
 class AnimationManager:
@@ -0,0 +1,98 @@
+import logging
+
+FRAME_BUDGET = 1.0 / 60 # Seconds of update and render work per frame at 60 FPS
+
+# Optional visual work, in the order it is given up when frames run over budget
+QUALITY_FEATURES = ("glow", "particles", "food_pulse", "interpolation")
+
+SMOOTHING = 0.1        # Weight of the newest frame in the moving average of frame work
+DEGRADE_FRAMES = 30    # Consecutive frames over budget before dropping a feature
+RESTORE_FRAMES = 120   # Consecutive frames with headroom before bringing one back
+RESTORE_HEADROOM = 0.6 # Fraction of the budget frames must stay under to restore
+
+
+class FrameBudget:
+    """
+    Watches how long each frame's update and render take and trades visual
+    quality for time. When the average runs over budget for a while, the next
+    feature in QUALITY_FEATURES is switched off; when there has been plenty of
+    headroom for longer, the last one switched off comes back. The gaps between
+    changes stop the quality flapping on frames close to the budget.
+    """
+
+    def __init__(self, budget=FRAME_BUDGET, features=QUALITY_FEATURES):
+        """
+        Args:
+            budget: Seconds of work allowed per frame
+            features: Optional features in the order they are degraded
+        """
+        self.budget = budget
+        self.features = tuple(features)
+        self.level = 0 # Number of features switched off, from the front of the list
+        self.average = None
+        self.update_time = 0.0
+        self.render_time = 0.0
+        self.frames_over = 0
+        self.frames_under = 0
+
+    @property
+    def quality(self):
+        """
+        Returns:
+            dict: {feature: enabled}
+        """
+        return {feature: i >= self.level for i, feature in enumerate(self.features)}
+
+    def record(self, update_seconds, render_seconds):
+        """
+        Record one frame's work and adjust quality
+
+        Args:
+            update_seconds: Time spent on input, networking and game ticks
+            render_seconds: Time spent drawing and presenting the frame
+
+        Returns:
+            bool: True if the quality changed
+        """
+        self.update_time = update_seconds
+        self.render_time = render_seconds
+        work = update_seconds + render_seconds
+        if self.average is None:
+            self.average = work
+        else:
+            self.average += SMOOTHING * (work - self.average)
+
+        if self.average > self.budget:
+            self.frames_over += 1
+            self.frames_under = 0
+        elif self.average < self.budget * RESTORE_HEADROOM:
+            self.frames_under += 1
+            self.frames_over = 0
+        else:
+            self.frames_over = 0
+            self.frames_under = 0
+
+        if self.frames_over >= DEGRADE_FRAMES and self.level < len(self.features):
+            self.level += 1
+            logging.info(f"Frames over budget ({self.average * 1000:.1f} ms), disabling {self.features[self.level - 1]}")
+        elif self.frames_under >= RESTORE_FRAMES and self.level > 0:
+            self.level -= 1
+            logging.info(f"Frame budget has headroom ({self.average * 1000:.1f} ms), restoring {self.features[self.level]}")
+        else:
+            return False
+        self.frames_over = 0
+        self.frames_under = 0
+        return True
+
+    def get_stats(self):
+        """
+        Returns:
+            dict: Last frame's update and render time and the average work, in ms,
+                with the features currently switched off
+        """
+        return {
+            'update_ms': self.update_time * 1000,
+            'render_ms': self.render_time * 1000,
+            'average_ms': (self.average or 0.0) * 1000,
+            'disabled': list(self.features[:self.level]),
+        }
@@ -1,7 +1,16 @@
 import pygame
 import math
+from collections import Counter
 from pygame import gfxdraw
 from snake_game.core.config import GRID_SIZE, BLACK, WHITE, GREEN, RED, BLUE
+from ui.surfaces import create_surface, prepare_surface
+from ui.text_cache import render_text
+
+# Dirty-rect rendering redraws the whole frame once this fraction of the screen changed
+FULL_REDRAW_RATIO = 0.5
+
+FOOD_PULSE_FRAMES = 32 # Precomputed steps of the food pulse animation
+LAYER_MAX_STEPS = 4    # Ticks a snake may advance between frames and still be updated incrementally
 
 
 class SnakeRenderer:
@@ -30,6 +39,31 @@ class SnakeRenderer:
         # Prepare animation variables
         self.animations = {}
         self.food_pulse = 0
+        self.food_pulse_enabled = True
+
+        # Smooth snake motion between simulation ticks
+        self.interpolation_enabled = True
+
+        # {player_id: {'body', 'color', 'sprites', 'blits'}}: each snake's segment sprites
+        # at its tick position, updated from its head and tail changes
+        self.tick_sprites = {}
+
+        # Sprites drawn by the last frame, for dirty-rect rendering. None means the
+        # screen content is unknown and the next dirty frame must redraw everything.
+        self.last_sprites = None
+        self.last_sprite_keys = set()
+
+        # Background with every snake drawn at its tick position. Only render_game()
+        # frames without interpolation use it (interpolation is on by default and
+        # the frame budget turns it off under load); interpolated frames draw
+        # sprites and leave the layer to catch up, or be rebuilt, when next used.
+        self.snake_layer = None
+        self.layer_bodies = {}  # {player_id: body drawn on the layer}
+        self.layer_colors = {}  # {player_id: color drawn on the layer}
+        self.layer_counts = Counter() # Segments covering each cell of the layer
+
+        # Game over overlay, composed when the game ends and kept until it restarts
+        self.game_over_overlay = None
 
     def _initialize_assets(self):
         """Initialize and cache game assets"""
@@ -38,9 +72,14 @@ class SnakeRenderer:
         self.assets["food"] = self._create_food_surface()
         self.snake_segment_cache = {} # Cache for snake segments by color
 
+        # Pulse animation frames per food asset: [(size, surface)] over one period
+        self.food_pulse_frames = {
+            "food": self._create_pulse_frames(self.assets["food"]),
+        }
+
     def _create_background(self):
         """Create a pre-rendered background grid surface for performance"""
-        bg = pygame.Surface((self.screen_width, self.screen_height))
+        bg = create_surface((self.screen_width, self.screen_height))
         bg.fill((10, 10, 35))  # Dark blue background
 
         # Draw subtle grid lines
@@ -49,13 +88,13 @@ class SnakeRenderer:
         for y in range(0, self.screen_height, GRID_SIZE):
             pygame.draw.line(bg, (30, 30, 60), (0, y), (self.screen_width, y))
 
-        return bg
+        return prepare_surface(bg, alpha=False)
 
     def _create_smooth_rect(
         self, width, height, base_color, edge_color, corner_radius_factor=0.5
     ):
         """Create a rectangle with smooth edges and gradient fill"""
-        surf = pygame.Surface((width, height), pygame.SRCALPHA)
+        surf = create_surface((width, height), alpha=True)
         rect = pygame.Rect(0, 0, width, height)
         corner_radius = int(min(width, height) * corner_radius_factor)
 
@@ -79,7 +118,7 @@ class SnakeRenderer:
     def _create_food_surface(self):
         """Create food with glowing effect"""
         size = GRID_SIZE
-        surf = pygame.Surface((size, size), pygame.SRCALPHA)
+        surf = create_surface((size, size), alpha=True)
         center = size // 2
 
         # Draw base circular shape
@@ -90,8 +129,33 @@ class SnakeRenderer:
 
         return surf
 
-    def _update_animations(self):
-        """Update animation states"""
+    def _create_pulse_frames(self, asset, frames=FOOD_PULSE_FRAMES):
+        """
+        Pre-scale a food asset for each step of the pulse animation
+
+        Args:
+            asset: Full-size food surface
+            frames: Number of steps over one pulse period
+
+        Returns:
+            list: (size, surface) per step; steps of equal size share a surface
+        """
+        scaled = {}
+        pulse_frames = []
+        for i in range(frames):
+            # Same curve as the pulse: 90% of the cell, +-10%
+            scale_factor = 0.9 + 0.1 * math.sin(2 * math.pi * i / frames)
+            size = int(GRID_SIZE * scale_factor)
+            if size not in scaled:
+                scaled[size] = prepare_surface(pygame.transform.scale(asset, (size, size)))
+            pulse_frames.append((size, scaled[size]))
+        return pulse_frames
+
+    def update_animations(self):
+        """Advance animations by one rendered frame"""
+        if not self.food_pulse_enabled:
+            return # Food stays at its current size
+
         # Update food pulsing effect
         self.food_pulse = (self.food_pulse + 0.1) % (2 * math.pi)
 
@@ -112,6 +176,9 @@ class SnakeRenderer:
         else: # body
             surface = self._create_smooth_rect(GRID_SIZE, GRID_SIZE, base_color, edge_color, 0.7)
         
+        # Each segment is its own RLE-accelerated surface, which blits faster than
+        # cells of a shared atlas page (and subsurfaces of one lose RLE altogether)
+        surface = prepare_surface(surface)
         self.snake_segment_cache[(color_tuple, segment_type)] = surface
         return surface
 
@@ -119,31 +186,228 @@ class SnakeRenderer:
         """Render the background grid"""
         screen.blit(self.background, (0, 0))
 
-    def render_snakes(self, screen, snakes_dict):
+    def _interpolate_body(self, body, previous_body, alpha):
+        """
+        Blend segment positions between the previous and current tick.
+
+        Args:
+            body: Current list of (x, y) segment positions
+            previous_body: Segment positions before the latest tick
+            alpha: Progress towards the next tick, 0.0 (previous) to 1.0 (current)
+
+        Returns:
+            list: Segment positions to draw
+        """
+        positions = []
+        for i, (x, y) in enumerate(body):
+            if i >= len(previous_body):
+                positions.append((x, y)) # New segment from growth has no previous position
+                continue
+            prev_x, prev_y = previous_body[i]
+            if abs(x - prev_x) + abs(y - prev_y) > GRID_SIZE:
+                positions.append((x, y)) # Teleport (reset or resync), don't slide across the board
+                continue
+            positions.append((
+                round(prev_x + (x - prev_x) * alpha),
+                round(prev_y + (y - prev_y) * alpha),
+            ))
+        return positions
+
+    def render_snakes(self, screen, snakes_dict, alpha=1.0, previous_bodies=None):
         """
         Render all snakes with visual enhancements using their assigned colors.
 
         Args:
             screen: Pygame surface to draw on
             snakes_dict: Dictionary of snake objects {player_id: snake_obj}
+            alpha: Progress between the previous and current tick, for interpolation
+            previous_bodies: Dictionary of segment positions before the latest tick
+        """
+        interpolating = self.interpolation_enabled and previous_bodies and alpha < 1.0
+        if interpolating:
+            blits = [(segment_surface, segment_pos) for _, segment_surface, segment_pos
+                     in self._snake_sprites(snakes_dict, alpha, previous_bodies)]
+        else:
+            blits = []
+            for player_id, snake_obj in self._drawable_snakes(snakes_dict).items():
+                blits.extend(self._get_tick_sprites(player_id, snake_obj)['blits'])
+        screen.blits(blits, doreturn=False)
+
+    def _drawable_snakes(self, snakes_dict):
+        """
+        Skip malformed snakes or ones lacking a color, and forget the cached sprites
+        of snakes that are no longer in the game
+
+        Returns:
+            dict: {player_id: snake_obj} of the snakes to draw
+        """
+        snakes = {player_id: snake for player_id, snake in (snakes_dict or {}).items()
+                  if snake and hasattr(snake, 'body') and hasattr(snake, 'color')}
+        for player_id in self.tick_sprites.keys() - snakes.keys():
+            del self.tick_sprites[player_id]
+        return snakes
+
+    def _segment_sprites(self, color, body):
+        """
+        Get the sprites of one snake's segments, body first so the head renders on top
+
+        Returns:
+            list: (key, surface, position) tuples
+        """
+        if not body:
+            return []
+        body_surface = self._get_or_create_snake_segment_surface(color, "body")
+        sprites = [((color, "body", segment_pos), body_surface, segment_pos) for segment_pos in body[:0:-1]]
+        head_pos = body[0]
+        head_surface = self._get_or_create_snake_segment_surface(color, "head")
+        sprites.append(((color, "head", head_pos), head_surface, head_pos))
+        return sprites
+
+    def _get_tick_sprites(self, player_id, snake):
+        """
+        Get a snake's sprites at its tick position. They are kept between frames and,
+        when the snake moved or grew, updated by dropping the lost tail and old head
+        and appending the new cells, so a tick costs its changes instead of the
+        snake's length.
+
+        Returns:
+            dict: 'sprites' as (key, surface, position) and 'blits' as (surface, position),
+                both in drawing order; shared, do not modify
+        """
+        body = snake.body
+        cached = self.tick_sprites.get(player_id)
+        steps = None
+        if cached is not None and cached['color'] == snake.color:
+            steps = self._snake_steps(cached['body'], body)
+        if steps is None:
+            sprites = self._segment_sprites(snake.color, body)
+            cached = self.tick_sprites[player_id] = {
+                'body': list(body),
+                'color': snake.color,
+                'sprites': sprites,
+                'blits': [(segment_surface, segment_pos) for _, segment_surface, segment_pos in sprites],
+            }
+        elif steps:
+            lost = len(cached['body']) - (len(body) - steps)
+            added = self._segment_sprites(snake.color, body[:steps + 1]) # New cells and the old head, now body
+            for sequence, new in ((cached['sprites'], added),
+                                  (cached['blits'], [(surface, pos) for _, surface, pos in added])):
+                del sequence[:lost]
+                sequence.pop() # The old head is stamped again as body
+                sequence.extend(new)
+            cached['body'] = list(body)
+        return cached
+
+    def _snake_sprites(self, snakes_dict, alpha=1.0, previous_bodies=None):
         """
-        if not snakes_dict:
-            return
+        Get the segment surfaces of all snakes in drawing order. Snakes at their tick
+        position come from the per-snake cache; interpolated ones are built per frame.
 
-        for player_id, snake_obj in snakes_dict.items():
-            if not snake_obj or not hasattr(snake_obj, 'body') or not hasattr(snake_obj, 'color'):
-                continue # Skip if snake object is malformed or lacks color
+        Returns:
+            list: (key, surface, position) tuples; equal keys mean identical pixels
+        """
+        sprites = []
+        for player_id, snake_obj in self._drawable_snakes(snakes_dict).items():
+            previous_body = None
+            if self.interpolation_enabled and previous_bodies and alpha < 1.0:
+                previous_body = previous_bodies.get(player_id)
+            if previous_body:
+                body = self._interpolate_body(snake_obj.body, previous_body, alpha)
+                sprites.extend(self._segment_sprites(snake_obj.color, body))
+            else:
+                sprites.extend(self._get_tick_sprites(player_id, snake_obj)['sprites'])
+        return sprites
+
+    def _rebuild_snake_layer(self, snakes):
+        """Redraw the snake layer from scratch"""
+        if self.snake_layer is None:
+            self.snake_layer = self.background.copy()
+        else:
+            self.snake_layer.blit(self.background, (0, 0))
+        self.snake_layer.blits([(segment_surface, segment_pos) for _, segment_surface, segment_pos
+                                in self._snake_sprites(snakes, 1.0)], doreturn=False)
+        self.layer_bodies = {player_id: list(snake.body) for player_id, snake in snakes.items()}
+        self.layer_colors = {player_id: snake.color for player_id, snake in snakes.items()}
+        self.layer_counts = Counter(position for body in self.layer_bodies.values() for position in body)
+
+    def _snake_steps(self, old_body, body):
+        """
+        Work out how a snake changed since it was drawn on the layer
+
+        Args:
+            old_body: Segment positions on the layer
+            body: Current segment positions
 
-            snake_color_tuple = snake_obj.color 
-            
-            # Render body segments (in reverse so head renders on top)
-            for i, segment_pos in enumerate(reversed(snake_obj.body)):
-                is_head = (i == len(snake_obj.body) - 1)
-                segment_type = "head" if is_head else "body"
-                
-                segment_surface = self._get_or_create_snake_segment_surface(snake_color_tuple, segment_type)
-                screen.blit(segment_surface, segment_pos)
+        Returns:
+            int: Number of new head cells, or None if the change is not a plain move/grow
+        """
+        if not old_body or not body:
+            return None if old_body or body else 0
+        for steps in range(min(LAYER_MAX_STEPS, len(body) - 1) + 1):
+            if body[steps] == old_body[0]:
+                kept = len(body) - steps
+                # A move keeps the old body minus its tail behind the new head cells
+                if kept <= len(old_body) and body[steps:] == old_body[:kept]:
+                    return steps
+                return None
+        return None
+
+    def _update_snake_layer(self, snakes):
+        """
+        Bring the snake layer up to date with the snakes' current bodies, for a frame
+        drawn without interpolation. Each snake that moved or grew costs blits for
+        its new head cells and lost tail cells, plus a copy and compare of its body;
+        anything else (a snake joining, leaving, respawning, overlapping another
+        segment, or more than LAYER_MAX_STEPS ticks since the layer was last used)
+        redraws the layer from scratch.
 
+        Args:
+            snakes: Dictionary of snake objects {player_id: snake_obj}
+
+        Returns:
+            pygame.Surface: The snake layer
+        """
+        snakes = self._drawable_snakes(snakes)
+        if self.snake_layer is None or snakes.keys() != self.layer_bodies.keys():
+            self._rebuild_snake_layer(snakes)
+            return self.snake_layer
+
+        counts = self.layer_counts
+        erase = []
+        stamps = []
+        for player_id, snake in snakes.items():
+            old_body = self.layer_bodies[player_id]
+            body = snake.body
+            steps = self._snake_steps(old_body, body)
+            if steps is None or snake.color != self.layer_colors[player_id]:
+                self._rebuild_snake_layer(snakes)
+                return self.snake_layer
+            if steps == 0:
+                continue
+            removed = old_body[len(body) - steps:]
+            for position in removed:
+                counts[position] -= 1
+            for position in body[:steps]:
+                counts[position] += 1
+            erase.extend(removed)
+            body_surface = self._get_or_create_snake_segment_surface(snake.color, "body")
+            head_surface = self._get_or_create_snake_segment_surface(snake.color, "head")
+            # The old head becomes body, then the new cells are stamped tail to head
+            stamps.extend((body_surface, position) for position in body[steps:0:-1])
+            stamps.append((head_surface, body[0]))
+            self.layer_bodies[player_id] = list(body)
+
+        stamped = {position for _, position in stamps}
+        if any(counts[position] > 1 for position in stamped) or \
+                any(counts[position] > 0 and position not in stamped for position in erase):
+            self._rebuild_snake_layer(snakes) # Overlapping segments: drawing order matters
+            return self.snake_layer
+
+        cell = (GRID_SIZE, GRID_SIZE)
+        for position in erase:
+            self.snake_layer.blit(self.background, position, pygame.Rect(position, cell))
+        self.snake_layer.blits(stamps, doreturn=False)
+        return self.snake_layer
 
     def render_food(self, screen, food):
         """
@@ -153,19 +417,23 @@ class SnakeRenderer:
             screen: Pygame surface to draw on
             food: Food object to render
         """
-        # Apply pulsing effect to food
-        scale_factor = 0.9 + 0.1 * math.sin(self.food_pulse)
-
-        # Calculate new dimensions
-        original_size = GRID_SIZE
-        new_size = int(original_size * scale_factor)
-        offset = (original_size - new_size) // 2
+        _, scaled_food, position = self._food_sprite(food)
+        screen.blit(scaled_food, position)
 
-        # Scale the food surface
-        scaled_food = pygame.transform.scale(self.assets["food"], (new_size, new_size))
+    def _food_sprite(self, food):
+        """
+        Returns:
+            tuple: (key, surface, position) of the food at the current pulse
+        """
+        # Pick the precomputed pulse frame for the current phase
+        pulse_frames = self.food_pulse_frames["food"]
+        frame = int(self.food_pulse / (2 * math.pi) * len(pulse_frames)) % len(pulse_frames)
+        new_size, scaled_food = pulse_frames[frame]
+        offset = (GRID_SIZE - new_size) // 2
 
         # Draw with centered offset
-        screen.blit(scaled_food, (food.x + offset, food.y + offset))
+        position = (food.x + offset, food.y + offset)
+        return ("food", new_size, position), scaled_food, position
 
     def render_score(self, screen, score):
         """
@@ -175,13 +443,11 @@ class SnakeRenderer:
             screen: Pygame surface to draw on
             score: Current game score to display
         """
-        font = pygame.font.SysFont("Arial", 28, bold=True)
-
         # Create gradient text effect
-        text = font.render(f"Score: {score}", True, (220, 220, 255))
+        text = render_text(f"Score: {score}", 28, (220, 220, 255), bold=True)
 
         # Add subtle shadow for depth
-        shadow = font.render(f"Score: {score}", True, (20, 20, 40))
+        shadow = render_text(f"Score: {score}", 28, (20, 20, 40), bold=True)
         screen.blit(shadow, (12, 12))
         screen.blit(text, (10, 10))
 
@@ -192,19 +458,19 @@ class SnakeRenderer:
         Args:
             screen: Pygame surface to draw on
         """
+        if self.game_over_overlay is None:
+            self.game_over_overlay = self._create_game_over_overlay()
+        screen.blit(self.game_over_overlay, (0, 0))
+
+    def _create_game_over_overlay(self):
+        """Compose the dimmed background and game over text into one surface"""
         # Semi-transparent overlay
-        overlay = pygame.Surface(
-            (self.screen_width, self.screen_height), pygame.SRCALPHA
-        )
+        overlay = create_surface((self.screen_width, self.screen_height), alpha=True)
         overlay.fill((0, 0, 0, 150))
-        screen.blit(overlay, (0, 0))
 
         # Game over text
-        font_large = pygame.font.SysFont("Arial", 64, bold=True)
-        font_small = pygame.font.SysFont("Arial", 28)
-
-        game_over = font_large.render("Game Over", True, (255, 50, 50))
-        restart_text = font_small.render("Press 'R' to restart", True, (200, 200, 200))
+        game_over = render_text("Game Over", 64, (255, 50, 50), bold=True)
+        restart_text = render_text("Press 'R' to restart", 28, (200, 200, 200))
 
         # Position text in center of screen
         game_over_rect = game_over.get_rect(
@@ -216,7 +482,7 @@ class SnakeRenderer:
 
         # Add shadow effect
         shadow_offset = 3
-        shadow1 = font_large.render("Game Over", True, (100, 0, 0))
+        shadow1 = render_text("Game Over", 64, (100, 0, 0), bold=True)
         shadow1_rect = shadow1.get_rect(
             center=(
                 self.screen_width // 2 + shadow_offset,
@@ -225,9 +491,10 @@ class SnakeRenderer:
         )
 
         # Draw elements
-        screen.blit(shadow1, shadow1_rect)
-        screen.blit(game_over, game_over_rect)
-        screen.blit(restart_text, restart_rect)
+        overlay.blit(shadow1, shadow1_rect)
+        overlay.blit(game_over, game_over_rect)
+        overlay.blit(restart_text, restart_rect)
+        return prepare_surface(overlay, rle=False) # Translucent everywhere, nothing to skip
 
     def render_frame(self, screen, game):
         """
@@ -238,7 +505,7 @@ class SnakeRenderer:
             game: Game object containing game state
         """
         # Update animations
-        self._update_animations()
+        self.update_animations()
 
         # Draw all components
         self.render_background(screen)
@@ -253,30 +520,53 @@ class SnakeRenderer:
 
         if game.is_game_over:
             self.render_game_over(screen)
+        self.invalidate() # Not tracked for dirty-rect rendering
 
         # Return filled surface
         return screen
 
-    def render_game(self, surface, game):
+    def _game_sprites(self, game, alpha=1.0):
+        """ Snake segments and food of a game in drawing order, see _snake_sprites(). """
+        if hasattr(game, 'snakes'):
+            sprites = self._snake_sprites(game.snakes, alpha, getattr(game, 'previous_bodies', None))
+        elif hasattr(game, 'snake'): # Backwards compatibility or single player mode
+            sprites = self._snake_sprites({"player1": game.snake} if game.snake else {})
+        else:
+            sprites = []
+        sprites.append(self._food_sprite(game.food))
+        return sprites
+
+    def render_game(self, surface, game, alpha=1.0, sprites=None):
         """
         Render the complete game state including snakes and food
 
         Args:
             surface: The surface to draw on
             game: The game state to render (should have game.snakes, game.food, game.score, game.is_game_over)
+            alpha: Fraction of the current tick elapsed, used to interpolate snake motion
+            sprites: Result of _game_sprites() if already computed for this frame
         """
-        # First render the background
-        self.render_background(surface)
-
-        # Render the snakes
-        if hasattr(game, 'snakes'):
-             self.render_snakes(surface, game.snakes)
-        elif hasattr(game, 'snake'): # Backwards compatibility or single player mode
-             self.render_snakes(surface, {"player1": game.snake} if game.snake else {})
-
-
-        # Render food
-        self.render_food(surface, game.food)
+        interpolating = self.interpolation_enabled and alpha < 1.0 and getattr(game, 'previous_bodies', None)
+        if hasattr(game, 'snakes') and not interpolating:
+            # Snakes sit on their tick positions: the snake layer already has them
+            surface.blit(self._update_snake_layer(game.snakes), (0, 0))
+            _, food_surface, food_position = self._food_sprite(game.food)
+            surface.blit(food_surface, food_position)
+            if sprites is None:
+                self.invalidate() # Sprites were not listed; the next dirty-rect frame starts over
+                if game.is_game_over:
+                    self.render_game_over(surface)
+                else:
+                    self.game_over_overlay = None
+                return
+        else:
+            # First render the background
+            self.render_background(surface)
+
+            # Render the snakes, then the food
+            if sprites is None:
+                sprites = self._game_sprites(game, alpha)
+            surface.blits([(sprite_surface, position) for _, sprite_surface, position in sprites], doreturn=False)
 
         # We'll skip score rendering here since it's handled by the ScoreDisplay component
         # Comment out or remove: self.render_score(surface, game.score)
@@ -284,3 +574,94 @@ class SnakeRenderer:
         # If game is over, render game over screen
         if game.is_game_over:
             self.render_game_over(surface)
+            self.invalidate() # The overlay covers everything
+        else:
+            self.game_over_overlay = None
+            self.last_sprites = sprites
+            self.last_sprite_keys = {key for key, _, _ in sprites}
+
+    def invalidate(self):
+        """Forget what is on screen so the next dirty-rect frame redraws everything"""
+        self.last_sprites = None
+        self.last_sprite_keys = set()
+
+    def _cells(self, rect):
+        """Grid cells overlapped by a rect"""
+        return {
+            (cx, cy)
+            for cx in range(rect.left // GRID_SIZE, (rect.right - 1) // GRID_SIZE + 1)
+            for cy in range(rect.top // GRID_SIZE, (rect.bottom - 1) // GRID_SIZE + 1)
+        }
+
+    def _sprite_cells(self, position, size):
+        """Grid cells overlapped by a sprite no larger than one cell: its corners' cells"""
+        x, y = position
+        if not x % GRID_SIZE and not y % GRID_SIZE and size == (GRID_SIZE, GRID_SIZE):
+            return ((x // GRID_SIZE, y // GRID_SIZE),) # Grid-aligned segment, the common case
+        left, top = x // GRID_SIZE, y // GRID_SIZE
+        right, bottom = (x + size[0] - 1) // GRID_SIZE, (y + size[1] - 1) // GRID_SIZE
+        return {(left, top), (right, top), (left, bottom), (right, bottom)}
+
+    def render_game_dirty(self, surface, game, alpha=1.0, restore=()):
+        """
+        Render the game, touching only the parts of the surface that changed since
+        the previous render_game() or render_game_dirty() call on this surface.
+
+        Sprites that disappeared or moved are erased with the background, and every
+        sprite that is new or overlaps an erased area is redrawn in drawing order.
+        Falls back to a full render_game() when the screen content is unknown, the
+        game is over or too much of the screen changed for partial updates to pay off
+        (e.g. a long snake sliding with interpolation).
+
+        Args:
+            surface: The surface to draw on, holding the previous frame
+            game: The game state to render
+            alpha: Fraction of the current tick elapsed, used to interpolate snake motion
+            restore: Rects drawn over by something else since the last frame (e.g. HUD),
+                to be restored to the game image
+
+        Returns:
+            list: Changed pygame.Rect areas, for pygame.display.update()
+        """
+        screen_rect = surface.get_rect()
+        sprites = self._game_sprites(game, alpha)
+        if self.last_sprites is None or game.is_game_over:
+            self.render_game(surface, game, alpha, sprites)
+            return [screen_rect]
+
+        current_keys = {key for key, _, _ in sprites}
+        previous_keys = self.last_sprite_keys
+        gone = [(sprite_surface, position) for key, sprite_surface, position in self.last_sprites
+                if key not in current_keys]
+        changed = len(gone) + len(current_keys - previous_keys)
+        full_redraw_cells = FULL_REDRAW_RATIO * screen_rect.width * screen_rect.height / (GRID_SIZE * GRID_SIZE)
+        if changed > full_redraw_cells:
+            self.render_game(surface, game, alpha, sprites)
+            return [screen_rect]
+
+        erased = [pygame.Rect(rect).clip(screen_rect) for rect in restore]
+        dirty_cells = set()
+        for rect in erased:
+            dirty_cells |= self._cells(rect)
+        for sprite_surface, position in gone:
+            size = sprite_surface.get_size()
+            erased.append(pygame.Rect(position, size).clip(screen_rect))
+            dirty_cells.update(self._sprite_cells(position, size))
+
+        redraw = []
+        for key, sprite_surface, position in sprites:
+            cells = self._sprite_cells(position, sprite_surface.get_size())
+            if key not in previous_keys or not dirty_cells.isdisjoint(cells):
+                redraw.append((sprite_surface, position))
+                dirty_cells.update(cells) # Sprites drawn later on top of this one are redrawn too
+
+        if len(dirty_cells) > full_redraw_cells:
+            self.render_game(surface, game, alpha, sprites)
+            return [screen_rect]
+
+        for rect in erased:
+            surface.blit(self.background, rect, rect)
+        rects = erased + surface.blits(redraw)
+        self.last_sprites = sprites
+        self.last_sprite_keys = current_keys
+        return rects
@@ -4,7 +4,9 @@ import time
 import math
 from snake_game.core.config import UP, DOWN, LEFT, RIGHT, GRID_SIZE
 from ui.components import Button, Panel, ScoreDisplay
-from ui.effects import ParticleSystem
+from ui.effects import ParticleSystem, ScrollingGrid, REDUCED_PARTICLE_LIMIT
+from ui.surfaces import create_surface, prepare_surface
+from ui.text_cache import get_font, render_text
 
 
 class Screen:
@@ -26,6 +28,15 @@ class Screen:
         """Render the screen"""
         pass
 
+    def set_quality(self, quality):
+        """
+        Turn optional visual work on or off
+
+        Args:
+            quality: {feature: enabled}, see ui.frame_budget.QUALITY_FEATURES
+        """
+        pass
+
 
 class MenuScreen(Screen):
     """Main menu screen with game options"""
@@ -51,10 +62,10 @@ class MenuScreen(Screen):
         # IP Input for Join Game
         self.ip_input_active = False
         self.ip_address_str = "localhost" # Default IP
-        self.font_small = pygame.font.SysFont("Arial", 24) # For IP input text
 
         # Background animation
         self.bg_offset = 0
+        self.background_grid = ScrollingGrid(screen_width, screen_height)
         self.particles = ParticleSystem(screen_width, screen_height)
 
         # Title animation
@@ -190,6 +201,13 @@ class MenuScreen(Screen):
 
 
 
+    def set_quality(self, quality):
+        """Drop button glow and most particles when frames run over budget"""
+        for button in (self.classic_mode_button, self.start_button, self.host_game_button,
+                       self.join_game_button, self.quit_button):
+            button.glow_enabled = quality.get("glow", True)
+        self.particles.set_max_particles(None if quality.get("particles", True) else REDUCED_PARTICLE_LIMIT)
+
     def update(self, dt):
         """Update menu animations"""
         self.bg_offset = (self.bg_offset + 0.2 * dt) % 40
@@ -201,14 +219,8 @@ class MenuScreen(Screen):
 
     def render(self, surface):
         """Render menu screen"""
-        # Fill background with dark color
-        surface.fill((5, 5, 30))
-
-        # Draw animated background grid
-        for x in range(-40 + int(self.bg_offset), self.screen_width, 40):
-            pygame.draw.line(surface, (20, 20, 50), (x, 0), (x, self.screen_height))
-        for y in range(-40 + int(self.bg_offset), self.screen_height, 40):
-            pygame.draw.line(surface, (20, 20, 50), (0, y), (self.screen_width, y))
+        # Draw animated background grid over a dark background
+        self.background_grid.draw(surface, self.bg_offset)
 
         # Draw particles
         self.particles.draw(surface)
@@ -217,13 +229,8 @@ class MenuScreen(Screen):
         self.main_panel.draw(surface)
 
         # Draw title
-        font_large = pygame.font.SysFont("Arial", 72, bold=True)
-        font_subtitle = pygame.font.SysFont("Arial", 24)
-
-        title = font_large.render("SNAKE", True, (100, 255, 100))
-        subtitle = font_subtitle.render(
-            "A Modern Python Implementation", True, (200, 200, 255)
-        )
+        title = render_text("SNAKE", 72, (100, 255, 100), bold=True)
+        subtitle = render_text("A Modern Python Implementation", 24, (200, 200, 255))
 
         title_pos = (
             self.screen_width // 2 - title.get_width() // 2,
@@ -235,7 +242,7 @@ class MenuScreen(Screen):
         )
 
         # Draw shadow for title
-        shadow_title = font_large.render("SNAKE", True, (0, 100, 0))
+        shadow_title = render_text("SNAKE", 72, (0, 100, 0), bold=True)
         surface.blit(shadow_title, (title_pos[0] + 4, title_pos[1] + 4))
         surface.blit(title, title_pos)
         surface.blit(subtitle, subtitle_pos)
@@ -249,7 +256,7 @@ class MenuScreen(Screen):
 
         # Display IP Address Input Field if active or always for visibility
         ip_text_prompt = "Server IP:"
-        ip_render_text = self.font_small.render(f"{ip_text_prompt} {self.ip_address_str}", True, (200, 200, 255))
+        ip_render_text = render_text(f"{ip_text_prompt} {self.ip_address_str}", 24, (200, 200, 255))
         
         # Position for IP input text (e.g., below Join Game button)
         ip_text_pos_x = self.join_game_button.rect.x
@@ -259,9 +266,9 @@ class MenuScreen(Screen):
 
         if self.ip_input_active:
             # Draw a simple cursor or highlight for the input field
-            cursor_x = ip_text_pos_x + self.font_small.size(f"{ip_text_prompt} {self.ip_address_str}")[0] + 2
+            cursor_x = ip_text_pos_x + ip_render_text.get_width() + 2
             cursor_y = ip_text_pos_y
-            pygame.draw.line(surface, (200, 200, 255), (cursor_x, cursor_y), (cursor_x, cursor_y + self.font_small.get_height()), 2)
+            pygame.draw.line(surface, (200, 200, 255), (cursor_x, cursor_y), (cursor_x, cursor_y + ip_render_text.get_height()), 2)
 
 
 class GameScreen(Screen):
@@ -279,15 +286,37 @@ class GameScreen(Screen):
         # Initialize UI components
         self.score_display = ScoreDisplay(10, 10)
         self.particles = ParticleSystem(screen_width, screen_height)
-        self.font_status = pygame.font.SysFont("Arial", 20)
         self.status_message = "" # For messages like "Connecting...", "Waiting for player..."
 
         # Game state
         self.paused = False
+        self.pause_overlay = None # Composed when the game is paused, dropped on resume
         # self.game_over is now primarily driven by self.game.is_game_over
 
+        # Fraction of the current game tick elapsed, used to interpolate rendering
+        self.interpolation_alpha = 1.0
+
+        # Areas the HUD drew over the game last frame, restored by dirty-rect rendering
+        self.hud_rects = []
+        self.full_redraw_needed = True
+
+        # Network diagnostics overlay, toggled with F3
+        self.show_net_stats = False
+
+    def set_quality(self, quality):
+        """Drop particles, the food pulse and interpolation when frames run over budget"""
+        self.particles.set_max_particles(None if quality.get("particles", True) else REDUCED_PARTICLE_LIMIT)
+        self.renderer.food_pulse_enabled = quality.get("food_pulse", True)
+        self.renderer.interpolation_enabled = quality.get("interpolation", True)
+
     def set_gps(self, gps): # Remains for classic mode
         self.gps = gps
+        if self.game:
+            self.game.tick_rate = gps # Clients estimate the server tick from it
+
+    def set_interpolation_alpha(self, alpha):
+        """Set how far rendering is between the previous and the current game tick"""
+        self.interpolation_alpha = max(0.0, min(1.0, alpha))
     
     def set_status_message(self, message):
         self.status_message = message
@@ -310,6 +339,8 @@ class GameScreen(Screen):
                 
                 if event.key == pygame.K_p: # Pause should be local
                     self.paused = not self.paused
+                elif event.key == pygame.K_F3:
+                    self.show_net_stats = not self.show_net_stats
                 elif event.key == pygame.K_r and self.game_over:
                     # Reset in networked game is complex. Server should initiate.
                     # For now, this might only work well in single player or if server handles 'r'
@@ -356,47 +387,136 @@ class GameScreen(Screen):
             # Potentially render a "Loading..." or error message if game is None
             return
 
+        if not self.paused:
+            self.renderer.update_animations()
+
         # Render game elements using the renderer.
         # render_game now uses render_snakes internally.
-        self.renderer.render_game(surface, self.game) 
+        alpha = 1.0 if self.paused else self.interpolation_alpha
+        self.renderer.render_game(surface, self.game, alpha)
+        self.hud_rects = self._render_hud(surface)
+            
+        # Display pause message if the game is paused
+        if self.paused and not self.game.is_game_over:
+            if self.pause_overlay is None:
+                self.pause_overlay = self._create_pause_overlay()
+            surface.blit(self.pause_overlay, (0, 0))
+            self.renderer.invalidate() # The overlay dims everything
+        else:
+            self.pause_overlay = None
 
+        self.full_redraw_needed = False
+        
+        # Game over message is handled by renderer.render_game_over if self.game.is_game_over is true.
+
+    def _create_pause_overlay(self):
+        """Compose the dimmed background and PAUSED text into one surface"""
+        overlay = create_surface((self.screen_width, self.screen_height), alpha=True)
+        overlay.fill((0, 0, 0, 128))
+        paused_text_surf = render_text("PAUSED", 48, (255, 255, 255), bold=True)
+        text_rect = paused_text_surf.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
+        shadow_pause = render_text("PAUSED", 48, (50, 50, 50), bold=True)
+        shadow_rect = shadow_pause.get_rect(center=(self.screen_width // 2 + 2, self.screen_height // 2 + 2))
+        overlay.blit(shadow_pause, shadow_rect)
+        overlay.blit(paused_text_surf, text_rect)
+        return prepare_surface(overlay, rle=False) # Translucent everywhere, nothing to skip
+
+    def invalidate(self):
+        """Make the next render_dirty() redraw the whole screen, e.g. after a screen switch"""
+        self.full_redraw_needed = True
+
+    def render_dirty(self, surface):
+        """
+        Render the game screen onto a surface that still holds the previous frame,
+        redrawing only what changed
+
+        Returns:
+            list: Changed pygame.Rect areas, for pygame.display.update()
+        """
+        if not self.game:
+            return []
+        if self.full_redraw_needed or self.paused or self.game.is_game_over:
+            self.render(surface)
+            return [surface.get_rect()]
+
+        self.renderer.update_animations()
+        rects = self.renderer.render_game_dirty(surface, self.game, self.interpolation_alpha, restore=self.hud_rects)
+        self.hud_rects = self._render_hud(surface)
+        return rects + self.hud_rects
+
+    def _render_hud(self, surface):
+        """Draw score, particles and text over the game, returning the rects drawn over"""
         # Render score
-        self.score_display.draw(surface, self.game.score)
+        rects = [self.score_display.draw(surface, self.game.score)]
 
         # Render particles
-        self.particles.draw(surface)
+        rects.extend(self.particles.draw(surface))
 
         # Display role and local player ID
         role_text = "Host" if self.game.is_server else "Client"
         player_id_text = f"Player ID: {self.game.local_player_id}"
         
-        role_surface = self.font_status.render(role_text, True, (220, 220, 255))
-        pid_surface = self.font_status.render(player_id_text, True, (220, 220, 255))
+        role_surface = render_text(role_text, 20, (220, 220, 255))
+        pid_surface = render_text(player_id_text, 20, (220, 220, 255))
         
-        surface.blit(role_surface, (self.screen_width - role_surface.get_width() - 10, 10))
-        surface.blit(pid_surface, (self.screen_width - pid_surface.get_width() - 10, 35))
+        rects.append(surface.blit(role_surface, (self.screen_width - role_surface.get_width() - 10, 10)))
+        rects.append(surface.blit(pid_surface, (self.screen_width - pid_surface.get_width() - 10, 35)))
 
         # Display status message (e.g., "Connecting...", "Waiting for player...")
         if self.status_message:
-            status_surface = self.font_status.render(self.status_message, True, (255, 255, 100))
+            status_surface = render_text(self.status_message, 20, (255, 255, 100))
             status_pos_x = self.screen_width // 2 - status_surface.get_width() // 2
             status_pos_y = 10 # Display at the top-center
-            surface.blit(status_surface, (status_pos_x, status_pos_y))
-            
-        # Display pause message if the game is paused
-        if self.paused and not self.game.is_game_over:
-            font_pause = pygame.font.SysFont("Arial", 48, bold=True)
-            paused_text_surf = font_pause.render("PAUSED", True, (255, 255, 255))
-            text_rect = paused_text_surf.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
-            overlay = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 128))
-            surface.blit(overlay, (0, 0))
-            shadow_pause = font_pause.render("PAUSED", True, (50, 50, 50))
-            shadow_rect = shadow_pause.get_rect(center=(self.screen_width // 2 + 2, self.screen_height // 2 + 2))
-            surface.blit(shadow_pause, shadow_rect)
-            surface.blit(paused_text_surf, text_rect)
-        
-        # Game over message is handled by renderer.render_game_over if self.game.is_game_over is true.
+            rects.append(surface.blit(status_surface, (status_pos_x, status_pos_y)))
+
+        if self.show_net_stats:
+            rects.append(self._render_net_stats(surface))
+        return rects
+
+    def get_net_stats_lines(self):
+        """Format the connection stats of the current game for the overlay"""
+        def ms(value):
+            return "-" if value is None else f"{value:.0f} ms"
+
+        if self.game.client_instance:
+            stats = self.game.client_instance.get_stats()
+            header = ["Net: client", f"RTT {ms(stats['rtt_ms'])}  snapshot age {ms(stats['snapshot_age_ms'])}"]
+        elif self.game.server_instance:
+            server = self.game.server_instance
+            stats = server.get_connection_stats()
+            header = [f"Net: host, {stats['connected']} clients, {stats['reaped']} reaped"]
+            # RTT is only known per connection, as reported by each client
+            for client_id in list(server.client_sockets):
+                client_stats = server.get_client_stats(client_id)
+                if client_stats:
+                    header.append(f"{client_id} RTT {ms(client_stats['rtt_ms'])}  queue {client_stats['queue_depth']}")
+        else:
+            return ["Net: offline"]
+
+        return header + [
+            f"in  {stats['receive_rate'] / 1024.0:6.1f} KiB/s  {stats['messages_received']} msgs",
+            f"out {stats['send_rate'] / 1024.0:6.1f} KiB/s  {stats['messages_sent']} msgs",
+            f"encode {stats['encode_ms']:.3f} ms  decode {stats['decode_ms']:.3f} ms",
+            f"send queue {stats['queue_depth']} (max {stats['max_queue_depth']})",
+        ]
+
+    def _render_net_stats(self, surface):
+        """Draw the network diagnostics overlay in the bottom-left corner"""
+        lines = self.get_net_stats_lines()
+        font = get_font("Consolas", 14)
+        line_height = font.get_linesize()
+        width = max(font.size(line)[0] for line in lines) + 12
+        height = line_height * len(lines) + 8
+        top = self.screen_height - height - 10
+
+        background = pygame.Surface((width, height), pygame.SRCALPHA)
+        background.fill((0, 0, 0, 160))
+        rect = surface.blit(background, (10, top))
+        for i, line in enumerate(lines):
+            # Rendered directly: the numbers change every frame and would only churn the text cache
+            text_surface = font.render(line, True, (180, 255, 180))
+            surface.blit(text_surface, (16, top + 4 + i * line_height))
+        return rect
 
 
 class OptionsScreen(Screen):
@@ -414,8 +534,7 @@ class OptionsScreen(Screen):
 
     def render(self, surface):
         surface.fill((30, 30, 60))
-        font = pygame.font.SysFont("Arial", 48, bold=True)
-        options_text = font.render("OPTIONS", True, (255, 255, 255))
+        options_text = render_text("OPTIONS", 48, (255, 255, 255), bold=True)
         text_rect = options_text.get_rect(
             center=(self.screen_width // 2, self.screen_height // 2)
         )
@@ -430,10 +549,24 @@ class ScreenManager:
         self.screen_height = screen_height
         self.screens = {}
         self.current_screen = None
+        self.quality = None # Visual quality given to every screen, None for full quality
 
     def add_screen(self, name, screen):
         """Add a screen to the manager"""
         self.screens[name] = screen
+        if self.quality is not None:
+            screen.set_quality(self.quality)
+
+    def set_quality(self, quality):
+        """
+        Apply visual quality settings to all screens, including ones added later
+
+        Args:
+            quality: {feature: enabled}, see ui.frame_budget.FrameBudget.quality
+        """
+        self.quality = quality
+        for screen in self.screens.values():
+            screen.set_quality(quality)
 
     def set_current_screen(self, name):
         """Change the current active screen"""
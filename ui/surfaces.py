@@ -0,0 +1,56 @@
+import pygame
+
+
+def display_ready():
+    """
+    Check whether a display mode is set, which convert() and convert_alpha() need
+
+    Returns:
+        bool: True if cached art can be converted to the display format
+    """
+    return pygame.display.get_init() and pygame.display.get_surface() is not None
+
+
+def create_surface(size, alpha=False):
+    """
+    Create a blank surface to draw cached art on
+
+    Args:
+        size: (width, height)
+        alpha: Whether the surface needs per-pixel alpha
+
+    Returns:
+        pygame.Surface: Transparent if alpha, otherwise black
+    """
+    return pygame.Surface(size, pygame.SRCALPHA if alpha else 0)
+
+
+def prepare_surface(surface, alpha=True, rle=True):
+    """
+    Convert finished art to the display's pixel format so blits do not convert
+    pixels every frame. Static art is also RLE-accelerated, which skips fully
+    transparent (or colorkeyed) runs when blitting but makes drawing onto the
+    result slow, so only use it on surfaces that are not drawn on again.
+
+    Before a display mode is set the surface is returned unchanged.
+
+    Args:
+        surface: Finished surface
+        alpha: Whether to keep per-pixel alpha
+        rle: Whether to RLE-accelerate transparent or colorkeyed pixels
+
+    Returns:
+        pygame.Surface: Display-format surface (a new one), or the input surface
+    """
+    if not display_ready():
+        return surface
+    if alpha:
+        converted = surface.convert_alpha()
+        if rle:
+            converted.set_alpha(255, pygame.RLEACCEL)
+    else:
+        converted = surface.convert()
+        colorkey = surface.get_colorkey()
+        if rle and colorkey is not None:
+            converted.set_colorkey(colorkey, pygame.RLEACCEL)
+    return converted
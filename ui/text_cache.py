@@ -0,0 +1,111 @@
+import pygame
+from collections import OrderedDict
+from ui.surfaces import prepare_surface
+
+MAX_CACHED_TEXT = 256 # Rendered text surfaces kept before the least recently used is dropped
+
+# {(name, size, bold): pygame.font.Font}, shared by every screen and component
+_fonts = {}
+
+
+def _clear_on_quit():
+    """Forget fonts and text when pygame quits; their SDL handles die with it."""
+    _fonts.clear()
+    text_cache.clear()
+
+
+def get_font(name, size, bold=False):
+    """
+    Get a font from the shared registry, loading it on first use
+
+    Args:
+        name: System font name, or None for pygame's default font
+        size: Point size
+        bold: Whether to use the bold variant
+
+    Returns:
+        pygame.font.Font: Font object
+    """
+    if not pygame.font.get_init():
+        _fonts.clear()
+        text_cache.clear()
+        pygame.font.init()
+    key = (name, size, bold)
+    font = _fonts.get(key)
+    if font is None:
+        if not _fonts:
+            # pygame runs quit callbacks once, so register again each time the registry fills
+            pygame.register_quit(_clear_on_quit)
+        if name is None:
+            font = pygame.font.Font(None, size)
+            font.set_bold(bold)
+        else:
+            font = pygame.font.SysFont(name, size, bold=bold)
+        _fonts[key] = font
+    return font
+
+
+class TextCache:
+    """
+    Bounded LRU cache of rendered text surfaces keyed by (font, size, bold, text,
+    color), so text that does not change costs a blit instead of a rasterization.
+    """
+
+    def __init__(self, max_entries=MAX_CACHED_TEXT):
+        """
+        Args:
+            max_entries: Number of surfaces to keep
+        """
+        self.max_entries = max_entries
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.surfaces)
+
+    def render(self, text, size, color, font_name="Arial", bold=False, antialias=True):
+        """
+        Get a rendered text surface
+
+        Args:
+            text: String to render
+            size: Point size
+            color: RGB text color
+            font_name: System font name, or None for pygame's default font
+            bold: Whether to use the bold variant
+            antialias: Whether to antialias the glyphs
+
+        Returns:
+            pygame.Surface: Rendered text, shared; do not draw onto it
+        """
+        key = (font_name, size, bold, text, tuple(color), antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+        self.misses += 1
+        surface = prepare_surface(get_font(font_name, size, bold).render(text, antialias, color))
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self.surfaces.clear()
+
+    def get_stats(self):
+        """
+        Returns:
+            dict: Cached surface count, hits and misses
+        """
+        return {'entries': len(self.surfaces), 'hits': self.hits, 'misses': self.misses}
+
+
+text_cache = TextCache()
+
+
+def render_text(text, size, color, font_name="Arial", bold=False, antialias=True):
+    """ Render text through the shared cache. See TextCache.render. """
+    return text_cache.render(text, size, color, font_name, bold, antialias)